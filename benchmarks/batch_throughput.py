@@ -0,0 +1,84 @@
+"""
+Throughput benchmark for batch generation.
+
+Generates the same batch with 1, 2, 4, ... worker processes and reports
+workflows per second for each run.
+
+Usage:
+    python benchmarks/batch_throughput.py [--count 2000] [--max-workers 8]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from gha_generator.batch import BatchJob  # noqa: E402
+from gha_generator.parallel import generate_parallel  # noqa: E402
+
+TEMPLATES = ["data-science", "django-api", "laravel-api", "react-app"]
+
+
+def build_jobs(count: int, output_root: Path) -> list[BatchJob]:
+    """Build a synthetic batch of jobs cycling through all templates."""
+    return [
+        BatchJob(
+            template=TEMPLATES[i % len(TEMPLATES)],
+            variables={
+                "project_name": f"service-{i}",
+                "python_version": "3.11",
+                "php_version": "8.2",
+                "node_version": "18",
+            },
+            output=output_root / f"repo-{i}" / ".github" / "workflows",
+        )
+        for i in range(count)
+    ]
+
+
+def run(count: int, workers: int) -> float:
+    """Run one batch and return the elapsed time in seconds."""
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs = build_jobs(count, Path(tmp))
+        start = time.perf_counter()
+        failed = sum(1 for result in generate_parallel(jobs, workers) if not result.success)
+        elapsed = time.perf_counter() - start
+
+    if failed:
+        raise RuntimeError(f"{failed} job(s) failed")
+    return elapsed
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=2000, help="Number of workflows")
+    parser.add_argument(
+        "--max-workers", type=int, default=os.cpu_count() or 1, help="Largest pool size"
+    )
+    args = parser.parse_args()
+
+    worker_counts = []
+    workers = 1
+    while workers < args.max_workers:
+        worker_counts.append(workers)
+        workers *= 2
+    worker_counts.append(args.max_workers)
+
+    baseline = None
+    print(f"{'workers':>8} {'seconds':>9} {'wf/s':>9} {'speedup':>8}")
+    for workers in worker_counts:
+        elapsed = run(args.count, workers)
+        baseline = baseline or elapsed
+        print(
+            f"{workers:>8} {elapsed:>9.2f} "
+            f"{args.count / elapsed:>9.0f} {baseline / elapsed:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -12,18 +12,38 @@ __version__ = "0.1.0"
 __author__ = "GitHub Actions Generator Team"
 __license__ = "MIT"
 
-from .generator import WorkflowGenerator
-from .utils import (
-    check_github_folder,
-    create_directory_safe,
-    get_template_path,
-    validate_yaml,
-)
+# Public names are resolved on first access so that light commands
+# (``--version``, ``list-templates``) do not pay for Jinja2 or PyYAML.
+_LAZY_IMPORTS = {
+    "WorkflowGenerator": ".generator",
+    "TemplateRegistry": ".registry",
+    "check_github_folder": ".utils",
+    "create_directory_safe": ".utils",
+    "validate_yaml": ".utils",
+    "get_template_path": ".utils",
+}
 
 __all__ = [
     "WorkflowGenerator",
+    "TemplateRegistry",
     "check_github_folder",
     "create_directory_safe",
     "validate_yaml",
     "get_template_path",
 ]
+
+
+def __getattr__(name: str):
+    """Import public names lazily on first access."""
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily imported names."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,516 @@
+"""
+Workflow job graph analysis module.
+
+This module turns a workflow (generated or hand-written) into a graph of
+jobs linked by ``needs:``, reports cycles and needs naming missing jobs,
+and computes the critical path (the wall-clock floor with unlimited
+runners) and the largest number of jobs running at once.
+
+Job durations are estimated from their steps with a few heuristics
+(installing, testing, building, linting...) unless measured durations
+are given. Optionally, steps that nothing else depends on (lint, audit)
+are suggested for a parallel job when that shortens the critical path.
+"""
+
+import math
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Estimated seconds per step, first matching rule wins: (kind, pattern on
+# ``uses``, pattern on ``run``, seconds)
+STEP_ESTIMATES = (
+    ("checkout", r"^actions/checkout@", None, 5),
+    ("cache", r"^actions/cache(/\w+)?@", None, 10),
+    ("setup", r"(^actions/setup-|/setup-\w+@)", None, 20),
+    ("upload", r"(upload-artifact|codecov-action)@", None, 10),
+    (
+        "install",
+        None,
+        r"\b(pip3? install|npm (ci|install)|composer (install|update)|yarn install)\b",
+        60,
+    ),
+    (
+        "lint",
+        None,
+        r"\b(ruff|black|flake8|eslint|prettier|phpcs|phpstan|lint|format:check|type-check)\b",
+        20,
+    ),
+    ("audit", None, r"\b(audit|security|check --deploy)\b", 15),
+    (
+        "test",
+        None,
+        r"\b(pytest|phpunit|jest|coverage run|manage\.py test|artisan test|npm (run )?test)\b",
+        120,
+    ),
+    ("build", None, r"\b(build|collectstatic|nbconvert)\b", 90),
+)
+
+# Default estimates for steps matching no rule
+DEFAULT_RUN_SECONDS = 10
+DEFAULT_USES_SECONDS = 15
+
+# Extra time for a job starting service containers
+SERVICE_STARTUP_SECONDS = 15
+
+# Step kinds whose results no later step consumes
+DETACHABLE_KINDS = frozenset({"lint", "audit"})
+
+# Step kinds every split-off job needs again
+PREPARATION_KINDS = frozenset({"checkout", "cache", "setup", "install"})
+
+
+@dataclass
+class StepInfo:
+    """A job step and its estimated duration."""
+
+    name: str
+    kind: str
+    duration: float
+    detachable: bool = False
+
+
+@dataclass
+class JobNode:
+    """A job of the workflow graph."""
+
+    name: str
+    needs: list[str]
+    steps: list[StepInfo]
+    duration: float
+    instances: int = 1
+    max_parallel: int = 1
+    runs_on: str = ""
+
+    @property
+    def span(self) -> float:
+        """Wall-clock time of the job, matrix batches included."""
+        return self.duration * math.ceil(self.instances / self.max_parallel)
+
+
+@dataclass
+class GraphReport:
+    """Result of analyzing a workflow job graph."""
+
+    jobs: dict[str, JobNode]
+    triggers: list[str] = field(default_factory=list)
+    cycles: list[list[str]] = field(default_factory=list)
+    dangling: list[tuple[str, str]] = field(default_factory=list)
+    critical_path: list[str] = field(default_factory=list)
+    critical_duration: float = 0.0
+    width: int = 0
+    schedule: dict[str, tuple[float, float]] = field(default_factory=dict)
+    suggestions: list[str] = field(default_factory=list)
+
+    @property
+    def edges(self) -> int:
+        """Number of ``needs`` links between existing jobs."""
+        return sum(1 for job in self.jobs.values() for need in job.needs if need in self.jobs)
+
+    @property
+    def is_valid(self) -> bool:
+        """True if the graph has neither cycles nor dangling needs."""
+        return not self.cycles and not self.dangling
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Format a duration for display.
+
+    Args:
+        seconds: Duration in seconds
+
+    Returns:
+        String such as ``4m 05s`` or ``45s``
+    """
+    minutes, seconds = divmod(round(seconds), 60)
+    return f"{minutes}m {seconds:02d}s" if minutes else f"{seconds}s"
+
+
+def load_workflow(path: Path) -> dict[str, Any]:
+    """
+    Load a workflow file.
+
+    YAML 1.1 reads the ``on`` key as True; it is restored to ``on``.
+
+    Args:
+        path: Workflow file
+
+    Returns:
+        Workflow mapping
+
+    Raises:
+        ValueError: If the file is not a YAML mapping
+    """
+    import yaml
+
+    from .yaml_backend import safe_load
+
+    try:
+        workflow = safe_load(path.read_text(encoding="utf-8"))
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML syntax: {str(e)}") from None
+
+    if not isinstance(workflow, dict):
+        raise ValueError(f"{path} is not a workflow: expected a mapping")
+
+    return {"on" if key is True else key: value for key, value in workflow.items()}
+
+
+def estimate_step(step: dict[str, Any]) -> StepInfo:
+    """
+    Classify a step and estimate its duration.
+
+    Args:
+        step: Step mapping
+
+    Returns:
+        StepInfo for the step
+    """
+    uses = str(step.get("uses") or "")
+    run = str(step.get("run") or "")
+    name = step.get("name") or uses or next(iter(run.strip().splitlines()), "step")
+
+    kind, seconds = next(
+        (
+            (rule_kind, rule_seconds)
+            for rule_kind, uses_pattern, run_pattern, rule_seconds in STEP_ESTIMATES
+            if (uses_pattern and uses and re.search(uses_pattern, uses))
+            or (run_pattern and run and re.search(run_pattern, run))
+        ),
+        ("run", DEFAULT_RUN_SECONDS) if run else ("uses", DEFAULT_USES_SECONDS),
+    )
+
+    # A step whose output or outcome is read elsewhere must stay in place
+    detachable = (
+        kind in DETACHABLE_KINDS and bool(step.get("continue-on-error")) and "id" not in step
+    )
+    return StepInfo(str(name), kind, float(seconds), detachable)
+
+
+def _matrix_shape(strategy: Any) -> tuple[int, int]:
+    """Return the number of matrix jobs and how many run at once."""
+    from .matrix import MatrixPlan
+
+    if not isinstance(strategy, dict) or not isinstance(strategy.get("matrix"), dict):
+        return 1, 1
+
+    matrix = strategy["matrix"]
+    axes = {
+        key: values
+        for key, values in matrix.items()
+        if key not in ("include", "exclude") and isinstance(values, list)
+    }
+    include = [entry for entry in matrix.get("include") or [] if isinstance(entry, dict)]
+    exclude = [entry for entry in matrix.get("exclude") or [] if isinstance(entry, dict)]
+
+    if axes or include:
+        plan = MatrixPlan(axes=axes, include=include, exclude=exclude)
+        # An include-only matrix has no product to extend
+        instances = len(plan.combinations()) if axes else len(include)
+    else:
+        # e.g. ``matrix: ${{ fromJSON(...) }}``, unknown until run time
+        instances = 1
+    instances = max(instances, 1)
+
+    max_parallel = strategy.get("max-parallel")
+    if not isinstance(max_parallel, int) or max_parallel < 1:
+        max_parallel = instances
+
+    return instances, min(max_parallel, instances)
+
+
+def build_graph(workflow: dict[str, Any], durations: dict[str, float] = None) -> dict[str, JobNode]:
+    """
+    Build the job graph of a workflow.
+
+    Args:
+        workflow: Workflow mapping (see load_workflow())
+        durations: Measured seconds per job, replacing the estimates
+
+    Returns:
+        Jobs keyed by name, in workflow order
+
+    Raises:
+        ValueError: If the workflow has no jobs mapping, or a job's needs
+            is not a job name or a list of job names
+    """
+    jobs = workflow.get("jobs")
+    if not isinstance(jobs, dict) or not jobs:
+        raise ValueError("Workflow has no jobs")
+
+    durations = durations or {}
+    graph = {}
+
+    for name, job in jobs.items():
+        name = str(name)
+        job = job if isinstance(job, dict) else {}
+
+        needs = job.get("needs") or []
+        if isinstance(needs, str):
+            needs = [needs]
+        if not isinstance(needs, list) or not all(isinstance(need, str) for need in needs):
+            raise ValueError(
+                f"Job '{name}': needs must be a job name or a list of job names, "
+                f"got {job['needs']!r}"
+            )
+
+        raw_steps = job.get("steps") if isinstance(job.get("steps"), list) else []
+        steps = [estimate_step(step) for step in raw_steps if isinstance(step, dict)]
+
+        if name in durations:
+            duration = float(durations[name])
+        else:
+            duration = sum(step.duration for step in steps)
+            if job.get("services"):
+                duration += SERVICE_STARTUP_SECONDS
+            if "uses" in job:
+                # Reusable workflow: nothing to look into
+                duration = duration or DEFAULT_USES_SECONDS
+
+        instances, max_parallel = _matrix_shape(job.get("strategy"))
+        runs_on = job.get("runs-on", "")
+        graph[name] = JobNode(
+            name=name,
+            needs=needs,
+            steps=steps,
+            duration=duration,
+            instances=instances,
+            max_parallel=max_parallel,
+            runs_on=runs_on if isinstance(runs_on, str) else ",".join(map(str, runs_on)),
+        )
+
+    return graph
+
+
+def find_cycles(graph: dict[str, JobNode]) -> list[list[str]]:
+    """
+    Find the dependency cycles of a job graph.
+
+    Args:
+        graph: Jobs keyed by name
+
+    Returns:
+        One list of job names per cycle, starting and ending with the
+        same job (e.g. ``["a", "b", "a"]``)
+    """
+    visiting, done = set(), set()
+    stack: list[str] = []
+    cycles, seen = [], set()
+
+    def visit(name: str) -> None:
+        visiting.add(name)
+        stack.append(name)
+        for need in graph[name].needs:
+            if need not in graph:
+                continue
+            if need in visiting:
+                cycle = stack[stack.index(need) :]
+                if frozenset(cycle) not in seen:
+                    seen.add(frozenset(cycle))
+                    cycles.append([*cycle, need])
+            elif need not in done:
+                visit(need)
+        stack.pop()
+        visiting.discard(name)
+        done.add(name)
+
+    for name in graph:
+        if name not in done:
+            visit(name)
+
+    return cycles
+
+
+def topological_order(graph: dict[str, JobNode]) -> list[str]:
+    """
+    Order jobs so that each comes after the jobs it needs.
+
+    Jobs in a cycle, or needing one, are left out; needs naming missing
+    jobs are ignored.
+
+    Args:
+        graph: Jobs keyed by name
+
+    Returns:
+        Job names in dependency order (workflow order among ready jobs)
+    """
+    pending = {name: {need for need in job.needs if need in graph} for name, job in graph.items()}
+    order = []
+
+    ready = [name for name, needs in pending.items() if not needs]
+    while ready:
+        name = ready.pop(0)
+        order.append(name)
+        for other, needs in pending.items():
+            if name in needs:
+                needs.discard(name)
+                if not needs:
+                    ready.append(other)
+
+    return order
+
+
+def _schedule(graph: dict[str, JobNode], order: list[str]) -> dict[str, tuple[float, float]]:
+    """Start and finish time of each job with unlimited runners."""
+    schedule: dict[str, tuple[float, float]] = {}
+    for name in order:
+        job = graph[name]
+        start = max((schedule[need][1] for need in job.needs if need in schedule), default=0.0)
+        schedule[name] = (start, start + job.span)
+    return schedule
+
+
+def _max_width(graph: dict[str, JobNode], schedule: dict[str, tuple[float, float]]) -> int:
+    """Largest number of job instances running at the same time."""
+    events = []
+    for name, (start, finish) in schedule.items():
+        if finish > start:
+            events.append((start, graph[name].max_parallel))
+            events.append((finish, -graph[name].max_parallel))
+        else:
+            events.append((start, 0))
+
+    width = running = 0
+    # Jobs finishing at an instant free their runner before others start
+    for _, delta in sorted(events, key=lambda event: (event[0], event[1])):
+        running += delta
+        width = max(width, running)
+
+    return width
+
+
+def _critical_path(
+    graph: dict[str, JobNode], schedule: dict[str, tuple[float, float]]
+) -> list[str]:
+    """Follow the latest-finishing need back from the last job to finish."""
+    if not schedule:
+        return []
+
+    name = max(schedule, key=lambda job: schedule[job][1])
+    path = [name]
+    while True:
+        needs = [need for need in graph[name].needs if need in schedule]
+        if not needs:
+            break
+        name = max(needs, key=lambda need: schedule[need][1])
+        path.append(name)
+
+    return path[::-1]
+
+
+def suggest_splits(graph: dict[str, JobNode], critical_path: Iterable[str]) -> list[str]:
+    """
+    Suggest moving independent steps out of critical jobs.
+
+    Lint and audit steps that are allowed to fail and whose result no
+    other step reads can run in a parallel job that repeats the job's
+    preparation steps (checkout, setup, cache, install). A move is only
+    suggested when it shortens the job.
+
+    Args:
+        graph: Jobs keyed by name
+        critical_path: Jobs on the critical path
+
+    Returns:
+        Human-readable suggestions
+    """
+    suggestions = []
+
+    for name in critical_path:
+        job = graph[name]
+        detached = [step for step in job.steps if step.detachable]
+        if not detached:
+            continue
+
+        preparation = sum(step.duration for step in job.steps if step.kind in PREPARATION_KINDS)
+        moved = sum(step.duration for step in detached)
+        remaining = job.duration - moved
+        gain = job.duration - max(remaining, preparation + moved)
+        if gain <= 0:
+            continue
+
+        gain *= math.ceil(job.instances / job.max_parallel)
+        names = ", ".join(step.name for step in detached)
+        suggestions.append(
+            f"Job '{name}': move {len(detached)} step(s) ({names}) to a parallel job "
+            f"needing the same setup, saving about {format_duration(gain)}"
+        )
+
+    return suggestions
+
+
+def analyze_workflow(
+    workflow: dict[str, Any],
+    durations: dict[str, float] = None,
+    suggest: bool = False,
+) -> GraphReport:
+    """
+    Analyze the job graph of a workflow.
+
+    Args:
+        workflow: Workflow mapping (see load_workflow())
+        durations: Measured seconds per job, replacing the estimates
+        suggest: Also suggest moving steps to parallel jobs
+
+    Returns:
+        GraphReport
+
+    Raises:
+        ValueError: If the workflow has no jobs mapping
+    """
+    graph = build_graph(workflow, durations)
+
+    triggers = workflow.get("on", [])
+    if isinstance(triggers, dict):
+        triggers = list(triggers)
+    elif isinstance(triggers, str):
+        triggers = [triggers]
+
+    report = GraphReport(jobs=graph, triggers=[str(trigger) for trigger in triggers or []])
+    report.cycles = find_cycles(graph)
+    report.dangling = [
+        (name, need) for name, job in graph.items() for need in job.needs if need not in graph
+    ]
+
+    report.schedule = _schedule(graph, topological_order(graph))
+    report.width = _max_width(graph, report.schedule)
+    report.critical_path = _critical_path(graph, report.schedule)
+    if report.critical_path:
+        report.critical_duration = report.schedule[report.critical_path[-1]][1]
+
+    if suggest:
+        report.suggestions = suggest_splits(graph, report.critical_path)
+
+    return report
+
+
+def load_durations(path: Path) -> dict[str, float]:
+    """
+    Load measured job durations.
+
+    Args:
+        path: JSON file mapping job names to seconds
+
+    Returns:
+        Seconds per job name
+
+    Raises:
+        ValueError: If the file is not a mapping of numbers
+    """
+    import json
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError as e:
+        raise ValueError(f"Invalid durations file {path}: {str(e)}") from None
+
+    if not isinstance(data, dict) or not all(
+        isinstance(value, int | float) and not isinstance(value, bool) and value >= 0
+        for value in data.values()
+    ):
+        raise ValueError(f"Invalid durations file {path}: expected job names mapped to seconds")
+
+    return {str(name): float(value) for name, value in data.items()}
@@ -0,0 +1,248 @@
+"""
+Asyncio workflow generator module.
+
+This module provides AsyncWorkflowGenerator for embedding the generator
+in asyncio services. Templates are rendered with Jinja2's native async
+rendering, while template loading, YAML validation and file I/O run in
+a bounded thread pool so they never block the event loop.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, TypeVar
+
+from jinja2 import Template
+
+from .batch import DEFAULT_FILENAME, BatchJob, BatchResult
+from .generator import WorkflowGenerator
+
+T = TypeVar("T")
+
+
+class AsyncWorkflowGenerator(WorkflowGenerator):
+    """
+    Asyncio generator class for creating GitHub Actions workflows.
+
+    At most ``max_concurrency`` generate calls run at once; further calls
+    wait for a slot, which applies backpressure to callers.
+    """
+
+    enable_async = True
+
+    def __init__(self, max_workers: int = 4, max_concurrency: int = None, **generator_options):
+        """
+        Initialize the async workflow generator.
+
+        Args:
+            max_workers: Size of the thread pool for blocking work
+            max_concurrency: Maximum number of concurrent generate calls
+                (default: twice max_workers)
+            **generator_options: Keyword arguments for WorkflowGenerator
+
+        Raises:
+            ValueError: If streaming is requested (the async generator
+                always renders the full workflow before writing it)
+        """
+        if generator_options.get("streaming"):
+            raise ValueError("AsyncWorkflowGenerator does not support streaming")
+
+        super().__init__(**generator_options)
+        self.max_concurrency = max_concurrency or max_workers * 2
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gha-gen")
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def __aenter__(self) -> "AsyncWorkflowGenerator":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Shut down the thread pool."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the thread pool, waiting for running work to finish."""
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking function in the thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def load_template_async(self, template_type: str) -> Template:
+        """
+        Load a template by type without blocking the event loop.
+
+        Args:
+            template_type: Type of template (e.g., 'data-science', 'django-api')
+
+        Returns:
+            Jinja2 Template object
+
+        Raises:
+            ValueError: If template type is invalid
+        """
+        return await self._run(self.load_template, template_type)
+
+    async def render_template_async(self, template: Template, variables: dict[str, Any]) -> str:
+        """
+        Render a template with Jinja2's async rendering.
+
+        Args:
+            template: Jinja2 Template object
+            variables: Dictionary of variables to inject into template
+
+        Returns:
+            Rendered template as string
+        """
+        return await template.render_async(**variables)
+
+    async def validate_output_async(self, content: str) -> tuple[bool, str]:
+        """
+        Validate generated YAML content in the thread pool.
+
+        Args:
+            content: YAML content as string
+
+        Returns:
+            Tuple of (is_valid, message)
+        """
+        return await self._run(self.validate_output, content)
+
+    async def render_validated_async(self, template: Template, variables: dict[str, Any]) -> str:
+        """
+        Render and validate a template, going through the render cache if enabled.
+
+        Args:
+            template: Jinja2 Template object
+            variables: Variables to inject into template
+
+        Returns:
+            Rendered and validated workflow content
+
+        Raises:
+            ValueError: If the variables or the rendered workflow are invalid
+        """
+        # Validators of user templates may parse the template and save the index
+        variables = await self._run(self._checked_variables, template, variables)
+
+        key = None
+        if self.render_cache is not None:
+            key = self.render_cache.make_key(
+                await self._run(self.template_digest, template.name),
+                variables,
+                self._render_options(),
+            )
+            content = await self._run(self.render_cache.get, key)
+            if content is not None:
+                return content
+
+        content = await self.render_template_async(template, variables)
+        if self.cache_dependencies:
+            content = await self._run(self.optimize_output, content)
+
+        is_valid, message = await self.validate_output_async(content)
+        if not is_valid:
+            raise ValueError(f"Generated workflow is invalid: {message}")
+
+        if key is not None:
+            await self._run(self.render_cache.put, key, content)
+
+        return content
+
+    async def write_workflow_async(self, output_path: Path, content: str, filename: str) -> Path:
+        """
+        Write workflow content to file in the thread pool.
+
+        Args:
+            output_path: Directory path where to write the file
+            content: Workflow content as string
+            filename: Name of the output file
+
+        Returns:
+            Path to the created file
+
+        Raises:
+            IOError: If file cannot be written
+        """
+        return await self._run(self.write_workflow, output_path, content, filename)
+
+    async def generate_async(
+        self,
+        template_type: str,
+        variables: dict[str, Any],
+        output_path: Path,
+        filename: str = None,
+    ) -> Path:
+        """
+        Generate a complete workflow file.
+
+        Args:
+            template_type: Type of template to use
+            variables: Variables to inject into template
+            output_path: Directory where to save the workflow
+            filename: Optional custom filename (default: ci.yml)
+
+        Returns:
+            Path to the generated workflow file
+
+        Raises:
+            ValueError: If template is invalid or variables are missing
+            IOError: If file cannot be written
+        """
+        workflow_file, _ = await self._generate(template_type, variables, output_path, filename)
+        return workflow_file
+
+    async def _generate(
+        self,
+        template_type: str,
+        variables: dict[str, Any],
+        output_path: Path,
+        filename: str = None,
+    ) -> tuple[Path, bool]:
+        """Generate a workflow file, reporting whether it was written."""
+        async with self._semaphore:
+            template = await self.load_template_async(template_type)
+            content = await self.render_validated_async(template, variables)
+            return await self._run(self._write, output_path, content, filename or DEFAULT_FILENAME)
+
+    async def _generate_job(self, index: int, job: BatchJob) -> BatchResult:
+        """Generate a batch job, capturing failures in the result."""
+        try:
+            path, changed = await self._generate(
+                job.template, job.variables, job.output, job.filename
+            )
+            return BatchResult(index=index, job=job, success=True, path=path, changed=changed)
+        except Exception as e:
+            return BatchResult(index=index, job=job, success=False, error=str(e))
+
+    async def generate_many_async(self, jobs: Iterable[BatchJob]) -> AsyncIterator[BatchResult]:
+        """
+        Generate many workflow files concurrently, yielding results in order.
+
+        At most ``max_concurrency`` jobs are in flight; the next job is only
+        started once the oldest one has been yielded, so a slow consumer
+        also slows down generation.
+
+        Args:
+            jobs: Batch jobs to generate
+
+        Yields:
+            BatchResult for each job, in input order
+        """
+        pending: deque[asyncio.Task] = deque()
+
+        try:
+            for index, job in enumerate(jobs):
+                if len(pending) >= self.max_concurrency:
+                    yield await pending.popleft()
+                pending.append(asyncio.ensure_future(self._generate_job(index, job)))
+
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,247 @@
+"""
+Batch generation module.
+
+This module describes batch generation jobs and results, and loads
+them from a YAML manifest so that many workflows (possibly several per
+repository) can be generated in a single process.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_FILENAME = "ci.yml"
+
+
+@dataclass
+class BatchJob:
+    """A single workflow to generate as part of a batch."""
+
+    template: str
+    variables: dict[str, Any]
+    output: Path
+    filename: str = DEFAULT_FILENAME
+
+
+@dataclass
+class BatchResult:
+    """Outcome of generating a single batch job."""
+
+    index: int
+    job: BatchJob
+    success: bool
+    path: Path | None = None
+    changed: bool = False
+    error: str | None = None
+
+
+# Outcomes of planning a batch job
+PLAN_NEW = "new"
+PLAN_CHANGED = "changed"
+PLAN_UNCHANGED = "unchanged"
+PLAN_FAILED = "failed"
+
+
+@dataclass
+class PlanResult:
+    """What generating a single batch job would do to its file."""
+
+    index: int
+    job: BatchJob
+    status: str
+    path: Path | None = None
+    diff: str | None = None
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        """True if the job could be rendered."""
+        return self.status != PLAN_FAILED
+
+
+def _parse_entry(entry: Any, defaults: dict[str, Any], base_dir: Path, position: int) -> BatchJob:
+    """
+    Build a BatchJob from a manifest entry.
+
+    Args:
+        entry: Raw manifest entry (mapping)
+        defaults: Manifest-level defaults
+        base_dir: Directory relative output paths are resolved against
+        position: Position of the entry in the manifest (for error messages)
+
+    Returns:
+        BatchJob for the entry
+
+    Raises:
+        ValueError: If the entry is malformed
+    """
+    if not isinstance(entry, dict):
+        raise ValueError(f"Manifest entry #{position} must be a mapping")
+
+    template = entry.get("template", defaults.get("template"))
+    if not template:
+        raise ValueError(f"Manifest entry #{position} is missing 'template'")
+
+    variables = dict(defaults.get("variables") or {})
+    variables.update(entry.get("variables") or {})
+    if "name" in entry:
+        variables["project_name"] = entry["name"]
+
+    output = entry.get("output", defaults.get("output"))
+    if not output:
+        raise ValueError(f"Manifest entry #{position} is missing 'output'")
+    output_path = _resolve_output(output, base_dir)
+
+    filename = entry.get("filename", defaults.get("filename", DEFAULT_FILENAME))
+
+    return BatchJob(
+        template=str(template),
+        variables=variables,
+        output=output_path,
+        filename=str(filename),
+    )
+
+
+def _resolve_output(output: Any, base_dir: Path) -> Path:
+    """Resolve an output path relative to the manifest directory."""
+    output_path = Path(output)
+    if not output_path.is_absolute():
+        output_path = base_dir / output_path
+    return output_path
+
+
+def _parse_repo(
+    repo: Any,
+    defaults: dict[str, Any],
+    base_dir: Path,
+    position: int,
+) -> list[BatchJob]:
+    """
+    Build the BatchJobs of a repository entry.
+
+    A repository entry gives a ``name`` (the project name), either an
+    ``output`` workflows directory or a repository ``path`` (workflows then
+    go to ``<path>/.github/workflows``), shared ``variables`` and a list of
+    ``workflows`` with ``template`` and optional ``filename`` and
+    ``variables``. When a repository has several workflows, those without
+    a filename are named after their template (``<template>-ci.yml``).
+
+    Args:
+        repo: Raw repository entry (mapping)
+        defaults: Manifest-level defaults
+        base_dir: Directory relative paths are resolved against
+        position: Position of the repository in the manifest (for error messages)
+
+    Returns:
+        BatchJobs for the repository, in manifest order
+
+    Raises:
+        ValueError: If the entry is malformed
+    """
+    from .utils import get_workflow_filename
+
+    if not isinstance(repo, dict):
+        raise ValueError(f"Repository #{position} must be a mapping")
+
+    label = repo.get("name", f"#{position}")
+
+    if "output" in repo:
+        output = _resolve_output(repo["output"], base_dir)
+    elif "path" in repo:
+        output = _resolve_output(repo["path"], base_dir) / ".github" / "workflows"
+    else:
+        raise ValueError(f"Repository {label} is missing 'output' or 'path'")
+
+    workflows = repo.get("workflows")
+    if not isinstance(workflows, list) or not workflows:
+        raise ValueError(f"Repository {label} must contain a list of workflows")
+
+    variables = dict(defaults.get("variables") or {})
+    variables.update(repo.get("variables") or {})
+    if "name" in repo:
+        variables["project_name"] = repo["name"]
+
+    jobs = []
+    for workflow_position, workflow in enumerate(workflows, start=1):
+        if not isinstance(workflow, dict) or not workflow.get("template"):
+            raise ValueError(
+                f"Workflow #{workflow_position} of repository {label} is missing 'template'"
+            )
+
+        template = str(workflow["template"])
+        if "filename" in workflow:
+            filename = str(workflow["filename"])
+        elif len(workflows) == 1:
+            filename = defaults.get("filename", DEFAULT_FILENAME)
+        else:
+            filename = get_workflow_filename(template)
+
+        jobs.append(
+            BatchJob(
+                template=template,
+                variables={**variables, **(workflow.get("variables") or {})},
+                output=output,
+                filename=filename,
+            )
+        )
+
+    return jobs
+
+
+def load_manifest(manifest_path: Path) -> list[BatchJob]:
+    """
+    Load batch jobs from a YAML manifest.
+
+    The manifest is either a list of entries or a mapping with a
+    ``workflows`` list, a ``repos`` list (several workflows per
+    repository, see _parse_repo()) and optional ``defaults``. Each
+    workflow entry accepts ``template``, ``name``, ``variables``,
+    ``output`` and ``filename``. Relative paths are resolved against the
+    manifest directory.
+
+    Args:
+        manifest_path: Path to the manifest file
+
+    Returns:
+        List of BatchJob objects in manifest order
+
+    Raises:
+        ValueError: If the manifest is malformed or two workflows target
+            the same file
+    """
+    from .yaml_backend import safe_load
+
+    with open(manifest_path, encoding="utf-8") as f:
+        data = safe_load(f)
+
+    if data is None:
+        return []
+
+    defaults: dict[str, Any] = {}
+    repos: list[Any] = []
+    if isinstance(data, dict):
+        defaults = data.get("defaults") or {}
+        entries = data.get("workflows", [] if "repos" in data else None)
+        repos = data.get("repos") or []
+    else:
+        entries = data
+
+    if not isinstance(entries, list) or not isinstance(repos, list):
+        raise ValueError("Manifest must contain a list of workflows")
+
+    base_dir = Path(manifest_path).parent
+    jobs = [
+        _parse_entry(entry, defaults, base_dir, position)
+        for position, entry in enumerate(entries, start=1)
+    ]
+    for position, repo in enumerate(repos, start=1):
+        jobs.extend(_parse_repo(repo, defaults, base_dir, position))
+
+    targets = set()
+    for job in jobs:
+        target = job.output / job.filename
+        if target in targets:
+            raise ValueError(f"Several workflows would be written to {target}")
+        targets.add(target)
+
+    return jobs
@@ -0,0 +1,226 @@
+"""
+Cache module for GitHub Actions Generator.
+
+This module provides a persistent Jinja2 bytecode cache so compiled
+templates survive between runs, and a content-addressed cache of
+rendered workflows.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import jinja2
+from jinja2.bccache import Bucket, FileSystemBytecodeCache
+
+from .utils import get_cache_dir
+
+# Size the render cache is pruned back to, least recently used first
+DEFAULT_RENDER_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    Bytecode cache keyed by template name, source hash and Jinja2 version.
+
+    Entries for an edited template or another Jinja2 release get a new
+    key, so stale bytecode is never loaded. Sync and async environments
+    compile different code and therefore use separate entries. Failures to
+    write the cache are ignored: the template is then simply compiled on
+    the next run.
+    """
+
+    def __init__(self, directory: Path):
+        """
+        Initialize the bytecode cache.
+
+        Args:
+            directory: Directory where compiled templates are stored
+        """
+        super().__init__(str(directory), "%s.jinja")
+
+    def get_bucket(self, environment, name, filename, source) -> Bucket:
+        """Return the cache bucket for a template source."""
+        checksum = self.get_source_checksum(source)
+        key = hashlib.sha1(
+            f"{jinja2.__version__}\0{environment.is_async}\0{name}\0{checksum}".encode()
+        ).hexdigest()
+        bucket = Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)
+        return bucket
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Store bytecode, ignoring an unwritable cache directory."""
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+def create_bytecode_cache(cache_dir: Path = None) -> TemplateBytecodeCache | None:
+    """
+    Create the persistent template bytecode cache.
+
+    Args:
+        cache_dir: Cache root directory (defaults to get_cache_dir())
+
+    Returns:
+        TemplateBytecodeCache, or None if the directory cannot be created
+    """
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+
+    directory = cache_dir / "bytecode"
+
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+
+    return TemplateBytecodeCache(directory)
+
+
+class RenderCache:
+    """
+    Content-addressed cache of rendered and validated workflows.
+
+    Entries are keyed by a hash of the template source (including the
+    templates it references), the normalized variables and the tool
+    version, so an unchanged input maps to the same entry across runs.
+    A hit refreshes the entry's modification time, which prune() uses to
+    evict the least recently used entries.
+    """
+
+    def __init__(self, directory: Path):
+        """
+        Initialize the render cache.
+
+        Args:
+            directory: Directory where rendered workflows are stored
+        """
+        self.directory = directory
+
+    @staticmethod
+    def make_key(template_digest: str, variables: dict[str, Any], options: str = "") -> str:
+        """
+        Build the cache key for a render.
+
+        Args:
+            template_digest: Hash of the template source and its dependencies
+            variables: Variables passed to the template
+            options: Generator options that affect the output
+
+        Returns:
+            Hex digest identifying the rendered output
+        """
+        from . import __version__
+
+        normalized = json.dumps(variables, sort_keys=True, separators=(",", ":"), default=str)
+        payload = "\0".join([__version__, template_digest, options, normalized])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file path of a cache entry."""
+        return self.directory / key[:2] / f"{key}.yml"
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a rendered workflow.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Rendered content, or None on a cache miss
+        """
+        path = self._entry_path(key)
+
+        try:
+            content = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        """
+        Store a rendered workflow, ignoring an unwritable cache directory.
+
+        Args:
+            key: Cache key from make_key()
+            content: Rendered and validated workflow content
+        """
+        path = self._entry_path(key)
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(content)
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            pass
+
+    def prune(self, max_bytes: int = DEFAULT_RENDER_CACHE_BYTES) -> int:
+        """
+        Remove the least recently used entries until the cache fits in max_bytes.
+
+        Args:
+            max_bytes: Total size of the entries to keep
+
+        Returns:
+            Number of entries removed
+        """
+        entries = []
+        try:
+            for subdir in os.scandir(self.directory):
+                if not subdir.is_dir():
+                    continue
+                for entry in os.scandir(subdir.path):
+                    if entry.name.endswith(".yml"):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except OSError:
+            return 0
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        return removed
+
+
+def create_render_cache(cache_dir: Path = None) -> RenderCache:
+    """
+    Create the rendered workflow cache.
+
+    Args:
+        cache_dir: Cache root directory (defaults to get_cache_dir())
+
+    Returns:
+        RenderCache rooted in the ``renders`` subdirectory
+    """
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+
+    return RenderCache(cache_dir / "renders")
@@ -0,0 +1,200 @@
+"""
+Generator daemon client module.
+
+This module talks to a running generator daemon (see daemon.py). It
+only depends on the standard library's HTTP client so that CLI calls
+handed to the daemon stay cheap to start.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+TOKEN_HEADER = "X-GHA-Gen-Token"
+DISABLE_ENV = "GHA_GEN_NO_DAEMON"
+
+
+def default_state_path() -> Path:
+    """
+    Get the path of the daemon state file.
+
+    Returns:
+        Path to ``daemon.json`` in the user cache directory
+    """
+    from .utils import get_cache_dir
+
+    return get_cache_dir() / "daemon.json"
+
+
+class DaemonError(Exception):
+    """Raised when the daemon reports a failed request."""
+
+
+class DaemonClient:
+    """Thin client for a running generator daemon."""
+
+    def __init__(self, host: str, port: int, token: str, timeout: float = 30.0):
+        """
+        Initialize the client.
+
+        Args:
+            host: Daemon host
+            port: Daemon port
+            token: Daemon token from the state file
+            timeout: Request timeout in seconds
+        """
+        self.host = host
+        self.port = port
+        self.token = token
+        self.timeout = timeout
+
+    @classmethod
+    def discover(
+        cls,
+        state_path: Path = None,
+        timeout: float = 0.2,
+        search_path: list[Path] = None,
+        options: dict[str, Any] = None,
+    ) -> "DaemonClient | None":
+        """
+        Find a running daemon of the same version and configuration.
+
+        Args:
+            state_path: State file to read (defaults to the user cache dir)
+            timeout: Health check timeout in seconds
+            search_path: Template search path the daemon must use (not
+                checked if None)
+            options: Output options the daemon must use, as published by
+                daemon.daemon_options() (not checked if None)
+
+        Returns:
+            DaemonClient, or None if no compatible daemon is reachable or
+            ``GHA_GEN_NO_DAEMON`` is set
+        """
+        from . import __version__
+
+        if os.environ.get(DISABLE_ENV):
+            return None
+
+        if state_path is None:
+            state_path = default_state_path()
+
+        try:
+            state = json.loads(state_path.read_text(encoding="utf-8"))
+            if state.get("version") != __version__:
+                return None
+            if search_path is not None and state.get("search_path") != [
+                str(path) for path in search_path
+            ]:
+                return None
+            if options is not None and state.get("options") != options:
+                return None
+            client = cls(state["host"], state["port"], state["token"])
+            if not client.ping(timeout):
+                return None
+            return client
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _request(self, method: str, path: str, payload: dict = None, timeout: float = None) -> dict:
+        """Send a request and decode the JSON response."""
+        import http.client
+
+        connection = http.client.HTTPConnection(
+            self.host, self.port, timeout=timeout or self.timeout
+        )
+        try:
+            body = json.dumps(payload).encode("utf-8") if payload is not None else None
+            headers = {TOKEN_HEADER: self.token, "Content-Type": "application/json"}
+            connection.request(method, path, body=body, headers=headers)
+            response = json.loads(connection.getresponse().read())
+        finally:
+            connection.close()
+
+        if not response.get("ok"):
+            raise DaemonError(response.get("error", "Unknown daemon error"))
+        return response
+
+    def ping(self, timeout: float = None) -> bool:
+        """
+        Check that the daemon is reachable.
+
+        Args:
+            timeout: Timeout in seconds
+
+        Returns:
+            True if the daemon answered
+        """
+        try:
+            self._request("GET", "/ping", timeout=timeout)
+            return True
+        except (OSError, ValueError, DaemonError):
+            return False
+
+    def render(self, template: str, variables: dict[str, Any]) -> str:
+        """
+        Render and validate a template in the daemon.
+
+        Args:
+            template: Template type
+            variables: Variables to inject into template
+
+        Returns:
+            Rendered workflow content
+
+        Raises:
+            DaemonError: If the daemon rejects the request
+        """
+        return self._request("POST", "/render", {"template": template, "variables": variables})[
+            "content"
+        ]
+
+    def validate(self, content: str = None, path: Path = None) -> tuple[bool, str]:
+        """
+        Validate YAML content or a file in the daemon.
+
+        Args:
+            content: YAML content to validate
+            path: File to validate (made absolute before sending)
+
+        Returns:
+            Tuple of (is_valid, message)
+        """
+        if path is not None:
+            payload = {"path": str(Path(path).absolute())}
+        else:
+            payload = {"content": content}
+
+        response = self._request("POST", "/validate", payload)
+        return response["valid"], response["message"]
+
+    def generate(
+        self, template: str, variables: dict[str, Any], output_path: Path, filename: str = None
+    ) -> Path:
+        """
+        Generate a workflow file in the daemon.
+
+        Args:
+            template: Template type
+            variables: Variables to inject into template
+            output_path: Directory where to save the workflow
+            filename: Optional custom filename (default: ci.yml)
+
+        Returns:
+            Path to the generated workflow file
+
+        Raises:
+            DaemonError: If the daemon rejects the request
+        """
+        response = self._request(
+            "POST",
+            "/generate",
+            {
+                "template": template,
+                "variables": variables,
+                "output": str(Path(output_path).absolute()),
+                "filename": filename,
+            },
+        )
+        return Path(response["path"])
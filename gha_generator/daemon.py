@@ -0,0 +1,241 @@
+"""
+Generator daemon module.
+
+This module keeps a warmed WorkflowGenerator resident in a long-lived
+process and answers render, validate and generate requests over a small
+JSON-over-HTTP protocol on localhost. The CLI uses client.DaemonClient
+to hand work to a running daemon and falls back to generating in-process.
+
+Protocol (all bodies are JSON objects):
+
+- ``GET /ping`` -> ``{"ok": true, "version": ...}``
+- ``POST /render`` ``{"template", "variables"}`` -> ``{"ok", "content"}``
+- ``POST /validate`` ``{"content"}`` or ``{"path"}`` -> ``{"ok", "valid", "message"}``
+- ``POST /generate`` ``{"template", "variables", "output", "filename"}``
+  -> ``{"ok", "path"}``
+
+Failures return ``{"ok": false, "error": ...}``. POST requests must carry
+the token from the daemon state file in the ``X-GHA-Gen-Token`` header.
+"""
+
+import json
+import os
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from .client import TOKEN_HEADER, default_state_path
+
+
+def daemon_options(generator) -> dict[str, Any]:
+    """
+    Describe the generator options that change the output of a daemon.
+
+    Args:
+        generator: WorkflowGenerator held by the daemon
+
+    Returns:
+        Options compared by DaemonClient.discover()
+    """
+    return {
+        "structural_validation": generator.structural_validation,
+        "cache_dependencies": generator.cache_dependencies,
+    }
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler dispatching JSON requests to the resident generator."""
+
+    server_version = "gha-gen"
+
+    def _send(self, status: int, payload: dict[str, Any]) -> None:
+        """Send a JSON response."""
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # noqa: N802
+        """Answer health checks."""
+        from . import __version__
+
+        if self.path == "/ping":
+            self._send(200, {"ok": True, "version": __version__, "pid": os.getpid()})
+        else:
+            self._send(404, {"ok": False, "error": f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):  # noqa: N802
+        """Dispatch render, validate and generate requests."""
+        if not secrets.compare_digest(self.headers.get(TOKEN_HEADER, ""), self.server.token):
+            self._send(403, {"ok": False, "error": "Invalid daemon token"})
+            return
+
+        handler = self.server.handlers.get(self.path)
+        if handler is None:
+            self._send(404, {"ok": False, "error": f"Unknown endpoint: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("Request body must be a JSON object")
+
+            with self.server.lock:
+                response = handler(request)
+
+            self._send(200, {"ok": True, **response})
+        except Exception as e:
+            self._send(400, {"ok": False, "error": str(e)})
+
+    def log_message(self, format, *args):  # noqa: A002
+        """Only log requests when the server is verbose."""
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class GeneratorServer(ThreadingHTTPServer):
+    """HTTP server holding a warmed WorkflowGenerator."""
+
+    daemon_threads = True
+
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 0, verbose: bool = False, **generator_options
+    ):
+        """
+        Initialize the server and warm up the generator.
+
+        Args:
+            host: Interface to bind (localhost by default)
+            port: TCP port (0 picks a free port)
+            verbose: Log every request to stderr
+            **generator_options: Keyword arguments for WorkflowGenerator
+        """
+        from .generator import WorkflowGenerator
+
+        super().__init__((host, port), _RequestHandler)
+
+        self.generator = WorkflowGenerator(**generator_options)
+        for template_type in self.generator.list_templates():
+            self.generator.load_template(template_type)
+
+        self.token = secrets.token_hex(16)
+        self.lock = threading.Lock()
+        self.verbose = verbose
+        self.handlers = {
+            "/render": self._render,
+            "/validate": self._validate,
+            "/generate": self._generate,
+        }
+
+    def _render(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Render and validate a template."""
+        template = self.generator.load_template(request["template"])
+        content = self.generator.render_validated(template, request.get("variables") or {})
+        return {"content": content}
+
+    def _validate(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Validate YAML content or a file."""
+        if "path" in request:
+            from .utils import validate_yaml
+
+            is_valid, message = validate_yaml(Path(request["path"]))
+        else:
+            is_valid, message = self.generator.validate_output(request["content"])
+
+        return {"valid": is_valid, "message": message}
+
+    def _generate(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Generate a workflow file."""
+        output = Path(request["output"])
+        if not output.is_absolute():
+            raise ValueError("Output path must be absolute")
+
+        path = self.generator.generate(
+            request["template"],
+            request.get("variables") or {},
+            output,
+            request.get("filename"),
+        )
+        return {"path": str(path)}
+
+    def write_state(self, state_path: Path) -> None:
+        """
+        Publish the server address and token for clients.
+
+        The template search path and output options are published too, so
+        clients configured differently generate in-process instead.
+
+        Args:
+            state_path: Path of the state file (always left with mode 0600)
+        """
+        import tempfile
+
+        from . import __version__
+
+        host, port = self.server_address[:2]
+        state = {
+            "host": host,
+            "port": port,
+            "token": self.token,
+            "pid": os.getpid(),
+            "version": __version__,
+            "search_path": [str(path) for path in self.generator.registry.search_path],
+            "options": daemon_options(self.generator),
+        }
+
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        # mkstemp creates the file with mode 0600; replacing the old state
+        # file never inherits its permissions
+        fd, tmp_name = tempfile.mkstemp(dir=state_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_name, state_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    state_path: Path = None,
+    verbose: bool = False,
+    ready=None,
+    **generator_options,
+) -> None:
+    """
+    Run the generator daemon until interrupted.
+
+    Args:
+        host: Interface to bind (localhost by default)
+        port: TCP port (0 picks a free port)
+        state_path: State file advertising the daemon to clients
+        verbose: Log every request to stderr
+        ready: Optional callback receiving the server once it is listening
+        **generator_options: Keyword arguments for WorkflowGenerator
+    """
+    if state_path is None:
+        state_path = default_state_path()
+
+    with GeneratorServer(host, port, verbose=verbose, **generator_options) as server:
+        server.write_state(state_path)
+        if ready is not None:
+            ready(server)
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            try:
+                state = json.loads(state_path.read_text(encoding="utf-8"))
+                if state.get("token") == server.token:
+                    state_path.unlink()
+            except (OSError, ValueError):
+                pass
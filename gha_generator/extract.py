@@ -0,0 +1,358 @@
+"""
+Workflow variable extraction module.
+
+This module recovers the template variables of an existing workflow that
+was generated from a template and possibly edited by hand since, so it
+can be regenerated. The template is rendered once with a sentinel in
+place of each variable, which gives a skeleton: literal lines, and lines
+with holes where variables go. Skeleton lines are indexed by their
+leading text, so each workflow line is only compared with the few
+skeleton lines it can match. The two line sequences are then aligned:
+aligned lines with holes give the variable values, and the unaligned
+stretches are the drift from the template.
+
+The skeleton is built once per template and reused for every file. A
+workflow with a build matrix is matched a second time against the
+template rendered with that workflow's matrix.
+"""
+
+import re
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Marks a variable in the sentinel render: a private-use character, which
+# no workflow contains and which str.strip() keeps
+SENTINEL = "\ue000"
+SENTINEL_PATTERN = re.compile(f"{SENTINEL}(\\w+){SENTINEL}")
+
+# Value of a variable turned into a matrix axis by the generator
+MATRIX_EXPRESSION = re.compile(r"\$\{\{\s*matrix\.([\w-]+)\s*\}\}")
+
+
+@dataclass
+class DriftHunk:
+    """A stretch of the workflow that differs from the template."""
+
+    template_start: int
+    expected: list[str]
+    file_start: int
+    actual: list[str]
+
+    def format(self) -> str:
+        """
+        Format the hunk like a unified diff hunk.
+
+        Returns:
+            Hunk text, starting with a ``@@ -a,b +c,d @@`` header
+        """
+        lines = [
+            f"@@ -{self.template_start + 1},{len(self.expected)} "
+            f"+{self.file_start + 1},{len(self.actual)} @@"
+        ]
+        lines += [f"-{line}" for line in self.expected]
+        lines += [f"+{line}" for line in self.actual]
+        return "\n".join(lines)
+
+
+@dataclass
+class ExtractionResult:
+    """Variables recovered from a workflow and its drift from the template."""
+
+    template: str
+    variables: dict[str, Any]
+    matched: int
+    total: int
+    missing: list[str] = field(default_factory=list)
+    conflicts: dict[str, list[str]] = field(default_factory=dict)
+    hunks: list[DriftHunk] = field(default_factory=list)
+
+    @property
+    def similarity(self) -> float:
+        """Share of the template lines found in the workflow."""
+        return self.matched / self.total if self.total else 0.0
+
+
+class _SkeletonLine:
+    """One line of the sentinel render."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.variables = SENTINEL_PATTERN.findall(text)
+        self.pattern = None
+
+        if self.variables:
+            parts = SENTINEL_PATTERN.split(text)
+            # split() alternates literal text and variable names
+            self.pattern = re.compile(
+                "".join(
+                    re.escape(part) if position % 2 == 0 else "(.+?)"
+                    for position, part in enumerate(parts)
+                )
+                + r"\Z"
+            )
+
+    @property
+    def key(self) -> str:
+        """Index key: the leading word, as far as it is literal."""
+        return _index_key(SENTINEL_PATTERN.split(self.text)[0], complete=not self.variables)
+
+    def match(self, line: str) -> list[str] | None:
+        """Return the values filling the holes if the line fits, None otherwise."""
+        found = self.pattern.match(line)
+        return list(found.groups()) if found else None
+
+    def fill(self, variables: dict[str, Any]) -> str:
+        """Replace the holes with recovered values."""
+        return SENTINEL_PATTERN.sub(
+            lambda hole: str(variables.get(hole.group(1), "{{ " + hole.group(1) + " }}")),
+            self.text,
+        )
+
+
+def _matrix_plan(content: str):
+    """Read back the build matrix of the first job of a workflow that has one."""
+    import yaml
+
+    from .matrix import MatrixPlan
+    from .yaml_backend import safe_load
+
+    try:
+        workflow = safe_load(content)
+    except yaml.YAMLError:
+        return None
+
+    jobs = workflow.get("jobs") if isinstance(workflow, dict) else None
+    if not isinstance(jobs, dict):
+        return None
+
+    for job in jobs.values():
+        try:
+            strategy = job["strategy"]
+            matrix = strategy["matrix"]
+        except (KeyError, TypeError):
+            continue
+        if not isinstance(matrix, dict):
+            continue
+
+        return MatrixPlan(
+            axes={
+                key: values
+                for key, values in matrix.items()
+                if key not in ("include", "exclude") and isinstance(values, list)
+            },
+            include=matrix.get("include") or [],
+            exclude=matrix.get("exclude") or [],
+            fail_fast=strategy.get("fail-fast", True),
+            max_parallel=strategy.get("max-parallel"),
+        )
+
+    return None
+
+
+def _index_key(text: str, complete: bool = True) -> str:
+    """
+    Leading word of a line (indentation included, so nesting counts).
+
+    For a line whose literal text stops at a hole, the word is only used
+    when the hole comes after it.
+    """
+    stripped = text.lstrip()
+    indent = text[: len(text) - len(stripped)]
+    word = stripped.split(" ", 1)
+    if not complete and len(word) == 1:
+        # The hole may continue the first word: index under the indent only
+        return indent
+    return indent + word[0]
+
+
+class TemplateSkeleton:
+    """Sentinel render of a template, indexed for matching workflows."""
+
+    def __init__(
+        self,
+        template: str,
+        lines: list[str],
+        render: Callable[[dict[str, Any]], str] | None = None,
+    ):
+        """
+        Build the skeleton index.
+
+        Args:
+            template: Template name
+            lines: Lines of the sentinel render, without line endings
+            render: Renders the template with a sentinel for each variable
+                but the given ones; used to match workflows with a build
+                matrix against a skeleton with the same matrix (optional)
+        """
+        self.template = template
+        self._render = render
+        self._matrix_skeletons: dict[str, TemplateSkeleton] = {}
+        self.lines = [_SkeletonLine(line.rstrip()) for line in lines]
+        self.variables = sorted({name for line in self.lines for name in line.variables})
+        self._literals = {line.text for line in self.lines if line.pattern is None}
+        # Lines with holes, by leading word
+        self._index: dict[str, list[int]] = {}
+        for position, line in enumerate(self.lines):
+            if line.pattern is not None:
+                self._index.setdefault(line.key, []).append(position)
+
+    def _candidates(self, line: str) -> list[int]:
+        """Skeleton lines with holes that a workflow line may match."""
+        key = _index_key(line)
+        candidates = list(self._index.get(key, ()))
+        indent = line[: len(line) - len(line.lstrip())]
+        if indent != key:
+            # Lines whose first word holds a variable
+            candidates += self._index.get(indent, ())
+        return candidates
+
+    def _classify(self, lines: list[str]) -> tuple[list[Any], dict[int, list[str]]]:
+        """
+        Map each workflow line to an alignment symbol.
+
+        A line fitting a skeleton line with holes maps to that line's
+        position, and the values filling the holes are kept; any other
+        line maps to its text.
+        """
+        symbols: list[Any] = []
+        values: dict[int, list[str]] = {}
+
+        for number, line in enumerate(lines):
+            symbol: Any = ("line", line)
+            if line not in self._literals:
+                for position in self._candidates(line):
+                    found = self.lines[position].match(line)
+                    if found is not None:
+                        values[number] = found
+                        symbol = ("hole", position)
+                        break
+            symbols.append(symbol)
+
+        return symbols, values
+
+    def match(self, content: str) -> ExtractionResult:
+        """
+        Recover the variables of a workflow and its drift from the template.
+
+        Args:
+            content: Workflow file content
+
+        Returns:
+            ExtractionResult
+        """
+        result = self._align(content)
+
+        # A version list was rendered as a matrix axis: read it back from the
+        # strategy, and compare the workflow with the template in matrix mode
+        axes = {}
+        for name, value in result.variables.items():
+            expression = MATRIX_EXPRESSION.fullmatch(value)
+            if expression:
+                axes[name] = expression.group(1)
+        if not axes:
+            return result
+
+        plan = _matrix_plan(content)
+        if plan is None or not all(axis in plan.axes for axis in axes.values()):
+            return result
+
+        lists = {name: [str(value) for value in plan.axes[axis]] for name, axis in axes.items()}
+        if self._render is not None:
+            result = self._matrix_skeleton(plan, axes)._align(content)
+        result.variables.update(lists)
+        return result
+
+    def _matrix_skeleton(self, plan, axes: dict[str, str]) -> "TemplateSkeleton":
+        """Skeleton of the template rendered with a build matrix."""
+        overrides = {name: plan.expression(axis) for name, axis in axes.items()}
+        key = plan.to_yaml() + repr(sorted(overrides.items()))
+
+        if key not in self._matrix_skeletons:
+            content = self._render({**overrides, "matrix": plan})
+            self._matrix_skeletons[key] = TemplateSkeleton(self.template, content.splitlines())
+        return self._matrix_skeletons[key]
+
+    def _align(self, content: str) -> ExtractionResult:
+        """Align a workflow with the skeleton (see match())."""
+        from difflib import SequenceMatcher
+
+        lines = [line.rstrip() for line in content.splitlines()]
+        expected = [
+            ("hole", position) if line.pattern is not None else ("line", line.text)
+            for position, line in enumerate(self.lines)
+        ]
+        actual, values = self._classify(lines)
+
+        matcher = SequenceMatcher(None, expected, actual, autojunk=False)
+        found: dict[str, list[str]] = {}
+        matched = 0
+        drift = []
+
+        for tag, t_start, t_end, f_start, f_end in matcher.get_opcodes():
+            if tag != "equal":
+                drift.append((t_start, t_end, f_start, f_end))
+                continue
+
+            matched += t_end - t_start
+            for offset in range(t_end - t_start):
+                skeleton = self.lines[t_start + offset]
+                if skeleton.pattern is None:
+                    continue
+                groups = values[f_start + offset]
+                for name, value in zip(skeleton.variables, groups, strict=True):
+                    found.setdefault(name, []).append(value)
+
+        variables = {}
+        conflicts = {}
+        for name, occurrences in found.items():
+            counts = Counter(occurrences)
+            variables[name] = counts.most_common(1)[0][0]
+            if len(counts) > 1:
+                conflicts[name] = list(counts)
+
+        hunks = [
+            DriftHunk(
+                template_start=t_start,
+                expected=[line.fill(variables) for line in self.lines[t_start:t_end]],
+                file_start=f_start,
+                actual=lines[f_start:f_end],
+            )
+            for t_start, t_end, f_start, f_end in drift
+        ]
+
+        return ExtractionResult(
+            template=self.template,
+            variables=variables,
+            matched=matched,
+            total=len(self.lines),
+            missing=[name for name in self.variables if name not in variables],
+            conflicts=conflicts,
+            hunks=hunks,
+        )
+
+
+def build_skeleton(generator, template_type: str) -> TemplateSkeleton:
+    """
+    Render a template with a sentinel for each variable.
+
+    Args:
+        generator: WorkflowGenerator providing the template
+        template_type: Template name
+
+    Returns:
+        TemplateSkeleton of the template
+
+    Raises:
+        ValueError: If the template does not exist
+    """
+    template = generator.load_template(template_type)
+    names = generator.registry.required_variables(template_type)
+
+    def render(overrides: dict[str, Any]) -> str:
+        return template.render(
+            {**{name: f"{SENTINEL}{name}{SENTINEL}" for name in names}, **overrides}
+        )
+
+    return TemplateSkeleton(template_type, render({}).splitlines(), render)
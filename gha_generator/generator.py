@@ -5,24 +5,161 @@ This module contains the core logic for generating GitHub Actions
 workflow files from templates.
 """
 
+import hashlib
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
+from jinja2 import Environment, Template, TemplateNotFound, meta
+
+from .batch import (
+    DEFAULT_FILENAME,
+    PLAN_CHANGED,
+    PLAN_FAILED,
+    PLAN_NEW,
+    PLAN_UNCHANGED,
+    BatchJob,
+    BatchResult,
+    PlanResult,
+)
+from .cache import create_bytecode_cache, create_render_cache
+from .loaders import DEFAULT_RELOAD_TTL, create_layered_loader
+from .matrix import apply_matrix
+from .registry import TEMPLATE_SUFFIX, TemplateRegistry, get_registry
+from .schema import VariableValidator, compile_validator
+from .utils import (
+    AtomicWriter,
+    fsync_directory,
+    get_template_path,
+    hash_file,
+    unified_diff,
+    write_file_atomic,
+)
+
+
+class _ChunkReader:
+    """
+    File-like reader over rendered template chunks.
+
+    Every chunk pulled by the reader is also passed to a sink, so one pass
+    over Template.generate() can feed a YAML parser and an output file.
+    """
+
+    def __init__(self, chunks: Iterator[str], sink: Callable[[str], None]):
+        """
+        Initialize the reader.
+
+        Args:
+            chunks: Rendered template chunks
+            sink: Callable receiving each chunk as it is consumed
+        """
+        self._chunks = chunks
+        self._sink = sink
+        self._buffer = ""
+
+    def _pull(self) -> bool:
+        """Move the next chunk into the buffer, returning False at the end."""
+        for chunk in self._chunks:
+            if chunk:
+                self._sink(chunk)
+                self._buffer += chunk
+                return True
+        return False
+
+    def read(self, size: int = -1) -> str:
+        """
+        Read up to size characters (everything if size is negative).
+
+        Args:
+            size: Maximum number of characters to return
+
+        Returns:
+            Rendered text, or an empty string at the end of the template
+        """
+        while (size < 0 or len(self._buffer) < size) and self._pull():
+            pass
+
+        if size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
 
-from .utils import get_template_path
+    def drain(self) -> None:
+        """Pass any chunks not read yet to the sink."""
+        for chunk in self._chunks:
+            self._sink(chunk)
 
 
 class WorkflowGenerator:
     """Generator class for creating GitHub Actions workflows."""
 
-    def __init__(self):
-        """Initialize the workflow generator."""
+    # Compile templates for Template.render_async() (see AsyncWorkflowGenerator)
+    enable_async = False
+
+    def __init__(
+        self,
+        cache_dir: Path = None,
+        bytecode_cache: bool = True,
+        structural_validation: bool = False,
+        render_cache: bool = False,
+        fsync: bool = False,
+        streaming: bool = False,
+        registry: TemplateRegistry = None,
+        template_dirs: Iterable[Path] = (),
+        cache_size: int = 400,
+        reload_ttl: float | None = DEFAULT_RELOAD_TTL,
+        cache_dependencies: bool = False,
+    ):
+        """
+        Initialize the workflow generator.
+
+        Args:
+            cache_dir: Cache root directory (defaults to the user cache dir)
+            bytecode_cache: Whether to persist compiled templates on disk
+            structural_validation: Validate rendered output with the YAML
+                event stream only, without constructing Python objects
+            render_cache: Whether to reuse previously rendered and validated
+                output for identical template sources and variables
+            fsync: Flush written workflows to disk before reporting success
+                (directory flushes are batched in generate_many())
+            streaming: Render straight to the output file chunk by chunk,
+                validating structurally as the chunks are produced, so the
+                full workflow is never held in memory (bypasses the
+                render cache)
+            registry: Template registry (defaults to the shared registry
+                for template_dirs and ``GHA_GEN_TEMPLATE_PATH``)
+            template_dirs: Template directories layered over the bundled
+                templates, highest precedence first (e.g. org, then team)
+            cache_size: Number of compiled templates kept in memory
+                across all layers (least recently used are evicted)
+            reload_ttl: Seconds between checks that a compiled template's
+                source is unchanged (0 checks on every load, None never
+                reloads)
+            cache_dependencies: Add or normalize dependency cache steps in
+                the rendered workflows (see optimize.optimize_caching());
+                needs the full output, so it disables streaming
+        """
         self.templates_dir = get_template_path()
+        self.registry = registry or get_registry(template_dirs)
+        self.reload_ttl = reload_ttl
+        self.structural_validation = structural_validation
+        self.render_cache = create_render_cache(cache_dir) if render_cache else None
+        self._template_digests: dict[str, tuple[str, list[Callable[[], bool]]]] = {}
+        self._validators: dict[str, VariableValidator] = {}
+        self.fsync = fsync
+        self.streaming = streaming and not cache_dependencies
+        self.cache_dependencies = cache_dependencies
+        self._pending_fsync_dirs: set[Path] | None = None
+        self._created_dirs: set[Path] | None = None
         self.env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
+            loader=create_layered_loader(self.registry.search_path, reload_ttl=reload_ttl or 0),
             trim_blocks=True,
             lstrip_blocks=True,
+            cache_size=cache_size,
+            auto_reload=reload_ttl is not None,
+            enable_async=self.enable_async,
+            bytecode_cache=create_bytecode_cache(cache_dir) if bytecode_cache else None,
         )
 
     def load_template(self, template_type: str) -> Template:
@@ -39,17 +176,60 @@ class WorkflowGenerator:
             TemplateNotFound: If template doesn't exist
             ValueError: If template type is invalid
         """
-        template_file = f"{template_type}.yml"
+        if self.reload_ttl is not None:
+            self.registry.reload_if_stale(self.reload_ttl)
 
         try:
-            template = self.env.get_template(template_file)
-            return template
+            if template_type not in self.registry:
+                raise TemplateNotFound(template_type)
+
+            return self.env.get_template(f"{template_type}{TEMPLATE_SUFFIX}")
         except TemplateNotFound:
             raise ValueError(
                 f"Template '{template_type}' not found. "
                 f"Available templates: {', '.join(self.list_templates())}"
             ) from None
 
+    def validate_variables(self, template_type: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """
+        Check template variables against the template schema before rendering.
+
+        Args:
+            template_type: Type of template (e.g., 'data-science', 'django-api')
+            variables: Variables to inject into template
+
+        Returns:
+            Variables with defaults applied
+
+        Raises:
+            ValueError: If a variable is missing or invalid
+        """
+        return self._validator(template_type)(variables)
+
+    def _validator(self, template_type: str) -> VariableValidator:
+        """Get the compiled variable validator of a template."""
+        validator = self._validators.get(template_type)
+        if validator is None:
+            validator = compile_validator(template_type, self.registry)
+            self._validators[template_type] = validator
+        return validator
+
+    def _checked_variables(self, template: Template, variables: dict[str, Any]) -> dict[str, Any]:
+        """
+        Validate the variables of a loaded registry template and plan its matrix.
+
+        Version lists are turned into a build matrix (see matrix.apply_matrix()).
+        """
+        if template.name is None or not template.name.endswith(TEMPLATE_SUFFIX):
+            return variables
+
+        template_type = template.name[: -len(TEMPLATE_SUFFIX)]
+        if template_type not in self.registry:
+            return variables
+
+        validator = self._validator(template_type)
+        return apply_matrix(validator(variables), validator.matrix_axes)
+
     def render_template(self, template: Template, variables: dict[str, Any]) -> str:
         """
         Render a template with given variables.
@@ -63,20 +243,96 @@ class WorkflowGenerator:
         """
         return template.render(**variables)
 
-    def validate_output(self, content: str) -> tuple[bool, str]:
+    def optimize_output(self, content: str) -> str:
+        """
+        Apply the enabled optimization passes to rendered output.
+
+        Args:
+            content: Rendered workflow content
+
+        Returns:
+            Optimized workflow content
+
+        Raises:
+            ValueError: If the rendered workflow is not valid YAML
+        """
+        if self.cache_dependencies:
+            from .optimize import optimize_caching
+
+            content = optimize_caching(content)
+
+        return content
+
+    def _render_options(self) -> str:
+        """Describe the options that change the output, for render cache keys."""
+        return (
+            f"structural={self.structural_validation},"
+            f"cache_dependencies={self.cache_dependencies}"
+        )
+
+    def template_digest(self, name: str) -> str:
+        """
+        Hash a template source together with every template it references.
+
+        The digest is memoized until one of the sources changes on disk,
+        as decided by the loader's freshness check (the same one that
+        reloads compiled templates).
+
+        Args:
+            name: Template file name (e.g., 'django-api.yml')
+
+        Returns:
+            Hex digest that changes whenever the template or one of its
+            extended/included templates changes
+        """
+        return self._digest_entry(name)[0]
+
+    def _digest_entry(self, name: str) -> tuple[str, list[Callable[[], bool]]]:
+        """Get the digest of a template and the freshness checks of its sources."""
+        entry = self._template_digests.get(name)
+        if entry is not None and (
+            not self.env.auto_reload or all(uptodate() for uptodate in entry[1])
+        ):
+            return entry
+
+        source, _, uptodate = self.env.loader.get_source(self.env, name)
+        hasher = hashlib.sha256(source.encode("utf-8"))
+        checks = [uptodate] if uptodate is not None else []
+
+        referenced = meta.find_referenced_templates(self.env.parse(source))
+        for reference in sorted({ref for ref in referenced if ref is not None}):
+            digest, reference_checks = self._digest_entry(reference)
+            hasher.update(digest.encode("ascii"))
+            checks += reference_checks
+
+        entry = (hasher.hexdigest(), checks)
+        self._template_digests[name] = entry
+        return entry
+
+    def validate_output(self, content: str, structural: bool = None) -> tuple[bool, str]:
         """
         Validate the generated YAML content.
 
         Args:
             content: YAML content as string
+            structural: Only check well-formedness from the parser event
+                stream (defaults to the generator's structural_validation)
 
         Returns:
             Tuple of (is_valid, message)
         """
         import yaml
 
+        from .yaml_backend import check_structure, safe_load
+
+        if structural is None:
+            structural = self.structural_validation
+
         try:
-            yaml.safe_load(content)
+            if structural:
+                check_structure(content)
+            else:
+                safe_load(content)
             return True, "YAML syntax is valid"
         except yaml.YAMLError as e:
             return False, f"Invalid YAML syntax: {str(e)}"
@@ -85,6 +341,10 @@ class WorkflowGenerator:
         """
         Write workflow content to file.
 
+        The file is replaced atomically, and left untouched when it already
+        holds exactly this content so unchanged workflows keep their
+        modification time.
+
         Args:
             output_path: Directory path where to write the file
             content: Workflow content as string
@@ -96,17 +356,127 @@ class WorkflowGenerator:
         Raises:
             IOError: If file cannot be written
         """
+        workflow_file, _ = self._write(output_path, content, filename)
+        return workflow_file
+
+    def _write(self, output_path: Path, content: str, filename: str) -> tuple[Path, bool]:
+        """
+        Write workflow content to file, reporting whether it changed.
+
+        Args:
+            output_path: Directory path where to write the file
+            content: Workflow content as string
+            filename: Name of the output file
+
+        Returns:
+            Tuple of (path to the file, whether the file was written)
+
+        Raises:
+            IOError: If file cannot be written
+        """
+        self._ensure_directory(output_path)
+
+        workflow_file = output_path / filename
+
+        try:
+            changed = write_file_atomic(workflow_file, content.encode("utf-8"), fsync=self.fsync)
+            if changed:
+                self._flush_directory(output_path)
+            return workflow_file, changed
+        except OSError as e:
+            raise OSError(f"Failed to write workflow file: {str(e)}") from e
+
+    def _ensure_directory(self, output_path: Path) -> None:
+        """Create an output directory, only once per directory in generate_many()."""
+        if self._created_dirs is not None:
+            if output_path in self._created_dirs:
+                return
+            self._created_dirs.add(output_path)
+
         output_path.mkdir(parents=True, exist_ok=True)
 
+    def _flush_directory(self, output_path: Path) -> None:
+        """Flush a written directory now, or at the end of generate_many()."""
+        if not self.fsync:
+            return
+
+        if self._pending_fsync_dirs is not None:
+            self._pending_fsync_dirs.add(output_path)
+        else:
+            fsync_directory(output_path)
+
+    def _stream_and_write(
+        self,
+        template: Template,
+        variables: dict[str, Any],
+        output_path: Path,
+        filename: str,
+    ) -> tuple[Path, bool]:
+        """
+        Render a template straight to file while validating it.
+
+        The chunks from Template.generate() are written to a temporary
+        file, fed to a running hash and parsed by the YAML event parser in
+        a single pass. The target is only replaced when the output is
+        valid and its hash differs from the existing file.
+
+        Args:
+            template: Jinja2 Template object
+            variables: Variables to inject into template
+            output_path: Directory where to save the workflow
+            filename: Name of the output file
+
+        Returns:
+            Tuple of (path to the workflow file, whether the file was written)
+
+        Raises:
+            ValueError: If the variables or the rendered workflow are invalid
+            IOError: If file cannot be written
+        """
+        import yaml
+
+        from .yaml_backend import check_structure
+
+        variables = self._checked_variables(template, variables)
+        self._ensure_directory(output_path)
         workflow_file = output_path / filename
+        hasher = hashlib.sha256()
 
         try:
-            with open(workflow_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            return workflow_file
+            with AtomicWriter(workflow_file, fsync=self.fsync) as writer:
+
+                def sink(chunk: str) -> None:
+                    data = chunk.encode("utf-8")
+                    writer.write(data)
+                    hasher.update(data)
+
+                reader = _ChunkReader(template.generate(**variables), sink)
+                try:
+                    check_structure(reader)
+                except yaml.YAMLError as e:
+                    raise ValueError(
+                        f"Generated workflow is invalid: Invalid YAML syntax: {str(e)}"
+                    ) from None
+                reader.drain()
+
+                try:
+                    unchanged = (
+                        workflow_file.stat().st_size == writer.size
+                        and hash_file(workflow_file) == hasher.hexdigest()
+                    )
+                except OSError:
+                    unchanged = False
+
+                if unchanged:
+                    return workflow_file, False
+
+                writer.commit()
         except OSError as e:
             raise OSError(f"Failed to write workflow file: {str(e)}") from e
 
+        self._flush_directory(output_path)
+        return workflow_file, True
+
     def generate(
         self,
         template_type: str,
@@ -133,37 +503,203 @@ class WorkflowGenerator:
         # Load template
         template = self.load_template(template_type)
 
+        # Determine filename
+        if filename is None:
+            filename = DEFAULT_FILENAME
+
+        workflow_file, _ = self._render_and_write(template, variables, output_path, filename)
+        return workflow_file
+
+    def _render_and_write(
+        self,
+        template: Template,
+        variables: dict[str, Any],
+        output_path: Path,
+        filename: str,
+    ) -> tuple[Path, bool]:
+        """
+        Render, validate and write a workflow from an already loaded template.
+
+        Args:
+            template: Jinja2 Template object
+            variables: Variables to inject into template
+            output_path: Directory where to save the workflow
+            filename: Name of the output file
+
+        Returns:
+            Tuple of (path to the workflow file, whether the file was written)
+
+        Raises:
+            ValueError: If the rendered workflow is invalid
+            IOError: If file cannot be written
+        """
+        if self.streaming:
+            return self._stream_and_write(template, variables, output_path, filename)
+
+        content = self.render_validated(template, variables)
+
+        # Write to file
+        return self._write(output_path, content, filename)
+
+    def render_validated(self, template: Template, variables: dict[str, Any]) -> str:
+        """
+        Render and validate a template, going through the render cache if enabled.
+
+        Args:
+            template: Jinja2 Template object
+            variables: Variables to inject into template
+
+        Returns:
+            Rendered and validated workflow content
+
+        Raises:
+            ValueError: If the variables or the rendered workflow are invalid
+        """
+        variables = self._checked_variables(template, variables)
+
+        key = None
+        if self.render_cache is not None:
+            key = self.render_cache.make_key(
+                self.template_digest(template.name),
+                variables,
+                self._render_options(),
+            )
+            content = self.render_cache.get(key)
+            if content is not None:
+                return content
+
         # Render template
-        content = self.render_template(template, variables)
+        content = self.optimize_output(self.render_template(template, variables))
 
         # Validate output
         is_valid, message = self.validate_output(content)
         if not is_valid:
             raise ValueError(f"Generated workflow is invalid: {message}")
 
-        # Determine filename
-        if filename is None:
-            filename = "ci.yml"
+        if key is not None:
+            self.render_cache.put(key, content)
 
-        # Write to file
-        workflow_file = self.write_workflow(output_path, content, filename)
+        return content
 
-        return workflow_file
+    def generate_many(self, jobs: Iterable[BatchJob]) -> Iterator[BatchResult]:
+        """
+        Generate many workflow files, yielding one result per job.
 
-    def list_templates(self) -> list[str]:
+        Each template is loaded once and the compiled Template object is
+        reused for every job of that type, and each output directory is
+        created once. A failing job is reported in its result and does
+        not stop the remaining jobs. With fsync enabled, each written
+        directory is flushed once at the end.
+
+        Args:
+            jobs: Batch jobs to generate
+
+        Yields:
+            BatchResult for each job, in input order
         """
-        List all available templates.
+        templates: dict[str, Template] = {}
+        self._pending_fsync_dirs = set()
+        self._created_dirs = set()
+
+        try:
+            for index, job in enumerate(jobs):
+                try:
+                    template = templates.get(job.template)
+                    if template is None:
+                        template = self.load_template(job.template)
+                        templates[job.template] = template
+
+                    path, changed = self._render_and_write(
+                        template, job.variables, job.output, job.filename
+                    )
+                    yield BatchResult(
+                        index=index, job=job, success=True, path=path, changed=changed
+                    )
+                except Exception as e:
+                    yield BatchResult(index=index, job=job, success=False, error=str(e))
+        finally:
+            pending, self._pending_fsync_dirs = self._pending_fsync_dirs, None
+            self._created_dirs = None
+            for directory in pending:
+                fsync_directory(directory)
+
+    def plan_many(self, jobs: Iterable[BatchJob], diff: bool = False) -> Iterator[PlanResult]:
+        """
+        Report what generate_many() would change, without writing anything.
+
+        Each workflow is rendered and validated in memory (one compiled
+        template per type, going through the render cache if enabled) and
+        compared with the existing file: a different size means changed,
+        otherwise the SHA-256 hashes decide. Only changed files are read
+        back, and only when a diff is requested.
+
+        Args:
+            jobs: Batch jobs to plan
+            diff: Include a unified diff for changed and new files
+
+        Yields:
+            PlanResult for each job, in input order
+        """
+        templates: dict[str, Template] = {}
+
+        for index, job in enumerate(jobs):
+            workflow_file = job.output / job.filename
+            try:
+                template = templates.get(job.template)
+                if template is None:
+                    template = self.load_template(job.template)
+                    templates[job.template] = template
+
+                data = self.render_validated(template, job.variables).encode("utf-8")
+
+                try:
+                    size = workflow_file.stat().st_size
+                except FileNotFoundError:
+                    size = None
+
+                if size is None:
+                    status = PLAN_NEW
+                elif (
+                    size == len(data)
+                    and hash_file(workflow_file) == hashlib.sha256(data).hexdigest()
+                ):
+                    status = PLAN_UNCHANGED
+                else:
+                    status = PLAN_CHANGED
+
+                patch = None
+                if diff and status != PLAN_UNCHANGED:
+                    old = workflow_file.read_bytes() if status == PLAN_CHANGED else b""
+                    patch = unified_diff(workflow_file, old, data)
+
+                yield PlanResult(
+                    index=index, job=job, status=status, path=workflow_file, diff=patch
+                )
+            except Exception as e:
+                yield PlanResult(
+                    index=index, job=job, status=PLAN_FAILED, path=workflow_file, error=str(e)
+                )
+
+    def precompile(self) -> list[str]:
+        """
+        Compile every template into the bytecode cache.
 
         Returns:
-            List of template names (without .yml extension)
+            List of compiled template file names
         """
-        templates = []
+        compiled = []
 
-        if not self.templates_dir.exists():
-            return templates
+        for name in self.env.list_templates(extensions=["yml"]):
+            self.env.get_template(name)
+            compiled.append(name)
 
-        for file in self.templates_dir.glob("*.yml"):
-            if file.stem != "base":  # Exclude base template
-                templates.append(file.stem)
+        return compiled
+
+    def list_templates(self) -> list[str]:
+        """
+        List all available templates.
 
-        return sorted(templates)
+        Returns:
+            List of template names (without .yml extension)
+        """
+        return self.registry.names()
@@ -0,0 +1,668 @@
+"""
+Workflow linting module.
+
+This module checks workflows against the GitHub Actions workflow syntax,
+beyond what YAML parsing catches: unknown trigger events and filters,
+runner labels, job and step keys, action inputs, ``needs`` references,
+permissions and cron expressions. The rules come from a schema bundled
+with the package (``data/workflow-schema.json``), so linting needs no
+network access.
+
+Each rule is registered for a YAML path such as ``jobs.*.runs-on``
+(``*`` matches any mapping key, ``[]`` any sequence item). The rules are
+compiled once into a tree keyed by path component, and a workflow is
+linted in a single walk of its composed document: every node looks up
+the rules for its path, and subtrees no rule applies to are not visited.
+"""
+
+import json
+import re
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+SCHEMA_PATH = Path(__file__).parent / "data" / "workflow-schema.json"
+
+ERROR = "error"
+WARNING = "warning"
+
+EXPRESSION = re.compile(r"^\s*\$\{\{.*\}\}\s*$", re.DOTALL)
+JOB_ID = re.compile(r"^[A-Za-z_][A-Za-z0-9_-]*$")
+CRON_FIELD = re.compile(r"^[0-9A-Za-z*/,\-?#LW]+$")
+
+
+@cache
+def load_schema() -> dict[str, Any]:
+    """
+    Load the bundled workflow schema.
+
+    Returns:
+        Schema data (events, keys, runner labels, action inputs)
+    """
+    return json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+
+
+@dataclass
+class LintIssue:
+    """A problem found in a workflow."""
+
+    line: int
+    column: int
+    rule: str
+    message: str
+    severity: str = ERROR
+
+    def format(self, file_path: Path | str = None) -> str:
+        """
+        Format the issue as ``file:line:column: severity [rule] message``.
+
+        Args:
+            file_path: File the issue belongs to (omitted if None)
+
+        Returns:
+            One-line description of the issue
+        """
+        location = f"{self.line}:{self.column}"
+        if file_path is not None:
+            location = f"{file_path}:{location}"
+        return f"{location}: {self.severity} [{self.rule}] {self.message}"
+
+
+@dataclass
+class LintContext:
+    """What a rule knows about the node it checks (one per linted document)."""
+
+    path: tuple[str, ...]
+    root: Any
+    schema: dict[str, Any]
+    _job_ids: set[str] | None = field(default=None, repr=False)
+
+    @property
+    def job_ids(self) -> set[str]:
+        """Ids of the jobs of the workflow."""
+        if self._job_ids is None:
+            jobs = _get(self.root, "jobs")
+            self._job_ids = set(_keys(jobs)) if _is_mapping(jobs) else set()
+        return self._job_ids
+
+    def issue(self, node, rule: str, message: str, severity: str = ERROR) -> LintIssue:
+        """Create an issue located at a node."""
+        mark = node.start_mark
+        return LintIssue(mark.line + 1, mark.column + 1, rule, message, severity)
+
+
+Check = Callable[[Any, LintContext], Iterator[LintIssue]]
+
+# Rules in registration order, as (path, check) pairs
+RULES: list[tuple[str, Check]] = []
+
+
+def rule(path: str) -> Callable[[Check], Check]:
+    """
+    Register a check for the nodes at a YAML path.
+
+    Args:
+        path: Dot-separated keys, ``*`` for any key and ``[]`` for any
+            sequence item (``""`` is the document itself)
+
+    Returns:
+        Decorator registering the check
+    """
+
+    def register(check: Check) -> Check:
+        RULES.append((path, check))
+        return check
+
+    return register
+
+
+def _is_mapping(node) -> bool:
+    import yaml
+
+    return isinstance(node, yaml.MappingNode)
+
+
+def _is_sequence(node) -> bool:
+    import yaml
+
+    return isinstance(node, yaml.SequenceNode)
+
+
+def _is_scalar(node) -> bool:
+    import yaml
+
+    return isinstance(node, yaml.ScalarNode)
+
+
+def _keys(node) -> Iterator[str]:
+    """Scalar keys of a mapping node."""
+    for key, _ in node.value:
+        if _is_scalar(key):
+            yield key.value
+
+
+def _get(node, name: str):
+    """Value node of a key in a mapping node, or None."""
+    if not _is_mapping(node):
+        return None
+    return next((value for key, value in node.value if getattr(key, "value", None) == name), None)
+
+
+def _scalars(node) -> list:
+    """Scalar nodes of a scalar or a sequence of scalars."""
+    if _is_scalar(node):
+        return [node]
+    if _is_sequence(node):
+        return [item for item in node.value if _is_scalar(item)]
+    return []
+
+
+def _is_expression(node) -> bool:
+    return _is_scalar(node) and bool(EXPRESSION.match(node.value))
+
+
+def _suggestion(value: str, choices) -> str:
+    """A "did you mean" hint for a misspelt name, or an empty string."""
+    from difflib import get_close_matches
+
+    close = get_close_matches(value, list(choices), n=1)
+    return f" (did you mean '{close[0]}'?)" if close else ""
+
+
+def _unknown_keys(node, allowed, what: str, context: LintContext) -> Iterator[LintIssue]:
+    """Report the keys of a mapping node that are not allowed."""
+    for key, _ in node.value:
+        if _is_scalar(key) and key.value not in allowed:
+            yield context.issue(
+                key,
+                "unknown-key",
+                f"Unknown {what} key '{key.value}'{_suggestion(key.value, allowed)}",
+            )
+
+
+def _expect_mapping(node, what: str, context: LintContext) -> Iterator[LintIssue]:
+    if not _is_mapping(node):
+        yield context.issue(node, "type", f"{what} must be a mapping")
+
+
+# Workflow
+
+
+@rule("")
+def check_workflow(node, context: LintContext) -> Iterator[LintIssue]:
+    """Top-level keys."""
+    if not _is_mapping(node):
+        yield context.issue(node, "type", "A workflow must be a mapping")
+        return
+
+    schema = context.schema["workflow"]
+    yield from _unknown_keys(node, schema["keys"], "workflow", context)
+    present = set(_keys(node))
+    for name in schema["required"]:
+        if name not in present:
+            yield context.issue(node, "missing-key", f"Workflow has no '{name}' key")
+
+
+@rule("on")
+def check_events(node, context: LintContext) -> Iterator[LintIssue]:
+    """Trigger event names."""
+    events = context.schema["events"]
+
+    if _is_mapping(node):
+        names = [key for key, _ in node.value if _is_scalar(key)]
+    else:
+        names = _scalars(node)
+        if not names:
+            yield context.issue(node, "type", "'on' must be an event, a list or a mapping")
+
+    for name in names:
+        if name.value not in events:
+            yield context.issue(
+                name,
+                "unknown-event",
+                f"Unknown event '{name.value}'{_suggestion(name.value, events)}",
+            )
+
+
+@rule("on.*")
+def check_event_filters(node, context: LintContext) -> Iterator[LintIssue]:
+    """Filters and activity types of one event."""
+    event = context.schema["events"].get(context.path[-1])
+    if event is None or context.path[-1] == "schedule":
+        return
+    if _is_scalar(node) and node.value in ("", "~", "null"):
+        return
+    if not _is_mapping(node):
+        yield context.issue(node, "type", f"Event '{context.path[-1]}' must be a mapping")
+        return
+
+    for key, value in node.value:
+        if not _is_scalar(key):
+            continue
+        if key.value not in event["filters"]:
+            yield context.issue(
+                key,
+                "event-filter",
+                f"Event '{context.path[-1]}' does not support '{key.value}'"
+                f"{_suggestion(key.value, event['filters'])}",
+            )
+        elif key.value == "types" and event.get("types") is not None:
+            for item in _scalars(value):
+                if item.value not in event["types"]:
+                    yield context.issue(
+                        item,
+                        "activity-type",
+                        f"Unknown activity type '{item.value}' for '{context.path[-1]}'"
+                        f"{_suggestion(item.value, event['types'])}",
+                    )
+
+    present = set(_keys(node))
+    for name in ("branches", "tags", "paths"):
+        if name in present and f"{name}-ignore" in present:
+            yield context.issue(
+                node,
+                "event-filter",
+                f"'{name}' and '{name}-ignore' cannot both be used for '{context.path[-1]}'",
+            )
+
+
+@rule("on.schedule")
+def check_schedule(node, context: LintContext) -> Iterator[LintIssue]:
+    """Cron expressions."""
+    if not _is_sequence(node):
+        yield context.issue(node, "type", "'schedule' must be a list of 'cron' entries")
+        return
+
+    for entry in node.value:
+        cron = _get(entry, "cron")
+        if not _is_scalar(cron):
+            yield context.issue(entry, "cron", "Schedule entry has no 'cron' expression")
+            continue
+        fields = cron.value.split()
+        if len(fields) != 5 or not all(CRON_FIELD.match(part) for part in fields):
+            yield context.issue(
+                cron, "cron", f"Invalid cron expression '{cron.value}' (expected 5 fields)"
+            )
+
+
+def _check_permissions(node, context: LintContext) -> Iterator[LintIssue]:
+    schema = context.schema["permissions"]
+
+    if _is_scalar(node):
+        if node.value not in schema["shorthands"] and not _is_expression(node):
+            yield context.issue(
+                node,
+                "permissions",
+                f"Permissions must be {' or '.join(schema['shorthands'])}, or a mapping",
+            )
+        return
+
+    if not _is_mapping(node):
+        yield context.issue(node, "type", "Permissions must be a mapping")
+        return
+
+    for key, value in node.value:
+        if not _is_scalar(key):
+            continue
+        if key.value not in schema["scopes"]:
+            yield context.issue(
+                key,
+                "permissions",
+                f"Unknown permission '{key.value}'{_suggestion(key.value, schema['scopes'])}",
+            )
+        elif not _is_scalar(value) or value.value not in schema["levels"]:
+            yield context.issue(
+                value,
+                "permissions",
+                f"Permission '{key.value}' must be one of {', '.join(schema['levels'])}",
+            )
+        elif key.value == "id-token" and value.value == "read":
+            yield context.issue(value, "permissions", "Permission 'id-token' cannot be 'read'")
+
+
+rule("permissions")(_check_permissions)
+rule("jobs.*.permissions")(_check_permissions)
+
+
+# Jobs
+
+
+@rule("jobs")
+def check_jobs(node, context: LintContext) -> Iterator[LintIssue]:
+    """Job ids."""
+    if not _is_mapping(node) or not node.value:
+        yield context.issue(node, "type", "'jobs' must be a non-empty mapping")
+        return
+
+    for key, _ in node.value:
+        if _is_scalar(key) and not JOB_ID.match(key.value):
+            yield context.issue(
+                key,
+                "job-id",
+                f"Invalid job id '{key.value}' (letters, digits, '-' and '_', "
+                "starting with a letter or '_')",
+            )
+
+
+@rule("jobs.*")
+def check_job(node, context: LintContext) -> Iterator[LintIssue]:
+    """Job keys, for jobs with steps and for reusable workflow calls."""
+    if not _is_mapping(node):
+        yield context.issue(node, "type", f"Job '{context.path[-1]}' must be a mapping")
+        return
+
+    schema = context.schema["job"]
+    present = set(_keys(node))
+
+    if "uses" in present:
+        yield from _unknown_keys(node, schema["reusable_keys"], "reusable workflow job", context)
+        return
+
+    yield from _unknown_keys(node, schema["keys"], "job", context)
+    for name in ("runs-on", "steps"):
+        if name not in present:
+            yield context.issue(
+                node, "missing-key", f"Job '{context.path[-1]}' has no '{name}' key"
+            )
+
+
+@rule("jobs.*.needs")
+def check_needs(node, context: LintContext) -> Iterator[LintIssue]:
+    """References to other jobs."""
+    names = _scalars(node)
+    if not names:
+        yield context.issue(node, "type", "'needs' must be a job id or a list of job ids")
+
+    for name in names:
+        if name.value == context.path[-2]:
+            yield context.issue(name, "needs", f"Job '{name.value}' needs itself")
+        elif name.value not in context.job_ids:
+            yield context.issue(
+                name,
+                "needs",
+                f"Job '{context.path[-2]}' needs unknown job '{name.value}'"
+                f"{_suggestion(name.value, context.job_ids)}",
+            )
+
+
+@rule("jobs.*.runs-on")
+def check_runs_on(node, context: LintContext) -> Iterator[LintIssue]:
+    """Runner labels."""
+    runners = context.schema["runners"]
+
+    if _is_mapping(node):
+        yield from _unknown_keys(node, ("group", "labels"), "runs-on", context)
+        return
+
+    labels = _scalars(node)
+    if not labels:
+        yield context.issue(node, "type", "'runs-on' must be a label, a list or a mapping")
+        return
+
+    values = {label.value for label in labels}
+    if "self-hosted" in values or any(_is_expression(label) for label in labels):
+        return
+
+    for label in labels:
+        if label.value in runners["hosted"]:
+            continue
+        hint = _suggestion(label.value, runners["hosted"])
+        if label.value in runners["self_hosted"]:
+            message = f"Runner label '{label.value}' only applies to self-hosted runners"
+        else:
+            message = f"Unknown runner label '{label.value}'{hint}"
+        # A close match is most likely a typo; other labels may be larger runners
+        yield context.issue(label, "runner-label", message, ERROR if hint else WARNING)
+
+
+@rule("jobs.*.strategy")
+def check_strategy(node, context: LintContext) -> Iterator[LintIssue]:
+    """Strategy keys."""
+    if _is_expression(node):
+        return
+    if _is_mapping(node):
+        yield from _unknown_keys(node, context.schema["strategy"]["keys"], "strategy", context)
+    else:
+        yield from _expect_mapping(node, "'strategy'", context)
+
+
+@rule("jobs.*.timeout-minutes")
+@rule("jobs.*.steps.[].timeout-minutes")
+def check_timeout(node, context: LintContext) -> Iterator[LintIssue]:
+    """Timeouts are numbers of minutes."""
+    if _is_expression(node):
+        return
+    if not _is_scalar(node) or not node.tag.endswith((":int", ":float")):
+        yield context.issue(node, "type", "'timeout-minutes' must be a number")
+
+
+# Steps
+
+
+@rule("jobs.*.steps")
+def check_steps(node, context: LintContext) -> Iterator[LintIssue]:
+    """Steps form a non-empty list."""
+    if not _is_sequence(node) or not node.value:
+        yield context.issue(node, "type", "'steps' must be a non-empty list")
+
+
+@rule("jobs.*.steps.[]")
+def check_step(node, context: LintContext) -> Iterator[LintIssue]:
+    """Step keys: exactly one of 'uses' and 'run'."""
+    if not _is_mapping(node):
+        yield context.issue(node, "type", "A step must be a mapping")
+        return
+
+    yield from _unknown_keys(node, context.schema["step"]["keys"], "step", context)
+
+    present = set(_keys(node))
+    if ("uses" in present) == ("run" in present):
+        yield context.issue(node, "step-kind", "A step must have exactly one of 'uses' and 'run'")
+    elif "with" in present and "run" in present:
+        yield context.issue(node, "step-kind", "'with' only applies to steps with 'uses'")
+    elif "shell" in present and "uses" in present:
+        yield context.issue(node, "step-kind", "'shell' only applies to steps with 'run'")
+
+
+@rule("jobs.*.steps.[].uses")
+def check_uses(node, context: LintContext) -> Iterator[LintIssue]:
+    """Action references."""
+    if not _is_scalar(node):
+        yield context.issue(node, "type", "'uses' must be a string")
+        return
+
+    value = node.value
+    if value.startswith(("./", "docker://")) or _is_expression(node):
+        return
+    if "@" not in value:
+        yield context.issue(
+            node, "uses", f"Action '{value}' has no version (expected '{value}@<ref>')"
+        )
+    elif value.count("/") < 1 or value.endswith("@"):
+        yield context.issue(node, "uses", f"Invalid action reference '{value}'")
+
+
+def _action(step, context: LintContext) -> tuple[str, dict[str, Any]] | None:
+    """The bundled schema of the action a step uses, if any."""
+    uses = _get(step, "uses")
+    if not _is_scalar(uses) or "@" not in uses.value:
+        return None
+    name = uses.value.split("@", 1)[0]
+    action = context.schema["actions"].get(name)
+    return (name, action) if action is not None else None
+
+
+@rule("jobs.*.steps.[]")
+def check_action_inputs(node, context: LintContext) -> Iterator[LintIssue]:
+    """Inputs of known actions."""
+    found = _action(node, context)
+    if found is None:
+        return
+
+    name, action = found
+    options = _get(node, "with")
+    present = set(_keys(options)) if _is_mapping(options) else set()
+
+    if _is_mapping(options):
+        for key, _ in options.value:
+            if _is_scalar(key) and key.value not in action["inputs"]:
+                yield context.issue(
+                    key,
+                    "unknown-input",
+                    f"Action '{name}' has no input '{key.value}'"
+                    f"{_suggestion(key.value, action['inputs'])}",
+                )
+
+    for required in action["required"]:
+        if required not in present:
+            yield context.issue(
+                node, "missing-input", f"Action '{name}' requires the '{required}' input"
+            )
+
+
+def _compile(rules: list[tuple[str, Check]]) -> dict[str, Any]:
+    """
+    Build the dispatch tree of a rule list.
+
+    Each tree node holds the checks for its path and its children by
+    path component. The children of ``*`` are merged into every named
+    sibling, so a node only ever follows one branch.
+    """
+
+    def new() -> dict[str, Any]:
+        return {"checks": [], "children": {}}
+
+    root = new()
+    for path, check in rules:
+        node = root
+        for part in path.split(".") if path else ():
+            node = node["children"].setdefault(part, new())
+        node["checks"].append(check)
+
+    def merge(target: dict[str, Any], source: dict[str, Any]) -> None:
+        target["checks"] = [*source["checks"], *target["checks"]]
+        for part, child in source["children"].items():
+            merge(target["children"].setdefault(part, new()), child)
+
+    def finish(node: dict[str, Any]) -> None:
+        wildcard = node["children"].get("*")
+        if wildcard is not None:
+            for part, child in node["children"].items():
+                if part != "*":
+                    merge(child, wildcard)
+        for child in node["children"].values():
+            finish(child)
+
+    finish(root)
+    return root
+
+
+class Linter:
+    """Rules compiled into a dispatch tree keyed by YAML path."""
+
+    def __init__(self, rules: list[tuple[str, Check]] = None, schema: dict[str, Any] = None):
+        """
+        Compile the rules.
+
+        Args:
+            rules: (path, check) pairs (defaults to the registered rules)
+            schema: Workflow schema (defaults to the bundled one)
+        """
+        self.schema = load_schema() if schema is None else schema
+        self.tree = _compile(RULES if rules is None else rules)
+
+    def lint(self, content: str) -> list[LintIssue]:
+        """
+        Lint a workflow.
+
+        Args:
+            content: Workflow YAML
+
+        Returns:
+            Issues sorted by position
+
+        Raises:
+            ValueError: If the content is not valid YAML
+        """
+        import yaml
+
+        from .yaml_backend import get_safe_loader
+
+        try:
+            document = yaml.compose(content, Loader=get_safe_loader())
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML syntax: {str(e)}") from None
+
+        if document is None:
+            return [LintIssue(1, 1, "type", "Workflow is empty")]
+
+        issues: list[LintIssue] = []
+        context = LintContext((), document, self.schema)
+        stack = [(document, self.tree, ())]
+
+        while stack:
+            node, branch, path = stack.pop()
+
+            if branch["checks"]:
+                context.path = path
+                for check in branch["checks"]:
+                    issues.extend(check(node, context))
+
+            children = branch["children"]
+            if not children:
+                continue
+
+            if _is_mapping(node):
+                for key, value in node.value:
+                    name = getattr(key, "value", None)
+                    child = children.get(name) or children.get("*")
+                    if child is not None and isinstance(name, str):
+                        stack.append((value, child, (*path, name)))
+            elif _is_sequence(node):
+                child = children.get("[]")
+                if child is not None:
+                    stack.extend((item, child, (*path, "[]")) for item in node.value)
+
+        issues.sort(key=lambda issue: (issue.line, issue.column))
+        return issues
+
+
+@cache
+def get_linter() -> Linter:
+    """Get the shared linter for the registered rules and bundled schema."""
+    return Linter()
+
+
+def lint_workflow(content: str) -> list[LintIssue]:
+    """
+    Lint a workflow with the registered rules.
+
+    Args:
+        content: Workflow YAML
+
+    Returns:
+        Issues sorted by position
+
+    Raises:
+        ValueError: If the content is not valid YAML
+    """
+    return get_linter().lint(content)
+
+
+def lint_file(file_path: Path) -> list[LintIssue]:
+    """
+    Lint a workflow file.
+
+    Args:
+        file_path: Workflow file
+
+    Returns:
+        Issues sorted by position
+
+    Raises:
+        ValueError: If the file is not valid YAML
+    """
+    with open(file_path, encoding="utf-8") as f:
+        return lint_workflow(f.read())
@@ -0,0 +1,78 @@
+"""
+Template loader module.
+
+This module builds the layered Jinja2 loader used by WorkflowGenerator.
+Each template directory is one layer, searched in order, so an org
+directory can override a team directory which overrides the bundled
+templates. Whether a compiled template is stale is decided with a stat
+of its source file at most once per reload interval, instead of on
+every render.
+"""
+
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from jinja2 import ChoiceLoader, FileSystemLoader
+
+from .utils import DEFAULT_RELOAD_TTL
+
+
+class TTLFileSystemLoader(FileSystemLoader):
+    """
+    Filesystem loader whose freshness check is rate-limited.
+
+    Jinja2 asks a cached template whether it is up to date each time it
+    is fetched. The source file is only stat'ed again once ``reload_ttl``
+    seconds have passed since the previous check; in between the cached
+    template is trusted.
+    """
+
+    def __init__(self, searchpath, reload_ttl: float = DEFAULT_RELOAD_TTL, **kwargs):
+        """
+        Initialize the loader.
+
+        Args:
+            searchpath: Template directory or list of directories
+            reload_ttl: Seconds between freshness checks (0 checks every time)
+            **kwargs: Extra options for FileSystemLoader
+        """
+        super().__init__(searchpath, **kwargs)
+        self.reload_ttl = reload_ttl
+
+    def get_source(self, environment, template):
+        """Load a template source with a rate-limited uptodate callback."""
+        source, filename, uptodate = super().get_source(environment, template)
+
+        if not self.reload_ttl:
+            return source, filename, uptodate
+
+        checked = time.monotonic()
+
+        def ttl_uptodate() -> bool:
+            nonlocal checked
+            now = time.monotonic()
+            if now - checked < self.reload_ttl:
+                return True
+            checked = now
+            return uptodate()
+
+        return source, filename, ttl_uptodate
+
+
+def create_layered_loader(
+    layers: Iterable[Path], reload_ttl: float = DEFAULT_RELOAD_TTL
+) -> ChoiceLoader:
+    """
+    Create a loader searching template directories in order.
+
+    Args:
+        layers: Template directories, highest precedence first
+        reload_ttl: Seconds between freshness checks of a template
+
+    Returns:
+        ChoiceLoader with one TTLFileSystemLoader per directory
+    """
+    return ChoiceLoader(
+        [TTLFileSystemLoader(str(layer), reload_ttl=reload_ttl) for layer in layers]
+    )
@@ -11,48 +11,140 @@ from pathlib import Path
 import click
 
 from . import __version__
-from .generator import WorkflowGenerator
-from .utils import create_directory_safe
+
+# Jinja2 and PyYAML are only imported by the commands that need them,
+# keeping ``--version`` and ``list-templates`` fast to start.
+
+
+def print_version(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+    """Print the version and active YAML backend, then exit."""
+    if not value or ctx.resilient_parsing:
+        return
+
+    from .yaml_backend import get_yaml_backend
+
+    click.echo(f"gha-gen, version {__version__}")
+    click.echo(f"YAML backend: {get_yaml_backend()}")
+    ctx.exit()
+
+
+template_dir_option = click.option(
+    "--template-dir",
+    "template_dirs",
+    multiple=True,
+    is_eager=True,
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Template directory searched before the bundled templates "
+    "(repeatable, first wins; also $GHA_GEN_TEMPLATE_PATH)",
+)
+
+
+class TemplateChoice(click.ParamType):
+    """
+    Template name parameter checked against the template registry.
+
+    The registry is only consulted when the parameter is converted or
+    completed, so building the CLI stays cheap. Directories given with
+    ``--template-dir`` (an eager option) are searched as well.
+    """
+
+    name = "template"
+
+    def convert(self, value, param, ctx):
+        """Resolve a template name, ignoring case."""
+        from .registry import get_registry
+
+        template_dirs = ctx.params.get("template_dirs", ()) if ctx else ()
+        names = get_registry(template_dirs).names()
+        if value in names:
+            return value
+
+        matches = [name for name in names if name.lower() == value.lower()]
+        if len(matches) == 1:
+            return matches[0]
+
+        self.fail(f"{value!r} is not one of {', '.join(map(repr, names))}.", param, ctx)
+
+    def shell_complete(self, ctx, param, incomplete):
+        """Complete template names from the registry."""
+        from click.shell_completion import CompletionItem
+
+        from .registry import get_registry
+
+        return [
+            CompletionItem(name)
+            for name in get_registry(ctx.params.get("template_dirs", ())).names()
+            if name.startswith(incomplete)
+        ]
 
 
 @click.group()
-@click.version_option(version=__version__, prog_name="gha-gen")
+@click.option(
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=print_version,
+    help="Show the version and exit.",
+)
 def cli():
     """GitHub Actions Generator - Generate customized CI/CD workflows."""
     pass
 
 
+def parse_var(ctx: click.Context, param: click.Parameter, value: tuple[str, ...]) -> dict:
+    """Parse repeated KEY=VALUE options into a dict."""
+    variables = {}
+
+    for item in value:
+        key, sep, val = item.partition("=")
+        if not sep or not key:
+            raise click.BadParameter(f"expected KEY=VALUE, got {item!r}", ctx, param)
+        variables[key.strip()] = val
+
+    return variables
+
+
 @cli.command()
 @click.option(
     "--type",
     "-t",
     "project_type",
-    required=True,
-    type=click.Choice(["data-science", "django-api", "laravel-api", "react-app"], case_sensitive=False),
+    type=TemplateChoice(),
     help="Type of project template to generate",
 )
 @click.option(
     "--name",
     "-n",
     "project_name",
-    required=True,
     help="Name of the project",
 )
 @click.option(
     "--python-version",
     "-p",
     default="3.11",
-    help="Python version (for Python projects)",
+    help="Python version, or comma-separated versions for a matrix (for Python projects)",
 )
 @click.option(
     "--php-version",
     default="8.2",
-    help="PHP version (for PHP projects)",
+    help="PHP version, or comma-separated versions for a matrix (for PHP projects)",
 )
 @click.option(
     "--node-version",
     default="18",
-    help="Node.js version (for Node projects)",
+    help="Node.js version, or comma-separated versions for a matrix (for Node projects)",
+)
+@click.option(
+    "--max-parallel",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of matrix jobs running at once",
+)
+@click.option(
+    "--fail-fast/--no-fail-fast",
+    default=True,
+    help="Cancel the other matrix jobs when one fails",
 )
 @click.option(
     "--output",
@@ -61,33 +153,107 @@ def cli():
     default=".github/workflows",
     help="Output directory for the workflow file",
 )
+@click.option(
+    "--filename",
+    "-f",
+    default=None,
+    help="Workflow file name (default: ci.yml)",
+)
+@click.option(
+    "--var",
+    "extra_variables",
+    multiple=True,
+    callback=parse_var,
+    metavar="KEY=VALUE",
+    help="Extra template variable (repeatable)",
+)
+@click.option(
+    "--manifest",
+    "-m",
+    "manifest_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="YAML manifest of repositories and their workflows (replaces --type/--name)",
+)
+@click.option(
+    "--cache-deps",
+    "cache_dependencies",
+    is_flag=True,
+    help="Add pip/npm/Composer cache steps keyed on lockfile hashes",
+)
+@template_dir_option
 def create(
     project_type: str,
     project_name: str,
     python_version: str,
     php_version: str,
     node_version: str,
+    max_parallel: int,
+    fail_fast: bool,
     output: str,
+    filename: str,
+    extra_variables: dict,
+    manifest_file: str,
+    cache_dependencies: bool,
+    template_dirs: tuple[Path, ...],
 ):
-    """Create a new GitHub Actions workflow file."""
+    """Create a new GitHub Actions workflow file (or several from a manifest)."""
+    if manifest_file is not None:
+        _create_from_manifest(manifest_file, template_dirs, cache_dependencies)
+        return
+
+    if not project_type or not project_name:
+        raise click.UsageError("Specify --type and --name, or --manifest")
+
     try:
+        from .client import DaemonClient
+        from .registry import get_registry
+        from .schema import compile_validator
+
         click.echo(f"🚀 Generating {project_type} workflow for '{project_name}'...")
 
-        # Create output directory if it doesn't exist
         output_path = Path(output)
-        create_directory_safe(output_path)
 
-        # Prepare variables for template
-        variables = {
-            "project_name": project_name,
+        # Keep only the variables the template uses and check them
+        # before anything is rendered
+        validator = compile_validator(project_type, get_registry(template_dirs))
+        versions = {
             "python_version": python_version,
             "php_version": php_version,
             "node_version": node_version,
         }
+        variables = {
+            name: [v.strip() for v in value.split(",") if v.strip()] if "," in value else value
+            for name, value in versions.items()
+            if name in validator.names
+        }
+        if any(isinstance(value, list) for value in variables.values()):
+            variables["fail_fast"] = fail_fast
+            if max_parallel is not None:
+                variables["max_parallel"] = max_parallel
+        variables = validator({"project_name": project_name, **variables, **extra_variables})
 
-        # Generate workflow
-        generator = WorkflowGenerator()
-        workflow_file = generator.generate(project_type, variables, output_path)
+        # Generate workflow, preferring a running daemon that searches the
+        # same template directories with the same output options
+        client = DaemonClient.discover(
+            search_path=get_registry(template_dirs).search_path,
+            options={
+                "structural_validation": False,
+                "cache_dependencies": cache_dependencies,
+            },
+        )
+        if client is not None:
+            workflow_file = client.generate(project_type, variables, output_path, filename)
+        else:
+            from .generator import WorkflowGenerator
+            from .utils import create_directory_safe
+
+            # Create output directory if it doesn't exist
+            create_directory_safe(output_path)
+
+            generator = WorkflowGenerator(
+                template_dirs=template_dirs, cache_dependencies=cache_dependencies
+            )
+            workflow_file = generator.generate(project_type, variables, output_path, filename)
 
         click.echo(f"✅ Workflow created successfully: {workflow_file}")
         click.echo(f"📝 File location: {workflow_file.absolute()}")
@@ -97,17 +263,54 @@ def create(
         sys.exit(1)
 
 
+def _create_from_manifest(
+    manifest_file: str, template_dirs: tuple[Path, ...], cache_dependencies: bool = False
+) -> None:
+    """
+    Generate every workflow of a manifest in one in-process pass.
+
+    Args:
+        manifest_file: Path to the manifest
+        template_dirs: Extra template directories
+        cache_dependencies: Add dependency cache steps to the workflows
+    """
+    try:
+        from .batch import load_manifest
+        from .generator import WorkflowGenerator
+
+        jobs = load_manifest(Path(manifest_file))
+        directories = len({job.output for job in jobs})
+        click.echo(
+            f"🚀 Generating {len(jobs)} workflow(s) into {directories} "
+            f"director{'y' if directories == 1 else 'ies'} from {manifest_file}..."
+        )
+
+        generator = WorkflowGenerator(
+            template_dirs=template_dirs, cache_dependencies=cache_dependencies
+        )
+        if _report_batch_results(generator.generate_many(jobs)):
+            sys.exit(1)
+
+    except Exception as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
 @cli.command()
-def list_templates():
+@template_dir_option
+def list_templates(template_dirs: tuple[Path, ...]):
     """List all available project templates."""
     try:
-        generator = WorkflowGenerator()
-        templates = generator.list_templates()
+        from .registry import get_registry
+
+        registry = get_registry(template_dirs)
 
         click.echo("📋 Available templates:")
         click.echo()
-        for template in templates:
-            click.echo(f"  • {template}")
+        for template in registry.names():
+            origin = registry.origin(template)
+            suffix = "" if origin == "bundled" else f" ({origin})"
+            click.echo(f"  • {template}{suffix}")
 
     except Exception as e:
         click.echo(f"❌ Error: {str(e)}", err=True)
@@ -119,19 +322,95 @@ def list_templates():
     "--file",
     "-f",
     "workflow_file",
-    required=True,
     type=click.Path(exists=True),
     help="Path to the workflow file to validate",
 )
-def validate(workflow_file: str):
-    """Validate a GitHub Actions workflow file."""
+@click.option(
+    "--path",
+    "tree_path",
+    help="Directory or glob pattern of workflow files to validate",
+)
+@click.option(
+    "--recursive",
+    "-r",
+    is_flag=True,
+    help="Descend into subdirectories of --path",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    "workers",
+    default=1,
+    type=click.IntRange(min=0),
+    help="Number of worker processes for --path (0 = one per CPU)",
+)
+@click.option(
+    "--structural",
+    is_flag=True,
+    help="Only check YAML well-formedness (faster, no object construction)",
+)
+@click.option(
+    "--incremental/--no-incremental",
+    default=True,
+    help="Skip files unchanged since the last --path run",
+)
+@click.option(
+    "--index",
+    "index_file",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Validation index file for --incremental (default: in the user cache dir)",
+)
+@click.option(
+    "--lint",
+    is_flag=True,
+    help="Also check events, runners, job and step keys and action inputs",
+)
+def validate(
+    workflow_file: str,
+    tree_path: str,
+    recursive: bool,
+    workers: int,
+    structural: bool,
+    incremental: bool,
+    index_file: str,
+    lint: bool,
+):
+    """Validate a GitHub Actions workflow file or a tree of workflow files."""
+    if (workflow_file is None) == (tree_path is None):
+        raise click.UsageError("Specify exactly one of --file or --path")
+    if lint and structural:
+        raise click.UsageError("--lint cannot be combined with --structural")
+
     try:
-        from .utils import validate_yaml
+        if tree_path is not None:
+            index_path = Path(index_file) if index_file else None
+            _validate_tree(tree_path, recursive, workers, structural, incremental, index_path, lint)
+            return
+
+        from .client import DaemonClient
 
         click.echo(f"🔍 Validating {workflow_file}...")
 
         file_path = Path(workflow_file)
-        is_valid, message = validate_yaml(file_path)
+        if lint:
+            from .validation import lint_result
+
+            result = lint_result(file_path)
+            _report_lint_issues(result)
+            if not result.valid:
+                click.echo(f"❌ {result.message}", err=True)
+                sys.exit(1)
+            click.echo(f"✅ {result.message}")
+            return
+
+        client = None if structural else DaemonClient.discover()
+        if client is not None:
+            is_valid, message = client.validate(path=file_path)
+        else:
+            from .utils import validate_yaml
+
+            is_valid, message = validate_yaml(file_path, structural=structural)
 
         if is_valid:
             click.echo(f"✅ {message}")
@@ -144,6 +423,592 @@ def validate(workflow_file: str):
         sys.exit(1)
 
 
+def _validate_tree(
+    tree_path: str,
+    recursive: bool,
+    workers: int,
+    structural: bool,
+    incremental: bool,
+    index_path: Path = None,
+    lint: bool = False,
+) -> None:
+    """
+    Validate every workflow file under a directory or glob pattern.
+
+    Args:
+        tree_path: Directory or glob pattern
+        recursive: Descend into subdirectories
+        workers: Number of worker processes
+        structural: Only check well-formedness from the parser event stream
+        incremental: Reuse index results for unchanged files
+        index_path: Validation index file (defaults to the user cache dir)
+        lint: Lint the files against the workflow schema
+    """
+    import time
+
+    from .validation import (
+        ValidationIndex,
+        default_index_path,
+        find_workflow_files,
+        validate_files,
+        validate_files_incremental,
+    )
+
+    start = time.perf_counter()
+    files = find_workflow_files(tree_path, recursive=recursive)
+
+    if not files:
+        click.echo(f"❌ No workflow files found in {tree_path}", err=True)
+        sys.exit(1)
+
+    click.echo(f"🔍 Validating {len(files)} file(s) in {tree_path}...")
+
+    if incremental:
+        index = ValidationIndex(index_path or default_index_path(tree_path))
+        results = validate_files_incremental(
+            files, index, workers=workers, structural=structural, lint=lint
+        )
+    else:
+        results = validate_files(files, workers=workers, structural=structural, lint=lint)
+
+    invalid = 0
+    cached = 0
+    for result in results:
+        cached += result.cached
+        if result.valid:
+            click.echo(f"✅ {result.path}")
+        else:
+            invalid += 1
+            click.echo(f"❌ {result.path}: {result.message}", err=True)
+        _report_lint_issues(result)
+
+    elapsed = time.perf_counter() - start
+    click.echo(
+        f"📊 {len(files)} file(s): {len(files) - invalid} valid, {invalid} invalid "
+        f"({cached} unchanged) in {elapsed:.2f}s"
+    )
+
+    if invalid:
+        sys.exit(1)
+
+
+def _report_lint_issues(result) -> None:
+    """Print the lint issues of a validation result, errors on stderr."""
+    from .lint import ERROR
+
+    for issue in result.issues:
+        if issue.severity == ERROR:
+            click.echo(f"  ❌ {issue.format(result.path)}", err=True)
+        else:
+            click.echo(f"  ⚠️  {issue.format(result.path)}")
+
+
+@cli.command()
+@click.option(
+    "--manifest",
+    "-m",
+    "manifest_file",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Path to the YAML manifest describing the workflows to generate",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    "workers",
+    default=1,
+    type=click.IntRange(min=0),
+    help="Number of worker processes (0 = one per CPU)",
+)
+@click.option(
+    "--structural",
+    is_flag=True,
+    help="Validate rendered workflows from the YAML event stream only",
+)
+@click.option(
+    "--render-cache/--no-render-cache",
+    default=True,
+    help="Reuse cached output for unchanged templates and variables",
+)
+@click.option(
+    "--fsync",
+    is_flag=True,
+    help="Flush written workflows to disk before reporting success",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Render straight to file with flat memory use (implies --structural)",
+)
+@click.option(
+    "--cache-deps",
+    "cache_dependencies",
+    is_flag=True,
+    help="Add pip/npm/Composer cache steps keyed on lockfile hashes",
+)
+@click.option(
+    "--plan",
+    is_flag=True,
+    help="Dry run: report which workflows would change, without writing",
+)
+@click.option(
+    "--diff",
+    is_flag=True,
+    help="With --plan, show a unified diff for each changed or new workflow",
+)
+@template_dir_option
+def batch(
+    manifest_file: str,
+    workers: int,
+    structural: bool,
+    render_cache: bool,
+    fsync: bool,
+    stream: bool,
+    cache_dependencies: bool,
+    plan: bool,
+    diff: bool,
+    template_dirs: tuple[Path, ...],
+):
+    """Generate many workflow files from a manifest."""
+    if diff and not plan:
+        raise click.UsageError("--diff requires --plan")
+
+    try:
+        from .batch import load_manifest
+        from .parallel import generate_parallel
+
+        jobs = load_manifest(Path(manifest_file))
+        if plan:
+            click.echo(f"🔎 Planning {len(jobs)} workflow(s) from {manifest_file} (dry run)...")
+        else:
+            click.echo(f"🚀 Generating {len(jobs)} workflow(s) from {manifest_file}...")
+
+        results = generate_parallel(
+            jobs,
+            workers,
+            plan=plan,
+            diff=diff,
+            structural_validation=structural,
+            render_cache=render_cache,
+            fsync=fsync,
+            streaming=stream and not plan,
+            cache_dependencies=cache_dependencies,
+            template_dirs=template_dirs,
+        )
+
+        report = _report_plan_results if plan else _report_batch_results
+        failed = report(results)
+
+        if render_cache:
+            from .cache import create_render_cache
+
+            # Keep the cache bounded across repeated fleet runs
+            create_render_cache().prune()
+
+        if failed:
+            sys.exit(1)
+
+    except Exception as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+def _report_batch_results(results) -> int:
+    """
+    Print one line per batch result and a summary.
+
+    Args:
+        results: Iterable of BatchResult objects
+
+    Returns:
+        Number of failed jobs
+    """
+    succeeded = 0
+    failed = 0
+    unchanged = 0
+
+    for result in results:
+        if result.success and not result.changed:
+            succeeded += 1
+            unchanged += 1
+            click.echo(f"⏭️  {result.path} (unchanged)")
+        elif result.success:
+            succeeded += 1
+            click.echo(f"✅ {result.path}")
+        else:
+            failed += 1
+            click.echo(
+                f"❌ [{result.index + 1}] {result.job.template} -> "
+                f"{result.job.output / result.job.filename}: {result.error}",
+                err=True,
+            )
+
+    click.echo(f"📊 {succeeded} succeeded, {failed} failed ({unchanged} unchanged)")
+    return failed
+
+
+def _report_plan_results(results) -> int:
+    """
+    Print the workflows a batch would change, their diffs and a summary.
+
+    Unchanged workflows are only counted, so the output stays short for
+    large fleets.
+
+    Args:
+        results: Iterable of PlanResult objects
+
+    Returns:
+        Number of failed jobs
+    """
+    from .batch import PLAN_CHANGED, PLAN_FAILED, PLAN_NEW, PLAN_UNCHANGED
+
+    counts = dict.fromkeys((PLAN_UNCHANGED, PLAN_CHANGED, PLAN_NEW, PLAN_FAILED), 0)
+
+    for result in results:
+        counts[result.status] += 1
+        if result.status == PLAN_NEW:
+            click.echo(f"🆕 {result.path} (new)")
+        elif result.status == PLAN_CHANGED:
+            click.echo(f"✏️  {result.path} (changed)")
+        elif result.status == PLAN_FAILED:
+            click.echo(
+                f"❌ [{result.index + 1}] {result.job.template} -> {result.path}: {result.error}",
+                err=True,
+            )
+        if result.diff:
+            click.echo(result.diff, nl=False)
+
+    click.echo(
+        f"📊 {counts[PLAN_UNCHANGED]} unchanged, {counts[PLAN_CHANGED]} changed, "
+        f"{counts[PLAN_NEW]} new, {counts[PLAN_FAILED]} failed (nothing written)"
+    )
+    return counts[PLAN_FAILED]
+
+
+@cli.command()
+@click.option(
+    "--file",
+    "-f",
+    "workflow_file",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Path to the workflow file to analyze",
+)
+@click.option(
+    "--durations",
+    "durations_file",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="JSON file of measured seconds per job (default: estimated from the steps)",
+)
+@click.option(
+    "--suggest",
+    is_flag=True,
+    help="Suggest steps to move into parallel jobs",
+)
+def analyze(workflow_file: str, durations_file: str, suggest: bool):
+    """Report the job graph, critical path and parallelism of a workflow."""
+    try:
+        from .analysis import analyze_workflow, format_duration, load_durations, load_workflow
+
+        durations = load_durations(Path(durations_file)) if durations_file else None
+        report = analyze_workflow(load_workflow(Path(workflow_file)), durations, suggest)
+
+        click.echo(f"🔍 Analyzing {workflow_file}...")
+        if report.triggers:
+            click.echo(f"⚡ Triggers: {', '.join(report.triggers)}")
+        click.echo(f"📊 {len(report.jobs)} job(s), {report.edges} dependency link(s)")
+
+        for name, job in report.jobs.items():
+            if name not in report.schedule:
+                continue
+            start, finish = report.schedule[name]
+            instances = f" x{job.instances}" if job.instances > 1 else ""
+            needs = f" (needs: {', '.join(job.needs)})" if job.needs else ""
+            click.echo(
+                f"  • {name}{instances}: {format_duration(start)} → "
+                f"{format_duration(finish)}{needs}"
+            )
+
+        if report.critical_path:
+            click.echo(
+                f"⏱️  Critical path ({format_duration(report.critical_duration)}): "
+                f"{' → '.join(report.critical_path)}"
+            )
+            click.echo(f"↔️  Max parallel width: {report.width}")
+
+        for cycle in report.cycles:
+            click.echo(f"❌ Cycle: {' → '.join(cycle)}", err=True)
+        for name, need in report.dangling:
+            click.echo(f"❌ Job '{name}' needs unknown job '{need}'", err=True)
+
+        if suggest:
+            click.echo("💡 Suggestions:" if report.suggestions else "💡 No split suggested")
+            for suggestion in report.suggestions:
+                click.echo(f"  • {suggestion}")
+
+        if not report.is_valid:
+            sys.exit(1)
+
+    except Exception as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--file",
+    "-f",
+    "workflow_file",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Path to the workflow file to simulate",
+)
+@click.option(
+    "--profile",
+    "profile_file",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="JSON step durations, or GitHub API job listings of past runs",
+)
+@click.option(
+    "--runners",
+    default=20,
+    type=click.IntRange(min=1),
+    help="Number of runners in the pool",
+)
+@click.option(
+    "--runs",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of workflow runs to simulate",
+)
+@click.option(
+    "--interval",
+    default=0.0,
+    type=click.FloatRange(min=0),
+    help="Seconds between the triggers of two runs",
+)
+def simulate(workflow_file: str, profile_file: str, runners: int, runs: int, interval: float):
+    """Estimate wall-clock time, runner minutes and queueing of a workflow."""
+    try:
+        from .analysis import format_duration, load_workflow
+        from .simulate import load_profile
+        from .simulate import simulate as run_simulation
+
+        profiles = load_profile(Path(profile_file)) if profile_file else None
+        click.echo(f"🧪 Simulating {runs} run(s) of {workflow_file} on {runners} runner(s)...")
+
+        result = run_simulation(
+            load_workflow(Path(workflow_file)),
+            profiles,
+            runners=runners,
+            runs=runs,
+            interval=interval,
+        )
+
+        mean_run = sum(result.run_durations) / len(result.run_durations)
+        click.echo(
+            f"⏱️  Wall-clock: {format_duration(result.wall_clock)} "
+            f"(per run: mean {format_duration(mean_run)}, "
+            f"max {format_duration(max(result.run_durations))})"
+        )
+        click.echo(
+            f"💰 Runner time: {format_duration(result.runner_seconds)} "
+            f"({result.billable_minutes} billable minute(s))"
+        )
+        click.echo(
+            f"⏳ Queueing: total {format_duration(result.queue_total)}, "
+            f"max {format_duration(result.queue_max)}"
+        )
+        click.echo(
+            f"📈 Peak runners in use: {result.peak_runners}/{runners} "
+            f"({result.utilization:.0%} utilization)"
+        )
+        for name, stats in result.jobs.items():
+            click.echo(
+                f"  • {name}: {stats.instances} instance(s), "
+                f"{format_duration(stats.duration)} each, "
+                f"waited {format_duration(stats.wait_mean)} on average"
+            )
+
+    except Exception as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--type",
+    "-t",
+    "project_type",
+    required=True,
+    type=TemplateChoice(),
+    help="Template the workflows were generated from",
+)
+@click.option(
+    "--file",
+    "-f",
+    "workflow_files",
+    required=True,
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Workflow file to extract variables from (repeatable)",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="Print the results as JSON",
+)
+@template_dir_option
+def extract(
+    project_type: str,
+    workflow_files: tuple[str, ...],
+    as_json: bool,
+    template_dirs: tuple[Path, ...],
+):
+    """Recover the template variables of existing workflows and their drift."""
+    try:
+        import json
+
+        from .extract import build_skeleton
+        from .generator import WorkflowGenerator
+
+        skeleton = build_skeleton(WorkflowGenerator(template_dirs=template_dirs), project_type)
+        results = {
+            workflow_file: skeleton.match(Path(workflow_file).read_text(encoding="utf-8"))
+            for workflow_file in workflow_files
+        }
+
+        if as_json:
+            click.echo(
+                json.dumps(
+                    {
+                        workflow_file: {
+                            "template": result.template,
+                            "variables": result.variables,
+                            "similarity": round(result.similarity, 4),
+                            "missing": result.missing,
+                            "conflicts": result.conflicts,
+                            "drift": [hunk.format() for hunk in result.hunks],
+                        }
+                        for workflow_file, result in results.items()
+                    },
+                    indent=2,
+                )
+            )
+            return
+
+        for workflow_file, result in results.items():
+            click.echo(f"🔍 Extracting {project_type} variables from {workflow_file}...")
+            click.echo(
+                f"📊 {result.matched}/{result.total} template lines matched "
+                f"({result.similarity:.0%})"
+            )
+            for name, value in result.variables.items():
+                if isinstance(value, list):
+                    value = ",".join(value)
+                click.echo(f"  • {name} = {value}")
+            for name, values in result.conflicts.items():
+                click.echo(f"⚠️  Conflicting values for {name}: {', '.join(values)}")
+            if result.missing:
+                click.echo(f"❌ Not found: {', '.join(result.missing)}", err=True)
+
+            if result.hunks:
+                click.echo(f"✏️  {len(result.hunks)} drift hunk(s) from the template:")
+                for hunk in result.hunks:
+                    click.echo(hunk.format())
+            else:
+                click.echo("✅ No drift from the template")
+
+    except Exception as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Cache directory (default: user cache dir or $GHA_GEN_CACHE_DIR)",
+)
+def precompile(cache_dir: str):
+    """Precompile all templates into the bytecode cache."""
+    try:
+        from .generator import WorkflowGenerator
+        from .utils import get_cache_dir
+
+        cache_path = Path(cache_dir) if cache_dir else get_cache_dir()
+        generator = WorkflowGenerator(cache_dir=cache_path)
+
+        if generator.env.bytecode_cache is None:
+            click.echo(f"❌ Error: cannot write to cache directory {cache_path}", err=True)
+            sys.exit(1)
+
+        compiled = generator.precompile()
+        click.echo(f"✅ Precompiled {len(compiled)} template(s) into {cache_path}")
+
+    except Exception as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.option("--host", default="127.0.0.1", help="Interface to bind")
+@click.option("--port", default=0, type=int, help="TCP port (0 = pick a free port)")
+@click.option("--verbose", "-v", is_flag=True, help="Log every request")
+@click.option(
+    "--reload-ttl",
+    default=2.0,
+    type=click.FloatRange(min=0),
+    help="Seconds between checks for edited templates (0 = on every use)",
+)
+@click.option(
+    "--cache-size",
+    default=400,
+    type=click.IntRange(min=1),
+    help="Number of compiled templates kept in memory",
+)
+@template_dir_option
+def serve(
+    host: str,
+    port: int,
+    verbose: bool,
+    reload_ttl: float,
+    cache_size: int,
+    template_dirs: tuple[Path, ...],
+):
+    """Run a resident generator daemon for fast create/validate calls."""
+    try:
+        from .client import default_state_path
+        from .daemon import serve as run_daemon
+
+        state_path = default_state_path()
+
+        def announce(server):
+            bound_host, bound_port = server.server_address[:2]
+            click.echo(f"🛰️  gha-gen daemon listening on http://{bound_host}:{bound_port}")
+            click.echo(f"📝 State file: {state_path}")
+
+        run_daemon(
+            host,
+            port,
+            state_path=state_path,
+            verbose=verbose,
+            ready=announce,
+            template_dirs=template_dirs,
+            reload_ttl=reload_ttl,
+            cache_size=cache_size,
+        )
+        click.echo("👋 Daemon stopped")
+
+    except Exception as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
 def main():
     """Main entry point."""
     cli()
@@ -0,0 +1,259 @@
+"""
+Matrix planning module.
+
+This module turns version lists (``python_version: ["3.11", "3.12"]``)
+into a GitHub Actions ``strategy.matrix`` block. The planner removes
+redundant input before anything is emitted: duplicate values, ``include``
+entries that repeat an existing combination, ``exclude`` entries that
+match nothing and a ``max-parallel`` that does not limit anything, so the
+generated matrix runs exactly the jobs that are needed.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Any
+
+# GitHub Actions refuses matrices generating more jobs than this
+MAX_MATRIX_JOBS = 256
+
+
+def _unique(values: Iterable[Any]) -> list[Any]:
+    """Remove duplicates, keeping the first occurrence."""
+    seen = []
+    for value in values:
+        if value not in seen:
+            seen.append(value)
+    return seen
+
+
+def _matches(combination: dict[str, Any], entry: dict[str, Any]) -> bool:
+    """Return True if every key of entry has the same value in combination."""
+    return all(combination.get(key) == value for key, value in entry.items())
+
+
+@dataclass
+class MatrixPlan:
+    """A deduplicated build matrix and its strategy options."""
+
+    axes: dict[str, list[Any]]
+    include: list[dict[str, Any]] = field(default_factory=list)
+    exclude: list[dict[str, Any]] = field(default_factory=list)
+    fail_fast: bool = True
+    max_parallel: int | None = None
+
+    def combinations(self) -> list[dict[str, Any]]:
+        """
+        List the jobs the matrix expands to.
+
+        Include entries matching expanded jobs on their axis keys add their
+        other keys to those jobs; the others become extra jobs.
+
+        Returns:
+            One mapping of matrix values per job, in GitHub's expansion order
+        """
+        keys = list(self.axes)
+        jobs = [dict(zip(keys, values, strict=True)) for values in product(*self.axes.values())]
+        jobs = [job for job in jobs if not any(_matches(job, entry) for entry in self.exclude)]
+
+        expanded = list(jobs)
+        for entry in self.include:
+            base = {key: value for key, value in entry.items() if key in self.axes}
+            matching = [job for job in expanded if _matches(job, base)]
+            for job in matching:
+                job.update(entry)
+            if not matching:
+                jobs.append(dict(entry))
+
+        return jobs
+
+    def to_strategy(self) -> dict[str, Any]:
+        """
+        Build the ``strategy`` mapping of a job.
+
+        Options equal to GitHub's defaults are left out.
+
+        Returns:
+            Mapping with ``matrix`` and, when needed, ``fail-fast`` and
+            ``max-parallel``
+        """
+        matrix: dict[str, Any] = {key: list(values) for key, values in self.axes.items()}
+        if self.include:
+            matrix["include"] = [dict(entry) for entry in self.include]
+        if self.exclude:
+            matrix["exclude"] = [dict(entry) for entry in self.exclude]
+
+        strategy: dict[str, Any] = {}
+        if not self.fail_fast:
+            strategy["fail-fast"] = False
+        if self.max_parallel is not None:
+            strategy["max-parallel"] = self.max_parallel
+        strategy["matrix"] = matrix
+
+        return strategy
+
+    def to_yaml(self, indent: int = 4) -> str:
+        """
+        Render the ``strategy`` block as YAML.
+
+        Args:
+            indent: Number of spaces before the ``strategy`` key
+
+        Returns:
+            YAML text without a trailing newline
+        """
+        from .yaml_backend import safe_dump
+
+        text = safe_dump(
+            {"strategy": self.to_strategy()},
+            default_flow_style=False,
+            sort_keys=False,
+            indent=2,
+        )
+        prefix = " " * indent
+        return "\n".join(prefix + line for line in text.splitlines())
+
+    def expression(self, axis: str) -> str:
+        """
+        Get the expression reading an axis inside the job.
+
+        Args:
+            axis: Matrix axis name (e.g. ``python-version``)
+
+        Returns:
+            GitHub Actions expression such as ``${{ matrix.python-version }}``
+        """
+        return "${{ matrix." + axis + " }}"
+
+
+def plan_matrix(
+    axes: dict[str, Iterable[Any]],
+    include: Iterable[dict[str, Any]] = (),
+    exclude: Iterable[dict[str, Any]] = (),
+    fail_fast: bool = True,
+    max_parallel: int | None = None,
+) -> MatrixPlan:
+    """
+    Plan a build matrix, dropping redundant values and entries.
+
+    Args:
+        axes: Values per matrix axis (e.g. ``{"python-version": [...]}``)
+        include: Extra combinations, or extra keys for matching ones
+        exclude: Combinations to leave out (partial entries match several)
+        fail_fast: Cancel the other jobs when one fails
+        max_parallel: Maximum number of jobs running at once
+
+    Returns:
+        MatrixPlan
+
+    Raises:
+        ValueError: If an axis is empty, an exclude entry names an unknown
+            axis, every combination is excluded, or the matrix exceeds
+            GitHub's job limit
+    """
+    axes = {key: _unique(values) for key, values in axes.items()}
+    for key, values in axes.items():
+        if not values:
+            raise ValueError(f"Matrix axis '{key}' has no values")
+
+    plan = MatrixPlan(axes=axes, fail_fast=fail_fast)
+    full = plan.combinations()
+
+    for entry in _unique(dict(entry) for entry in exclude):
+        unknown = sorted(set(entry) - set(axes))
+        if unknown:
+            raise ValueError(f"Matrix exclude uses unknown axis: {', '.join(unknown)}")
+        if any(_matches(job, entry) for job in full):
+            plan.exclude.append(entry)
+
+    remaining = plan.combinations()
+    for entry in _unique(dict(entry) for entry in include):
+        is_existing_job = (
+            set(entry) <= set(axes)
+            and len(entry) == len(axes)
+            and any(job == entry for job in remaining)
+        )
+        if not is_existing_job:
+            plan.include.append(entry)
+
+    jobs = plan.combinations()
+    if not jobs:
+        raise ValueError("Matrix excludes every combination")
+    if len(jobs) > MAX_MATRIX_JOBS:
+        raise ValueError(
+            f"Matrix expands to {len(jobs)} jobs, more than GitHub's limit of {MAX_MATRIX_JOBS}"
+        )
+
+    if max_parallel is not None:
+        if max_parallel < 1:
+            raise ValueError("max_parallel must be at least 1")
+        if max_parallel < len(jobs):
+            plan.max_parallel = max_parallel
+
+    return plan
+
+
+def apply_matrix(variables: dict[str, Any], axes: dict[str, str]) -> dict[str, Any]:
+    """
+    Plan the matrix of template variables holding version lists.
+
+    Each list-valued variable listed in ``axes`` becomes a matrix axis and
+    is replaced by the expression reading that axis, so templates keep
+    using the variable as a scalar. The plan is stored in the ``matrix``
+    variable. ``matrix_include`` and ``matrix_exclude`` entries may use
+    variable names or axis names; ``fail_fast`` and ``max_parallel``
+    control the strategy.
+
+    Args:
+        variables: Validated template variables
+        axes: Matrix axis name per variable (e.g. ``python_version`` ->
+            ``python-version``)
+
+    Returns:
+        Variables with the matrix applied (unchanged without version lists)
+
+    Raises:
+        ValueError: If the matrix options are invalid
+    """
+    lists = {name: variables[name] for name in axes if isinstance(variables.get(name), list)}
+    if not lists:
+        return variables
+
+    axis_names = set(axes.values())
+
+    def to_axes(entries: Any, option: str) -> list[dict[str, Any]]:
+        if entries is None:
+            return []
+        if not isinstance(entries, list) or not all(isinstance(e, dict) for e in entries):
+            raise ValueError(f"'{option}' must be a list of mappings")
+        return [
+            {
+                axes.get(key, key): str(value) if key in axes or key in axis_names else value
+                for key, value in entry.items()
+            }
+            for entry in entries
+        ]
+
+    max_parallel = variables.get("max_parallel")
+    try:
+        max_parallel = int(max_parallel) if max_parallel not in (None, "") else None
+    except (TypeError, ValueError):
+        raise ValueError(f"'max_parallel' must be an integer, got {max_parallel!r}") from None
+
+    fail_fast = variables.get("fail_fast", True)
+    if isinstance(fail_fast, str):
+        fail_fast = fail_fast.lower() not in ("false", "no", "0", "off")
+
+    plan = plan_matrix(
+        {axes[name]: values for name, values in lists.items()},
+        include=to_axes(variables.get("matrix_include"), "matrix_include"),
+        exclude=to_axes(variables.get("matrix_exclude"), "matrix_exclude"),
+        fail_fast=bool(fail_fast),
+        max_parallel=max_parallel,
+    )
+
+    result = dict(variables)
+    result["matrix"] = plan
+    for name in lists:
+        result[name] = plan.expression(axes[name])
+    return result
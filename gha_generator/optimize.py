@@ -0,0 +1,312 @@
+"""
+Workflow optimization module.
+
+This module rewrites rendered workflows so that jobs restore their
+dependency caches instead of downloading every package on each run. For
+each job installing pip, npm or Composer packages, an ``actions/cache``
+step keyed on the lockfile hashes is inserted before the first install
+(or an existing cache step for that ecosystem is normalized), with
+``restore-keys`` so that a lockfile change still starts from the
+previous cache. The built-in ``cache:`` option of ``setup-python`` and
+``setup-node`` is dropped in that case, so the same directory is not
+saved twice.
+
+The workflow is composed once with PyYAML to locate jobs and steps, and
+the edits are made on the text at the recorded line numbers, so the
+comments and layout of the template are kept.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Any
+
+CACHE_ACTION = "actions/cache@v4"
+
+
+@dataclass(frozen=True)
+class Ecosystem:
+    """How the packages of one package manager are cached."""
+
+    name: str
+    label: str
+    install: str
+    path: str
+    lockfiles: tuple[str, ...]
+    setup_action: str | None = None
+    version_input: str | None = None
+
+
+ECOSYSTEMS = (
+    Ecosystem(
+        name="pip",
+        label="pip packages",
+        install=r"\bpip3? install\b",
+        path="~/.cache/pip",
+        lockfiles=("**/requirements*.txt", "**/pyproject.toml"),
+        setup_action="actions/setup-python@",
+        version_input="python-version",
+    ),
+    Ecosystem(
+        name="npm",
+        label="npm packages",
+        install=r"\bnpm (ci|install|i)\b",
+        path="~/.npm",
+        lockfiles=("**/package-lock.json",),
+        setup_action="actions/setup-node@",
+    ),
+    Ecosystem(
+        name="composer",
+        label="Composer packages",
+        install=r"\bcomposer (install|update|require)\b",
+        path="${{ steps.composer-cache.outputs.dir }}",
+        lockfiles=("**/composer.lock",),
+        version_input="php-version",
+    ),
+)
+
+COMPOSER_CACHE_DIR = "composer config cache-files-dir"
+
+
+@dataclass
+class _Step:
+    """A step of a job, with its position in the workflow text."""
+
+    values: dict[str, Any]
+    start: int
+    end: int
+    indent: int
+
+    @property
+    def uses(self) -> str:
+        return self.values.get("uses") or ""
+
+    @property
+    def run(self) -> str:
+        return self.values.get("run") or ""
+
+
+def _scalar_values(node) -> dict[str, Any]:
+    """Map the keys of a mapping node to scalar values (or nested mappings)."""
+    import yaml
+
+    values: dict[str, Any] = {}
+    for key, value in node.value:
+        if not isinstance(key, yaml.ScalarNode):
+            continue
+        if isinstance(value, yaml.ScalarNode):
+            values[key.value] = value.value
+        elif isinstance(value, yaml.MappingNode):
+            values[key.value] = _scalar_values(value)
+            values[key.value]["__node__"] = value
+    return values
+
+
+def _end_line(node) -> int:
+    """Line following the last line of a node."""
+    mark = node.end_mark
+    return mark.line + (1 if mark.column > 0 else 0)
+
+
+def _job_steps(document, lines: list[str]) -> list[list[_Step]]:
+    """Find the steps of every job of a composed workflow."""
+    import yaml
+
+    if not isinstance(document, yaml.MappingNode):
+        return []
+
+    jobs = next(
+        (value for key, value in document.value if getattr(key, "value", None) == "jobs"),
+        None,
+    )
+    if not isinstance(jobs, yaml.MappingNode):
+        return []
+
+    result = []
+    for _, job in jobs.value:
+        if not isinstance(job, yaml.MappingNode):
+            continue
+        steps = next(
+            (value for key, value in job.value if getattr(key, "value", None) == "steps"),
+            None,
+        )
+        if not isinstance(steps, yaml.SequenceNode):
+            continue
+
+        items = [node for node in steps.value if isinstance(node, yaml.MappingNode)]
+        job_steps = []
+        for position, node in enumerate(items):
+            start = node.start_mark.line
+            if position + 1 < len(items):
+                end = items[position + 1].start_mark.line
+            else:
+                end = max(_end_line(value) for _, value in node.value)
+            # Leave the blank lines and comments between steps in place
+            indent = node.start_mark.column - 2
+            while end > start + 1 and (
+                not lines[end - 1].strip()
+                or (
+                    lines[end - 1].lstrip().startswith("#")
+                    and len(lines[end - 1]) - len(lines[end - 1].lstrip()) <= indent
+                )
+            ):
+                end -= 1
+            job_steps.append(_Step(_scalar_values(node), start, end, indent))
+        result.append(job_steps)
+
+    return result
+
+
+def _cache_step(
+    ecosystem: Ecosystem, indent: int, qualifiers: list[str], name: str = None
+) -> list[str]:
+    """Build the lines of an ``actions/cache`` step."""
+    prefix = "${{ runner.os }}-" + "-".join([ecosystem.name, *qualifiers])
+    files = ", ".join(f"'{pattern}'" for pattern in ecosystem.lockfiles)
+    restore = [f"{prefix}-"]
+    # Fall back to caches saved with other qualifiers (e.g. another tool list)
+    for count in range(len(qualifiers) - 1, -1, -1):
+        restore.append("${{ runner.os }}-" + "-".join([ecosystem.name, *qualifiers[:count]]) + "-")
+
+    pad = " " * indent
+    return [
+        f"{pad}- name: {name or 'Cache ' + ecosystem.label}\n",
+        f"{pad}  uses: {CACHE_ACTION}\n",
+        f"{pad}  with:\n",
+        f"{pad}    path: {ecosystem.path}\n",
+        f"{pad}    key: {prefix}-${{{{ hashFiles({files}) }}}}\n",
+        f"{pad}    restore-keys: |\n",
+        *(f"{pad}      {key}\n" for key in restore),
+    ]
+
+
+def _composer_dir_step(indent: int) -> list[str]:
+    """Build the lines of the step exposing Composer's cache directory."""
+    pad = " " * indent
+    return [
+        f"{pad}- name: Get Composer cache directory\n",
+        f"{pad}  id: composer-cache\n",
+        f'{pad}  run: echo "dir=$({COMPOSER_CACHE_DIR})" >> $GITHUB_OUTPUT\n',
+    ]
+
+
+def _qualifiers(ecosystem: Ecosystem, steps: list[_Step], pattern) -> list[str]:
+    """
+    Extra cache key parts of a job: the language version and a digest of
+    the install commands, so packages installed outside the lockfiles
+    (e.g. lint tools) get a fresh key when the command changes.
+    """
+    qualifiers = []
+
+    if ecosystem.version_input:
+        for step in steps:
+            version = (step.values.get("with") or {}).get(ecosystem.version_input)
+            if isinstance(version, str) and version:
+                qualifiers.append(version)
+                break
+
+    commands = [
+        line.strip() for step in steps for line in step.run.splitlines() if pattern.search(line)
+    ]
+    qualifiers.append(hashlib.sha256("\n".join(commands).encode("utf-8")).hexdigest()[:8])
+
+    return qualifiers
+
+
+def _is_cache_step(step: _Step, ecosystem: Ecosystem) -> bool:
+    """Return True if a step already caches the packages of an ecosystem."""
+    if not step.uses.startswith("actions/cache@"):
+        return False
+    path = (step.values.get("with") or {}).get("path") or ""
+    marker = "composer" if ecosystem.name == "composer" else ecosystem.path
+    return isinstance(path, str) and marker in path
+
+
+def _plan_job(steps: list[_Step]) -> list[tuple[int, int, list[str]]]:
+    """List the text edits (start line, end line, new lines) for one job."""
+    edits = []
+
+    for ecosystem in ECOSYSTEMS:
+        pattern = re.compile(ecosystem.install)
+        first = next((step for step in steps if pattern.search(step.run)), None)
+        if first is None:
+            continue
+
+        qualifiers = _qualifiers(ecosystem, steps, pattern)
+        existing = next((step for step in steps if _is_cache_step(step, ecosystem)), None)
+
+        if existing is not None:
+            replacement = _cache_step(
+                ecosystem, existing.indent, qualifiers, existing.values.get("name")
+            )
+            edits.append((existing.start, existing.end, replacement))
+        else:
+            new_lines = []
+            if ecosystem.name == "composer" and not any(
+                step.values.get("id") == "composer-cache"
+                and COMPOSER_CACHE_DIR in step.run
+                and step.start < first.start
+                for step in steps
+            ):
+                new_lines += _composer_dir_step(first.indent) + ["\n"]
+            new_lines += _cache_step(ecosystem, first.indent, qualifiers) + ["\n"]
+            edits.append((first.start, first.start, new_lines))
+
+        if ecosystem.setup_action is None:
+            continue
+
+        for step in steps:
+            options = step.values.get("with")
+            if not step.uses.startswith(ecosystem.setup_action) or not options:
+                continue
+            for key, value in options["__node__"].value:
+                if key.value == "cache" and value.value == ecosystem.name:
+                    line = key.start_mark.line
+                    if value.end_mark.line == line:
+                        edits.append((line, line + 1, []))
+
+    return edits
+
+
+def optimize_caching(content: str) -> str:
+    """
+    Add dependency caching to a rendered workflow.
+
+    Running it on its own output changes nothing.
+
+    Args:
+        content: Rendered workflow YAML
+
+    Returns:
+        Workflow with cache steps inserted or normalized
+
+    Raises:
+        ValueError: If the workflow is not valid YAML
+    """
+    import yaml
+
+    from .yaml_backend import get_safe_loader
+
+    try:
+        document = yaml.compose(content, Loader=get_safe_loader())
+    except yaml.YAMLError as e:
+        raise ValueError(f"Generated workflow is invalid: Invalid YAML syntax: {str(e)}") from None
+
+    lines = content.splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+        trailing_newline = False
+    else:
+        trailing_newline = True
+
+    edits = [edit for steps in _job_steps(document, lines) for edit in _plan_job(steps)]
+    if not edits:
+        return content
+
+    # Apply from the bottom up so earlier line numbers stay valid; at the
+    # same line, insertions go before the replaced line
+    for start, end, new_lines in sorted(edits, key=lambda edit: (edit[0], edit[1]), reverse=True):
+        lines[start:end] = new_lines
+
+    text = "".join(lines)
+    return text if trailing_newline else text[:-1]
@@ -0,0 +1,133 @@
+"""
+Parallel batch generation module.
+
+This module shards batch generation jobs across a process pool. Each
+worker process holds its own warmed WorkflowGenerator, and results are
+yielded back in the same order as the input jobs.
+"""
+
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any
+
+from .batch import BatchJob, BatchResult, PlanResult
+
+# Generator owned by the current worker process
+_worker_generator = None
+
+
+def _init_worker(generator_options: dict[str, Any]) -> None:
+    """
+    Create the per-process WorkflowGenerator.
+
+    Args:
+        generator_options: Keyword arguments for WorkflowGenerator
+    """
+    global _worker_generator
+
+    from .generator import WorkflowGenerator
+
+    _worker_generator = WorkflowGenerator(**generator_options)
+
+
+def _generate_chunk(
+    chunk: list[tuple[int, BatchJob]], plan: bool = False, diff: bool = False
+) -> list[BatchResult | PlanResult]:
+    """
+    Generate (or plan) a chunk of jobs in a worker process.
+
+    Args:
+        chunk: List of (index, job) pairs
+        plan: Only report what would change (see WorkflowGenerator.plan_many())
+        diff: Include unified diffs in plan results
+
+    Returns:
+        List of result objects carrying the original job indexes
+    """
+    results = []
+    jobs = [job for _, job in chunk]
+    outcomes = (
+        _worker_generator.plan_many(jobs, diff=diff)
+        if plan
+        else _worker_generator.generate_many(jobs)
+    )
+
+    for (index, _), result in zip(chunk, outcomes, strict=True):
+        result.index = index
+        results.append(result)
+
+    return results
+
+
+def resolve_workers(workers: int) -> int:
+    """
+    Resolve the number of worker processes to use.
+
+    Args:
+        workers: Requested number of workers (0 means one per CPU)
+
+    Returns:
+        Number of worker processes (at least 1)
+    """
+    if workers > 0:
+        return workers
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def generate_parallel(
+    jobs: Iterable[BatchJob],
+    workers: int,
+    chunk_size: int = None,
+    plan: bool = False,
+    diff: bool = False,
+    **generator_options: Any,
+) -> Iterator[BatchResult | PlanResult]:
+    """
+    Generate batch jobs across a pool of worker processes.
+
+    With a single worker the jobs are generated in-process, which avoids
+    the cost of spawning a pool for small batches.
+
+    Args:
+        jobs: Batch jobs to generate
+        workers: Number of worker processes (0 means one per CPU)
+        chunk_size: Number of jobs sent to a worker at a time
+            (default: spread jobs evenly, four chunks per worker)
+        plan: Only report what would change, without writing anything
+            (yields PlanResult objects)
+        diff: Include unified diffs in plan results
+        **generator_options: Keyword arguments for WorkflowGenerator
+
+    Yields:
+        BatchResult (or PlanResult) for each job, in input order
+    """
+    workers = resolve_workers(workers)
+    indexed = list(enumerate(jobs))
+
+    if workers == 1 or len(indexed) <= 1:
+        from .generator import WorkflowGenerator
+
+        generator = WorkflowGenerator(**generator_options)
+        pending = (job for _, job in indexed)
+        if plan:
+            yield from generator.plan_many(pending, diff=diff)
+        else:
+            yield from generator.generate_many(pending)
+        return
+
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(indexed) // (workers * 4)))
+
+    chunks = [indexed[i : i + chunk_size] for i in range(0, len(indexed), chunk_size)]
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        initializer=_init_worker,
+        initargs=(generator_options,),
+    ) as executor:
+        for results in executor.map(partial(_generate_chunk, plan=plan, diff=diff), chunks):
+            yield from results
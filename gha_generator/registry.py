@@ -0,0 +1,468 @@
+"""
+Template registry module.
+
+This module builds the list of available templates once from the user
+template directories, installed template packs and the bundled templates,
+and keeps it in an on-disk index so that listing and looking up templates
+does not scan directories on every invocation.
+
+Search order (the first directory providing a name wins):
+
+1. Directories passed explicitly (``--template-dir``), then those listed
+   in ``GHA_GEN_TEMPLATE_PATH`` (``os.pathsep``-separated)
+2. Template packs registered under the ``gha_generator.templates`` entry
+   point group. An entry point may resolve to a directory path, a callable
+   returning one, or a package whose directory holds the templates.
+3. The templates bundled with the package
+
+The index is rebuilt when a search directory or an import path entry
+(where packs are installed) changes; neither Jinja2 nor
+``importlib.metadata`` is imported while it is current. A registry kept in
+memory checks its directories again at most once per reload interval.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from collections.abc import Iterable
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from .utils import (
+    DEFAULT_RELOAD_TTL,
+    get_cache_dir,
+    get_template_path,
+    hash_file,
+    write_file_atomic,
+)
+
+TEMPLATE_PATH_ENV = "GHA_GEN_TEMPLATE_PATH"
+ENTRY_POINT_GROUP = "gha_generator.templates"
+
+TEMPLATE_SUFFIX = ".yml"
+
+# Templates that only exist to be extended or included
+EXCLUDED_TEMPLATES = frozenset({"base"})
+
+# Variables set by the generator itself rather than by the user
+GENERATED_VARIABLES = frozenset({"matrix"})
+
+INDEX_VERSION = 2
+
+
+def user_template_dirs() -> list[Path]:
+    """
+    Get the user template directories from the environment.
+
+    Returns:
+        Directories listed in ``GHA_GEN_TEMPLATE_PATH``, in order
+    """
+    value = os.environ.get(TEMPLATE_PATH_ENV, "")
+    return [Path(entry).expanduser() for entry in value.split(os.pathsep) if entry]
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Return the modification time of a path, or None if it is missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _fingerprint(paths) -> dict[str, int | None]:
+    """Map each path to its modification time."""
+    return {str(path): _mtime_ns(path) for path in paths}
+
+
+def _pack_directory(value: Any) -> Path:
+    """
+    Resolve a loaded template pack entry point to its directory.
+
+    Args:
+        value: Object the entry point resolved to
+
+    Returns:
+        Directory holding the pack templates
+    """
+    if callable(value):
+        value = value()
+
+    if hasattr(value, "__path__"):
+        return Path(list(value.__path__)[0])
+
+    if hasattr(value, "__file__"):
+        return Path(value.__file__).parent
+
+    return Path(value)
+
+
+def discover_template_packs() -> list[Path]:
+    """
+    Find template packs registered by installed distributions.
+
+    Packs that fail to load are skipped.
+
+    Returns:
+        Pack directories, sorted by entry point name
+    """
+    from importlib.metadata import entry_points
+
+    directories = []
+
+    for entry_point in sorted(entry_points(group=ENTRY_POINT_GROUP), key=lambda ep: ep.name):
+        try:
+            directories.append(_pack_directory(entry_point.load()))
+        except Exception:
+            continue
+
+    return directories
+
+
+def default_index_path(user_dirs: list[Path]) -> Path:
+    """
+    Get the registry index location for a set of user template directories.
+
+    Args:
+        user_dirs: User template directories
+
+    Returns:
+        Path of the index file inside the user cache directory
+    """
+    key = hashlib.sha1(
+        os.pathsep.join(os.path.abspath(path) for path in user_dirs).encode("utf-8")
+    ).hexdigest()
+    return get_cache_dir() / "templates" / f"{key[:16]}.json"
+
+
+class TemplateRegistry:
+    """
+    Index of available templates, keyed by name.
+
+    Each entry records the template file, the directory it comes from,
+    its size, modification time and content hash. Required variables are
+    extracted with Jinja2 the first time they are asked for and then
+    stored in the index as well.
+    """
+
+    def __init__(self, user_dirs: list[Path] = None, index_path: Path = None):
+        """
+        Initialize the registry, loading or rebuilding its index.
+
+        Args:
+            user_dirs: User template directories (defaults to
+                ``GHA_GEN_TEMPLATE_PATH``)
+            index_path: Index file (defaults to one in the user cache dir)
+        """
+        self.user_dirs = user_template_dirs() if user_dirs is None else list(user_dirs)
+        self.bundled_dir = get_template_path()
+        self.index_path = index_path or default_index_path(self.user_dirs)
+        self.search_path: list[Path] = []
+        self.templates: dict[str, dict[str, Any]] = {}
+        self._dirs: dict[str, int | None] = {}
+        self._checked = time.monotonic()
+        self._dirty = False
+        self._load()
+
+    def _inputs(self) -> dict[str, Any]:
+        """Describe what the pack discovery depends on."""
+        from . import __version__
+
+        return {
+            "version": INDEX_VERSION,
+            "package": __version__,
+            "user_dirs": [str(path) for path in self.user_dirs],
+            "bundled": str(self.bundled_dir),
+            "sys_path": _fingerprint(entry for entry in sys.path if entry),
+        }
+
+    def _load(self) -> None:
+        """Load the index from disk, rebuilding it if it is stale."""
+        self._index_inputs = self._inputs()
+
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if data["inputs"] == self._index_inputs and data["dirs"] == _fingerprint(
+                Path(path) for path in data["search_path"]
+            ):
+                self.search_path = [Path(path) for path in data["search_path"]]
+                self.templates = data["templates"]
+                self._dirs = data["dirs"]
+                return
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        self._rebuild()
+
+    def refresh(self) -> None:
+        """Rescan every template directory and save the index."""
+        self._index_inputs = self._inputs()
+        self._rebuild()
+
+    def reload_if_stale(self, reload_ttl: float = DEFAULT_RELOAD_TTL) -> None:
+        """
+        Rescan the template directories if one of them changed.
+
+        Adding, removing or renaming a template changes the modification
+        time of its directory. The directories are only stat'ed again once
+        ``reload_ttl`` seconds have passed since the previous check.
+
+        Args:
+            reload_ttl: Seconds between checks (0 checks every time)
+        """
+        now = time.monotonic()
+        if now - self._checked < reload_ttl:
+            return
+
+        self._checked = now
+        if _fingerprint(self.search_path) != self._dirs:
+            self.refresh()
+
+    def _rebuild(self) -> None:
+        """Rebuild the index from the template directories."""
+        self.search_path = [*self.user_dirs, *discover_template_packs(), self.bundled_dir]
+        self.templates = {}
+
+        for directory in self.search_path:
+            if not directory.is_dir():
+                continue
+
+            for file in sorted(directory.glob(f"*{TEMPLATE_SUFFIX}")):
+                name = file.stem
+                if name in EXCLUDED_TEMPLATES or name in self.templates:
+                    continue
+
+                try:
+                    stat = file.stat()
+                    sha256 = hash_file(file)
+                except OSError:
+                    continue
+
+                self.templates[name] = {
+                    "path": str(file),
+                    "directory": str(directory),
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "sha256": sha256,
+                    "variables": None,
+                }
+
+        self._dirs = _fingerprint(self.search_path)
+        self._dirty = True
+        self.save()
+
+    def save(self) -> None:
+        """Write the index to disk if it changed, ignoring an unwritable location."""
+        if not self._dirty:
+            return
+
+        data = json.dumps(
+            {
+                "inputs": self._index_inputs,
+                "search_path": [str(path) for path in self.search_path],
+                "dirs": self._dirs,
+                "templates": self.templates,
+            },
+            sort_keys=True,
+        )
+
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            write_file_atomic(self.index_path, data.encode("utf-8"))
+            self._dirty = False
+        except OSError:
+            pass
+
+    def __contains__(self, name: str) -> bool:
+        """Return True if a template with this name exists."""
+        return name in self.templates
+
+    def names(self) -> list[str]:
+        """
+        List template names.
+
+        Returns:
+            Sorted list of template names (without .yml extension)
+        """
+        return sorted(self.templates)
+
+    def _require(self, name: str) -> dict[str, Any]:
+        """
+        Get the index entry of a template.
+
+        Raises:
+            ValueError: If the template does not exist
+        """
+        entry = self.templates.get(name)
+        if entry is None:
+            raise ValueError(
+                f"Template '{name}' not found. Available templates: {', '.join(self.names())}"
+            )
+        return entry
+
+    def _entry(self, name: str) -> dict[str, Any]:
+        """
+        Get the index entry of a template, refreshing it if the file changed.
+
+        Raises:
+            ValueError: If the template does not exist
+        """
+        entry = self._require(name)
+
+        path = Path(entry["path"])
+        stat = path.stat()
+        if (stat.st_size, stat.st_mtime_ns) != (entry["size"], entry["mtime_ns"]):
+            entry.update(
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                sha256=hash_file(path),
+                variables=None,
+            )
+            self._dirty = True
+
+        return entry
+
+    def path(self, name: str) -> Path:
+        """
+        Get the file of a template.
+
+        Args:
+            name: Template name
+
+        Returns:
+            Path of the template file
+
+        Raises:
+            ValueError: If the template does not exist
+        """
+        return Path(self._require(name)["path"])
+
+    def origin(self, name: str) -> str:
+        """
+        Describe where a template comes from.
+
+        Args:
+            name: Template name
+
+        Returns:
+            "bundled", "user" or "pack"
+
+        Raises:
+            ValueError: If the template does not exist
+        """
+        directory = Path(self._require(name)["directory"])
+        if directory == self.bundled_dir:
+            return "bundled"
+        if directory in self.user_dirs:
+            return "user"
+        return "pack"
+
+    def content_hash(self, name: str) -> str:
+        """
+        Get the SHA-256 of a template file.
+
+        Args:
+            name: Template name
+
+        Returns:
+            Hex digest of the template source
+
+        Raises:
+            ValueError: If the template does not exist
+        """
+        entry = self._entry(name)
+        self.save()
+        return entry["sha256"]
+
+    def _find_source(self, template_file: str) -> Path | None:
+        """Find a template file (e.g. ``partials/checkout.yml``) on the search path."""
+        for directory in self.search_path:
+            candidate = directory / template_file
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def _collect_variables(self, path: Path, seen: set[Path]) -> set[str]:
+        """
+        Collect required variables of a template and the templates it references.
+
+        Variables only ever used through the ``default`` filter are optional
+        and left out, as are variables the generator sets itself.
+        """
+        from jinja2 import Environment, meta, nodes
+
+        seen.add(path)
+        ast = Environment().parse(path.read_text(encoding="utf-8"))
+
+        loads: dict[str, int] = {}
+        for node in ast.find_all(nodes.Name):
+            if node.ctx == "load":
+                loads[node.name] = loads.get(node.name, 0) + 1
+        for node in ast.find_all(nodes.Filter):
+            if node.name == "default" and isinstance(node.node, nodes.Name):
+                loads[node.node.name] -= 1
+
+        variables = {
+            name
+            for name in meta.find_undeclared_variables(ast)
+            if loads.get(name, 1) > 0 and name not in GENERATED_VARIABLES
+        }
+
+        for reference in meta.find_referenced_templates(ast):
+            source = self._find_source(reference) if reference else None
+            if source is not None and source not in seen:
+                variables |= self._collect_variables(source, seen)
+
+        return variables
+
+    def required_variables(self, name: str) -> list[str]:
+        """
+        Get the variables a template uses without defining them.
+
+        Templates it extends or includes are followed, so variables used in
+        ``base.yml`` or a partial are reported as well.
+
+        Args:
+            name: Template name
+
+        Returns:
+            Sorted list of variable names
+
+        Raises:
+            ValueError: If the template does not exist
+        """
+        entry = self._entry(name)
+
+        if entry["variables"] is None:
+            entry["variables"] = sorted(self._collect_variables(Path(entry["path"]), set()))
+            self._dirty = True
+
+        self.save()
+        return entry["variables"]
+
+
+@cache
+def _get_registry(user_dirs: tuple[Path, ...]) -> TemplateRegistry:
+    """Create the registry for a set of user template directories."""
+    return TemplateRegistry(list(user_dirs))
+
+
+def get_registry(template_dirs: Iterable[Path] = ()) -> TemplateRegistry:
+    """
+    Get the shared registry for a set of template directories.
+
+    The registry is rescanned if its directories changed since it was
+    created (checked at most once per ``DEFAULT_RELOAD_TTL``).
+
+    Args:
+        template_dirs: Extra template directories, searched before those
+            from ``GHA_GEN_TEMPLATE_PATH``
+
+    Returns:
+        TemplateRegistry instance
+    """
+    registry = _get_registry((*map(Path, template_dirs), *user_template_dirs()))
+    registry.reload_if_stale()
+    return registry
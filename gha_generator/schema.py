@@ -0,0 +1,220 @@
+"""
+Template variable schema module.
+
+This module describes the variables each template expects (required keys,
+defaults and allowed value patterns) and compiles these descriptions into
+validators that run before rendering, so bad input is rejected without
+paying for a render and a YAML parse.
+
+Bundled templates have an explicit schema. Other templates (user
+directories, packs, or overrides of bundled names) get one derived from
+the variables the registry finds in their source: known variables keep
+their usual rules, unknown ones only need to be present.
+"""
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .utils import validate_project_name
+
+
+@dataclass(frozen=True)
+class Field:
+    """Rules for a single template variable."""
+
+    name: str
+    required: bool = True
+    default: str | None = None
+    pattern: str | None = None
+    hint: str = ""
+    check: Callable[[str], tuple[bool, str]] | None = None
+    matrix: str | None = None
+
+
+FIELDS = {
+    "project_name": Field("project_name", check=validate_project_name),
+    "python_version": Field(
+        "python_version",
+        matrix="python-version",
+        default="3.11",
+        pattern=r"3\.\d{1,2}(\.\d+)?",
+        hint="a Python 3 version such as '3.11'",
+    ),
+    "php_version": Field(
+        "php_version",
+        matrix="php-version",
+        default="8.2",
+        pattern=r"[5-8]\.\d(\.\d+)?",
+        hint="a PHP version such as '8.2'",
+    ),
+    "node_version": Field(
+        "node_version",
+        matrix="node-version",
+        default="18",
+        pattern=r"\d{1,2}(\.(\d+|x)){0,2}|lts/\*",
+        hint="a Node.js version such as '20' or 'lts/*'",
+    ),
+}
+
+TEMPLATE_SCHEMAS = {
+    "data-science": ("project_name", "python_version"),
+    "django-api": ("project_name", "python_version"),
+    "laravel-api": ("project_name", "php_version"),
+    "react-app": ("project_name", "node_version"),
+}
+
+
+class VariableValidator:
+    """
+    Compiled validator for the variables of one template.
+
+    Patterns are compiled once; calling the validator only runs dict
+    lookups, type checks and regex matches.
+    """
+
+    def __init__(self, template: str, fields: list[Field]):
+        """
+        Compile the validator.
+
+        Args:
+            template: Template name (for error messages)
+            fields: Rules for each variable of the template
+        """
+        self.template = template
+        self.fields = fields
+        self._rules = [
+            (field, re.compile(field.pattern).fullmatch if field.pattern else None)
+            for field in fields
+        ]
+
+    @property
+    def names(self) -> list[str]:
+        """Names of the variables the template uses."""
+        return [field.name for field in self.fields]
+
+    @property
+    def matrix_axes(self) -> dict[str, str]:
+        """Matrix axis name of each variable that accepts a version list."""
+        return {field.name: field.matrix for field in self.fields if field.matrix}
+
+    def __call__(self, variables: dict[str, Any]) -> dict[str, Any]:
+        """
+        Validate and normalize template variables.
+
+        Missing optional variables get their default and integer values of
+        constrained variables are converted to strings. Version variables
+        may be lists (each item is checked, duplicates are dropped and a
+        single item becomes a scalar). Variables without rules only need to
+        be present, and variables outside the schema are passed through.
+
+        Args:
+            variables: Variables to check
+
+        Returns:
+            Normalized copy of the variables
+
+        Raises:
+            ValueError: Listing every invalid variable
+        """
+        normalized = dict(variables)
+        errors = []
+
+        for field, match in self._rules:
+            value = normalized.get(field.name)
+
+            if value is None or value == "":
+                if field.default is not None:
+                    normalized[field.name] = field.default
+                elif field.required:
+                    errors.append(f"'{field.name}' is required")
+                continue
+
+            if match is None and field.check is None:
+                continue
+
+            if field.matrix is not None and isinstance(value, list):
+                values = []
+                for item in value:
+                    item = self._check_value(field, match, item, errors)
+                    if item is not None and item not in values:
+                        values.append(item)
+                if not value:
+                    errors.append(f"'{field.name}' must not be an empty list")
+                normalized[field.name] = values[0] if len(values) == 1 else values
+                continue
+
+            normalized[field.name] = self._check_value(field, match, value, errors)
+
+        if errors:
+            raise ValueError(
+                f"Invalid variables for template '{self.template}': {'; '.join(errors)}"
+            )
+
+        return normalized
+
+    @staticmethod
+    def _check_value(field: Field, match, value: Any, errors: list[str]) -> str | None:
+        """Check one scalar value, recording problems in errors."""
+        if isinstance(value, bool) or not isinstance(value, str | int):
+            if isinstance(value, float):
+                # The YAML scalar was already read as a float (3.10 -> 3.1),
+                # so the hint cannot quote the value the user wrote
+                errors.append(
+                    f"'{field.name}' must be a string, got {value!r} "
+                    '(quote versions in YAML, e.g. "3.10")'
+                )
+            else:
+                errors.append(f"'{field.name}' must be a string, got {value!r}")
+            return None
+
+        value = str(value)
+
+        if match is not None and not match(value):
+            errors.append(f"'{field.name}' must be {field.hint}, got {value!r}")
+        elif field.check is not None:
+            is_valid, message = field.check(value)
+            if not is_valid:
+                errors.append(f"'{field.name}': {message}")
+
+        return value
+
+
+def schema_fields(template: str, registry) -> list[Field]:
+    """
+    Get the variable rules of a template.
+
+    Args:
+        template: Template name
+        registry: TemplateRegistry the template comes from
+
+    Returns:
+        List of Field rules
+
+    Raises:
+        ValueError: If the template does not exist
+    """
+    if template in TEMPLATE_SCHEMAS and registry.origin(template) == "bundled":
+        names = TEMPLATE_SCHEMAS[template]
+    else:
+        names = registry.required_variables(template)
+
+    return [FIELDS.get(name, Field(name)) for name in names]
+
+
+def compile_validator(template: str, registry) -> VariableValidator:
+    """
+    Compile the variable validator of a template.
+
+    Args:
+        template: Template name
+        registry: TemplateRegistry the template comes from
+
+    Returns:
+        VariableValidator for the template
+
+    Raises:
+        ValueError: If the template does not exist
+    """
+    return VariableValidator(template, schema_fields(template, registry))
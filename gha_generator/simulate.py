@@ -0,0 +1,394 @@
+"""
+Workflow run simulation module.
+
+This module estimates what a workflow costs to run: it replays the job
+graph (see analysis.build_graph()) as a discrete-event simulation over a
+pool of runners and reports the wall-clock time, the runner time and
+billable minutes, and how long jobs waited for a free runner.
+
+Step durations come from a profile built from past runs, falling back to
+the analyzer's estimates for steps the profile does not know. Several
+runs may be started at a fixed interval, e.g. to see how a template
+change behaves when many repositories push at once on a shared pool.
+
+Profiles are JSON files in one of two formats:
+
+- Durations in seconds per job and step::
+
+      {"test": {"Set up Python 3.11": 12, "Run tests with pytest": 240},
+       "deploy": 95}
+
+  A number instead of a mapping gives the whole job's duration, and the
+  ``"overhead"`` key inside a mapping adds per-job setup/teardown time.
+
+- Responses of GitHub's "list jobs for a workflow run" API (``{"jobs":
+  [...]}``, or a list of them for several runs). Step times are taken
+  from ``started_at``/``completed_at``; the runner's own ``Set up job``,
+  ``Complete job`` and ``Post ...`` steps become the overhead, matrix
+  jobs (``test (3.11)``) are merged with their job, and the median of
+  all samples is used.
+"""
+
+import heapq
+import math
+import re
+import statistics
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .analysis import JobNode, build_graph, find_cycles
+
+# Concurrent jobs allowed on GitHub-hosted runners for free accounts
+DEFAULT_RUNNERS = 20
+
+OVERHEAD_KEY = "overhead"
+
+# Steps GitHub adds around the workflow's own steps
+RUNNER_STEP_PATTERN = re.compile(r"^(Set up job|Complete job|Post .*)$")
+
+# Suffix GitHub adds to matrix job names, e.g. ``test (3.11, ubuntu)``
+MATRIX_SUFFIX_PATTERN = re.compile(r"\s+\([^()]*\)$")
+
+
+@dataclass
+class JobProfile:
+    """Measured durations of one job, in seconds."""
+
+    duration: float | None = None
+    steps: dict[str, float] = field(default_factory=dict)
+    overhead: float = 0.0
+
+
+@dataclass
+class JobStats:
+    """Simulated figures for one job, over all its instances and runs."""
+
+    instances: int = 0
+    duration: float = 0.0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    @property
+    def wait_mean(self) -> float:
+        """Average time an instance waited for a runner."""
+        return self.wait_total / self.instances if self.instances else 0.0
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of a simulation."""
+
+    runners: int
+    wall_clock: float
+    run_durations: list[float]
+    runner_seconds: float
+    billable_minutes: int
+    queue_total: float
+    queue_max: float
+    peak_runners: int
+    jobs: dict[str, JobStats]
+
+    @property
+    def utilization(self) -> float:
+        """Share of the pool's capacity used while the simulation ran."""
+        capacity = self.runners * self.wall_clock
+        return self.runner_seconds / capacity if capacity else 0.0
+
+
+def _parse_time(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp as returned by the GitHub API."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _elapsed(entry: dict[str, Any]) -> float | None:
+    """Seconds between started_at and completed_at, if both are set."""
+    try:
+        started = _parse_time(entry["started_at"])
+        completed = _parse_time(entry["completed_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return max((completed - started).total_seconds(), 0.0)
+
+
+def _profile_from_api(payloads: list[dict[str, Any]]) -> dict[str, JobProfile]:
+    """Build job profiles from GitHub "list jobs for a workflow run" responses."""
+    samples: dict[str, dict[str, Any]] = {}
+
+    for payload in payloads:
+        for job in payload.get("jobs") or []:
+            name = MATRIX_SUFFIX_PATTERN.sub("", str(job.get("name", "")))
+            job_samples = samples.setdefault(name, {"steps": {}, "overhead": []})
+
+            overhead = 0.0
+            for step in job.get("steps") or []:
+                seconds = _elapsed(step)
+                if seconds is None:
+                    continue
+                if RUNNER_STEP_PATTERN.match(str(step.get("name", ""))):
+                    overhead += seconds
+                else:
+                    job_samples["steps"].setdefault(str(step.get("name")), []).append(seconds)
+            job_samples["overhead"].append(overhead)
+
+    return {
+        name: JobProfile(
+            steps={step: statistics.median(values) for step, values in job["steps"].items()},
+            overhead=statistics.median(job["overhead"]) if job["overhead"] else 0.0,
+        )
+        for name, job in samples.items()
+    }
+
+
+def _profile_from_mapping(data: dict[str, Any]) -> dict[str, JobProfile]:
+    """Build job profiles from seconds per job and step."""
+    profiles = {}
+
+    for name, value in data.items():
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            profiles[str(name)] = JobProfile(duration=float(value))
+            continue
+
+        if not isinstance(value, dict) or not all(
+            isinstance(seconds, int | float) and not isinstance(seconds, bool)
+            for seconds in value.values()
+        ):
+            raise ValueError(f"job '{name}' must map to seconds or to seconds per step")
+
+        steps = {str(step): float(seconds) for step, seconds in value.items()}
+        profiles[str(name)] = JobProfile(steps=steps, overhead=steps.pop(OVERHEAD_KEY, 0.0))
+
+    return profiles
+
+
+def load_profile(path: Path) -> dict[str, JobProfile]:
+    """
+    Load a duration profile.
+
+    Args:
+        path: JSON profile (see the module documentation for the formats)
+
+    Returns:
+        JobProfile per job name
+
+    Raises:
+        ValueError: If the file is not a valid profile
+    """
+    import json
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError as e:
+        raise ValueError(f"Invalid profile {path}: {str(e)}") from None
+
+    try:
+        if isinstance(data, list):
+            return _profile_from_api(data)
+        if isinstance(data, dict) and isinstance(data.get("jobs"), list):
+            return _profile_from_api([data])
+        if isinstance(data, dict):
+            return _profile_from_mapping(data)
+    except ValueError as e:
+        raise ValueError(f"Invalid profile {path}: {str(e)}") from None
+
+    raise ValueError(f"Invalid profile {path}: expected a JSON object or list")
+
+
+def _job_profile(
+    name: str, workflow_job: dict[str, Any], profiles: dict[str, JobProfile]
+) -> JobProfile | None:
+    """Find the profile of a job by its id or its display name."""
+    if name in profiles:
+        return profiles[name]
+
+    display_name = workflow_job.get("name") if isinstance(workflow_job, dict) else None
+    if isinstance(display_name, str):
+        # Display names may contain expressions, e.g. ``Test ${{ matrix.python }}``
+        display_name = MATRIX_SUFFIX_PATTERN.sub("", display_name.split("${{")[0].strip())
+        return profiles.get(display_name)
+
+    return None
+
+
+def apply_profile(
+    graph: dict[str, JobNode], workflow: dict[str, Any], profiles: dict[str, JobProfile]
+) -> None:
+    """
+    Replace estimated job durations with profiled ones where known.
+
+    A step is looked up by its name, then by the name GitHub gives unnamed
+    steps (``Run <command or action>``); unknown steps keep their estimate.
+
+    Args:
+        graph: Jobs keyed by name (updated in place)
+        workflow: Workflow mapping the graph was built from
+        profiles: JobProfile per job name
+    """
+    jobs = workflow.get("jobs") or {}
+
+    for name, job in graph.items():
+        profile = _job_profile(name, jobs.get(name), profiles)
+        if profile is None:
+            continue
+
+        if profile.duration is not None:
+            job.duration = profile.duration
+            continue
+
+        # Time the estimate adds on top of the steps (e.g. service startup)
+        extra = job.duration - sum(step.duration for step in job.steps)
+        for step in job.steps:
+            for candidate in (step.name, f"Run {step.name}"):
+                if candidate in profile.steps:
+                    step.duration = profile.steps[candidate]
+                    break
+
+        job.duration = profile.overhead + extra + sum(step.duration for step in job.steps)
+
+
+def simulate(
+    workflow: dict[str, Any],
+    profiles: dict[str, JobProfile] = None,
+    runners: int = DEFAULT_RUNNERS,
+    runs: int = 1,
+    interval: float = 0.0,
+) -> SimulationResult:
+    """
+    Simulate runs of a workflow on a pool of runners.
+
+    Each matrix instance needs a runner for the whole job. Ready jobs are
+    started first come, first served, within the job's ``max-parallel``.
+    Every run is triggered ``interval`` seconds after the previous one.
+
+    Args:
+        workflow: Workflow mapping (see analysis.load_workflow())
+        profiles: Measured durations (see load_profile()); missing jobs
+            and steps use the analyzer's estimates
+        runners: Number of runners in the pool
+        runs: Number of workflow runs
+        interval: Seconds between the triggers of two runs
+
+    Returns:
+        SimulationResult
+
+    Raises:
+        ValueError: If the options are invalid, or the job graph has a
+            cycle or needs a missing job
+    """
+    if runners < 1:
+        raise ValueError("runners must be at least 1")
+    if runs < 1:
+        raise ValueError("runs must be at least 1")
+    if interval < 0:
+        raise ValueError("interval must not be negative")
+
+    graph = build_graph(workflow)
+    cycles = find_cycles(graph)
+    if cycles:
+        raise ValueError(f"Job graph has a cycle: {' → '.join(cycles[0])}")
+    for name, job in graph.items():
+        for need in job.needs:
+            if need not in graph:
+                raise ValueError(f"Job '{name}' needs unknown job '{need}'")
+
+    if profiles:
+        apply_profile(graph, workflow, profiles)
+
+    keys = [(run, name) for run in range(runs) for name in graph]
+    # Per run and job: needs not yet finished, and instances not yet
+    # queued, queued, running and not yet finished
+    waiting = {key: set(graph[key[1]].needs) for key in keys}
+    unqueued = {key: graph[key[1]].instances for key in keys}
+    queued = dict.fromkeys(keys, 0)
+    running = dict.fromkeys(keys, 0)
+    unfinished = dict(unqueued)
+
+    # Events are (time, priority, sequence, run, job); at equal times
+    # completions (priority 0) free their runner before triggers (1) are
+    # handled, and the sequence keeps the rest in insertion order
+    events: list[tuple[float, int, int, int, str | None]] = []
+    sequence = 0
+
+    def push(time: float, run: int, name: str = None) -> None:
+        nonlocal sequence
+        sequence += 1
+        heapq.heappush(events, (time, 1 if name is None else 0, sequence, run, name))
+
+    def release(key: tuple[int, str], now: float) -> None:
+        """Queue the instances of a ready job allowed by its max-parallel."""
+        limit = graph[key[1]].max_parallel
+        while unqueued[key] and running[key] + queued[key] < limit:
+            unqueued[key] -= 1
+            queued[key] += 1
+            queue.append((now, key))
+
+    queue: deque[tuple[float, tuple[int, str]]] = deque()
+    free = runners
+    peak = 0
+    stats = {name: JobStats() for name in graph}
+    run_start = [run * interval for run in range(runs)]
+    run_end = list(run_start)
+    runner_seconds = 0.0
+    billable = 0
+
+    for run in range(runs):
+        push(run_start[run], run)
+
+    while events:
+        now, _, _, run, name = heapq.heappop(events)
+
+        if name is None:
+            for job_name in graph:
+                if not waiting[(run, job_name)]:
+                    release((run, job_name), now)
+        else:
+            key = (run, name)
+            free += 1
+            running[key] -= 1
+            unfinished[key] -= 1
+            release(key, now)
+            if not unfinished[key]:
+                run_end[run] = max(run_end[run], now)
+                for other in graph:
+                    needs = waiting[(run, other)]
+                    if name in needs:
+                        needs.discard(name)
+                        if not needs:
+                            release((run, other), now)
+
+        while free and queue:
+            queued_at, key = queue.popleft()
+            job = graph[key[1]]
+            wait = now - queued_at
+            free -= 1
+            queued[key] -= 1
+            running[key] += 1
+            peak = max(peak, runners - free)
+
+            job_stats = stats[key[1]]
+            job_stats.instances += 1
+            job_stats.duration = job.duration
+            job_stats.wait_total += wait
+            job_stats.wait_max = max(job_stats.wait_max, wait)
+
+            runner_seconds += job.duration
+            # GitHub bills each job rounded up to the whole minute
+            billable += math.ceil(job.duration / 60)
+            push(now + job.duration, key[0], key[1])
+
+    run_durations = [end - start for start, end in zip(run_start, run_end, strict=True)]
+    queue_total = sum(job.wait_total for job in stats.values())
+
+    return SimulationResult(
+        runners=runners,
+        wall_clock=max(run_end),
+        run_durations=run_durations,
+        runner_seconds=runner_seconds,
+        billable_minutes=billable,
+        queue_total=queue_total,
+        queue_max=max((job.wait_max for job in stats.values()), default=0.0),
+        peak_runners=peak,
+        jobs=stats,
+    )
@@ -5,9 +5,16 @@ This module provides helper functions for file operations,
 validation, and other common tasks.
 """
 
+import hashlib
+import os
+import uuid
 from pathlib import Path
 
-import yaml
+CACHE_DIR_ENV = "GHA_GEN_CACHE_DIR"
+
+# Seconds between two freshness checks of the same template or template
+# directory
+DEFAULT_RELOAD_TTL = 2.0
 
 
 def get_template_path() -> Path:
@@ -22,6 +29,32 @@ def get_template_path() -> Path:
     return templates_dir
 
 
+def get_cache_dir() -> Path:
+    """
+    Get the user cache directory for GitHub Actions Generator.
+
+    The ``GHA_GEN_CACHE_DIR`` environment variable takes precedence,
+    then ``XDG_CACHE_HOME`` (or ``LOCALAPPDATA`` on Windows), falling
+    back to ``~/.cache``.
+
+    Returns:
+        Path to the cache directory (not created)
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME")
+
+    if not base:
+        base = Path.home() / ".cache"
+
+    return Path(base) / "gha-gen"
+
+
 def check_github_folder(base_path: Path = None) -> tuple[bool, str]:
     """
     Check if .github/workflows directory exists.
@@ -59,22 +92,222 @@ def create_directory_safe(directory: Path) -> None:
         raise OSError(f"Failed to create directory {directory}: {str(e)}") from e
 
 
-def validate_yaml(file_path: Path) -> tuple[bool, str]:
+def file_has_content(file_path: Path, data: bytes) -> bool:
+    """
+    Check whether a file already holds exactly the given bytes.
+
+    The size is compared first, so differing files are usually detected
+    from a single stat call without reading them.
+
+    Args:
+        file_path: Path to the file
+        data: Expected file content
+
+    Returns:
+        True if the file exists and its content equals data
+    """
+    try:
+        if file_path.stat().st_size != len(data):
+            return False
+        return file_path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def unified_diff(file_path: Path, old: bytes, new: bytes) -> str:
+    """
+    Build a git-style unified diff between two versions of a file.
+
+    Args:
+        file_path: Path shown in the diff headers
+        old: Current content (empty for a new file)
+        new: Planned content
+
+    Returns:
+        Unified diff text (empty if the contents are equal)
+    """
+    import difflib
+
+    old_lines = old.decode("utf-8", errors="replace").splitlines(keepends=True)
+    new_lines = new.decode("utf-8", errors="replace").splitlines(keepends=True)
+    label = file_path.as_posix().lstrip("/")
+    lines = difflib.unified_diff(
+        old_lines,
+        new_lines,
+        fromfile=f"a/{label}" if old else "/dev/null",
+        tofile=f"b/{label}",
+    )
+    # Keep lines without a trailing newline on their own line
+    return "".join(line if line.endswith("\n") else line + "\n" for line in lines)
+
+
+def fsync_directory(directory: Path) -> None:
+    """
+    Flush a directory entry to disk so that renames inside it are durable.
+
+    Args:
+        directory: Directory to flush (ignored where unsupported)
+    """
+    if os.name == "nt":
+        return
+
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class AtomicWriter:
+    """
+    Binary writer that replaces its target file atomically.
+
+    Data goes to a temporary file in the target's directory; commit()
+    renames it over the target, so readers never see a partially written
+    file. The temporary file is created with the default permissions
+    (subject to umask); an existing target keeps its permissions.
+    Leaving the context without committing discards the temporary file.
+    """
+
+    def __init__(self, file_path: Path, fsync: bool = False):
+        """
+        Open the temporary file.
+
+        Args:
+            file_path: Path of the file to replace
+            fsync: Flush the data to disk before replacing the target
+
+        Raises:
+            OSError: If the temporary file cannot be created
+        """
+        self.file_path = file_path
+        self.fsync = fsync
+        self.tmp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.tmp")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        self._file = os.fdopen(os.open(self.tmp_path, flags, 0o666), "wb")
+        self.size = 0
+
+    def __enter__(self) -> "AtomicWriter":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Discard the temporary file unless it was committed."""
+        self.discard()
+
+    def write(self, data: bytes) -> None:
+        """
+        Append data to the temporary file.
+
+        Args:
+            data: Bytes to write
+        """
+        self._file.write(data)
+        self.size += len(data)
+
+    def commit(self) -> None:
+        """
+        Replace the target with the written data.
+
+        Raises:
+            OSError: If the target cannot be replaced
+        """
+        if self.fsync:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._file.close()
+
+        try:
+            os.chmod(self.tmp_path, self.file_path.stat().st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+
+        os.replace(self.tmp_path, self.file_path)
+        self.tmp_path = None
+
+    def discard(self) -> None:
+        """Remove the temporary file if it has not been committed."""
+        if self.tmp_path is None:
+            return
+
+        self._file.close()
+        try:
+            os.unlink(self.tmp_path)
+        except OSError:
+            pass
+        self.tmp_path = None
+
+
+def hash_file(file_path: Path) -> str:
+    """
+    Compute the SHA-256 digest of a file, reading it in blocks.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest of the file content
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def write_file_atomic(file_path: Path, data: bytes, fsync: bool = False) -> bool:
+    """
+    Write a file atomically, skipping the write if the content is unchanged.
+
+    Args:
+        file_path: Path of the file to write
+        data: Content to write
+        fsync: Flush the file to disk before replacing the target
+
+    Returns:
+        True if the file was written, False if it was already up to date
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    if file_has_content(file_path, data):
+        return False
+
+    with AtomicWriter(file_path, fsync=fsync) as writer:
+        writer.write(data)
+        writer.commit()
+
+    return True
+
+
+def validate_yaml(file_path: Path, structural: bool = False) -> tuple[bool, str]:
     """
     Validate YAML file syntax.
 
     Args:
         file_path: Path to YAML file
+        structural: Only check well-formedness from the parser event
+            stream, without constructing Python objects
 
     Returns:
         Tuple of (is_valid: bool, message: str)
     """
+    import yaml
+
+    from .yaml_backend import check_structure, safe_load
+
     try:
         if not file_path.exists():
             return False, f"File not found: {file_path}"
 
         with open(file_path, encoding="utf-8") as f:
-            yaml.safe_load(f)
+            if structural:
+                check_structure(f)
+            else:
+                safe_load(f)
 
         return True, f"Valid YAML file: {file_path.name}"
 
@@ -161,9 +394,11 @@ def read_yaml_file(file_path: Path) -> dict | None:
     Returns:
         Parsed YAML content as dictionary, or None if error
     """
+    from .yaml_backend import safe_load
+
     try:
         with open(file_path, encoding="utf-8") as f:
-            return yaml.safe_load(f)
+            return safe_load(f)
     except Exception as e:
         print(f"Error reading YAML file: {str(e)}")
         return None
@@ -180,9 +415,11 @@ def write_yaml_file(file_path: Path, content: dict) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    from .yaml_backend import safe_dump
+
     try:
         with open(file_path, "w", encoding="utf-8") as f:
-            yaml.dump(content, f, default_flow_style=False, sort_keys=False)
+            safe_dump(content, f, default_flow_style=False, sort_keys=False)
         return True
     except Exception as e:
         print(f"Error writing YAML file: {str(e)}")
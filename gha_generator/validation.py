@@ -0,0 +1,362 @@
+"""
+Bulk validation module.
+
+This module finds workflow files in a directory tree or glob pattern,
+validates them concurrently with utils.validate_yaml() (or lints them
+with lint.lint_file()), and keeps a persistent index of results so
+unchanged files are not parsed again.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from .lint import ERROR, LintIssue, lint_file
+from .parallel import resolve_workers
+from .utils import hash_file, validate_yaml, write_file_atomic
+
+# Files modified this recently (in nanoseconds) are always re-hashed,
+# since a same-size edit within the timestamp granularity would keep
+# the same size and mtime.
+RACY_WINDOW_NS = 2_000_000_000
+
+WORKFLOW_PATTERNS = ("*.yml", "*.yaml")
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of validating a single workflow file."""
+
+    path: Path
+    valid: bool
+    message: str
+    cached: bool = False
+    issues: list[LintIssue] = field(default_factory=list)
+
+
+def _has_glob(pattern: str) -> bool:
+    """Return True if a path contains glob wildcards."""
+    return any(char in pattern for char in "*?[")
+
+
+def find_workflow_files(
+    path: str | Path,
+    recursive: bool = False,
+    patterns: Iterable[str] = WORKFLOW_PATTERNS,
+) -> list[Path]:
+    """
+    Find workflow files to validate.
+
+    Args:
+        path: A file, a directory, or a glob pattern
+            (e.g. ``repos/*/.github/workflows/*.yml``)
+        recursive: Descend into subdirectories when path is a directory
+        patterns: File name patterns matched inside directories
+
+    Returns:
+        Sorted list of unique file paths
+    """
+    path_str = str(path)
+
+    if _has_glob(path_str):
+        anchor = Path(path_str).anchor
+        relative = path_str[len(anchor) :] if anchor else path_str
+        matches = Path(anchor or ".").glob(relative)
+        return sorted({match for match in matches if match.is_file()})
+
+    root = Path(path)
+
+    if root.is_file():
+        return [root]
+
+    if not root.is_dir():
+        return []
+
+    finder = root.rglob if recursive else root.glob
+    return sorted({match for pattern in patterns for match in finder(pattern) if match.is_file()})
+
+
+def lint_result(file_path: Path) -> ValidationResult:
+    """
+    Lint a workflow file.
+
+    The file is parsed once, by the linter: YAML errors are reported the
+    same way as by validate_yaml(). Lint warnings keep the file valid.
+
+    Args:
+        file_path: File to lint
+
+    Returns:
+        ValidationResult carrying the lint issues
+    """
+    try:
+        issues = lint_file(file_path)
+    except FileNotFoundError:
+        return ValidationResult(file_path, False, f"File not found: {file_path}")
+    except ValueError as e:
+        return ValidationResult(file_path, False, str(e))
+    except Exception as e:
+        return ValidationResult(file_path, False, f"Error reading file: {str(e)}")
+
+    errors = sum(issue.severity == ERROR for issue in issues)
+    if errors:
+        return ValidationResult(file_path, False, f"{errors} lint error(s)", issues=issues)
+    return ValidationResult(
+        file_path, True, f"Valid workflow file: {file_path.name}", issues=issues
+    )
+
+
+def _validate_chunk(
+    files: list[Path], structural: bool, lint: bool = False
+) -> list[ValidationResult]:
+    """
+    Validate a chunk of files.
+
+    Args:
+        files: Files to validate
+        structural: Only check well-formedness from the parser event stream
+        lint: Lint the files against the workflow schema
+
+    Returns:
+        List of ValidationResult objects in input order
+    """
+    results = []
+
+    for file_path in files:
+        if lint:
+            results.append(lint_result(file_path))
+            continue
+        is_valid, message = validate_yaml(file_path, structural=structural)
+        results.append(ValidationResult(file_path, is_valid, message))
+
+    return results
+
+
+def validate_files(
+    files: Iterable[Path],
+    workers: int = 1,
+    structural: bool = False,
+    chunk_size: int = None,
+    lint: bool = False,
+) -> Iterator[ValidationResult]:
+    """
+    Validate many workflow files, optionally across a process pool.
+
+    Args:
+        files: Files to validate
+        workers: Number of worker processes (0 means one per CPU)
+        structural: Only check well-formedness from the parser event stream
+        chunk_size: Number of files sent to a worker at a time
+            (default: spread files evenly, four chunks per worker)
+        lint: Lint the files against the workflow schema
+
+    Yields:
+        ValidationResult for each file, in input order
+    """
+    files = list(files)
+    workers = resolve_workers(workers)
+
+    if workers == 1 or len(files) <= 1:
+        for file_path in files:
+            yield from _validate_chunk([file_path], structural, lint)
+        return
+
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(files) // (workers * 4)))
+
+    chunks = [files[i : i + chunk_size] for i in range(0, len(files), chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        check = partial(_validate_chunk, structural=structural, lint=lint)
+        for results in executor.map(check, chunks):
+            yield from results
+
+
+def default_index_path(tree_path: str | Path) -> Path:
+    """
+    Get the default validation index location for a tree.
+
+    Args:
+        tree_path: Directory or glob pattern being validated
+
+    Returns:
+        Path of the index file inside the user cache directory
+    """
+    from .utils import get_cache_dir
+
+    key = hashlib.sha1(os.path.abspath(str(tree_path)).encode("utf-8")).hexdigest()
+    return get_cache_dir() / "validation" / f"{key}.json"
+
+
+class ValidationIndex:
+    """
+    Persistent index of validation results keyed by file path.
+
+    Each entry stores the file size, modification time, content hash and
+    last result. A file whose size and mtime match is trusted without
+    being read; otherwise its content hash decides whether the stored
+    result still applies.
+    """
+
+    def __init__(self, index_path: Path):
+        """
+        Initialize the index and load existing entries.
+
+        Args:
+            index_path: Path of the JSON index file
+        """
+        from . import __version__
+
+        self.index_path = index_path
+        self.version = __version__
+        self.entries: dict[str, dict[str, Any]] = {}
+
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+            if data.get("version") == self.version:
+                self.entries = data.get("entries", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def lookup(
+        self, file_path: Path, structural: bool, lint: bool = False
+    ) -> ValidationResult | None:
+        """
+        Return the stored result for a file if it is still current.
+
+        Args:
+            file_path: File to look up
+            structural: Validation mode the result must have been made with
+            lint: Whether the result must come from linting
+
+        Returns:
+            Cached ValidationResult, or None if the file must be validated
+        """
+        key = str(file_path)
+        entry = self.entries.get(key)
+        if entry is None or entry["structural"] != structural or entry.get("lint", False) != lint:
+            return None
+
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+
+        if entry["size"] != stat.st_size:
+            return None
+
+        if entry["mtime_ns"] != stat.st_mtime_ns:
+            try:
+                if hash_file(file_path) != entry["sha256"]:
+                    return None
+            except OSError:
+                return None
+            entry["mtime_ns"] = self._trusted_mtime(stat.st_mtime_ns)
+
+        return ValidationResult(
+            file_path,
+            entry["valid"],
+            entry["message"],
+            cached=True,
+            issues=[LintIssue(**issue) for issue in entry.get("issues", ())],
+        )
+
+    @staticmethod
+    def _trusted_mtime(mtime_ns: int) -> int | None:
+        """Return mtime_ns, or None if it is too recent to be trusted."""
+        if time.time_ns() - mtime_ns < RACY_WINDOW_NS:
+            return None
+        return mtime_ns
+
+    def record(self, result: ValidationResult, structural: bool, lint: bool = False) -> None:
+        """
+        Store a fresh validation result.
+
+        Args:
+            result: Result of validating a file
+            structural: Validation mode used
+            lint: Whether the file was linted
+        """
+        try:
+            stat = result.path.stat()
+            sha256 = hash_file(result.path)
+        except OSError:
+            self.entries.pop(str(result.path), None)
+            return
+
+        self.entries[str(result.path)] = {
+            "size": stat.st_size,
+            "mtime_ns": self._trusted_mtime(stat.st_mtime_ns),
+            "sha256": sha256,
+            "valid": result.valid,
+            "message": result.message,
+            "structural": structural,
+            "lint": lint,
+            "issues": [asdict(issue) for issue in result.issues],
+        }
+
+    def prune(self, files: Iterable[Path]) -> None:
+        """
+        Drop entries for files that are no longer part of the tree.
+
+        Args:
+            files: Files currently in the tree
+        """
+        keep = {str(file_path) for file_path in files}
+        self.entries = {key: value for key, value in self.entries.items() if key in keep}
+
+    def save(self) -> None:
+        """Write the index to disk, ignoring an unwritable location."""
+        data = json.dumps({"version": self.version, "entries": self.entries}, sort_keys=True)
+
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            write_file_atomic(self.index_path, data.encode("utf-8"))
+        except OSError:
+            pass
+
+
+def validate_files_incremental(
+    files: Iterable[Path],
+    index: ValidationIndex,
+    workers: int = 1,
+    structural: bool = False,
+    lint: bool = False,
+) -> Iterator[ValidationResult]:
+    """
+    Validate workflow files, reusing index results for unchanged files.
+
+    Only files whose fingerprint changed are parsed. The index is updated
+    and saved once every result has been yielded.
+
+    Args:
+        files: Files to validate
+        index: Validation index to consult and update
+        workers: Number of worker processes for files that must be parsed
+        structural: Only check well-formedness from the parser event stream
+        lint: Lint the files against the workflow schema
+
+    Yields:
+        ValidationResult for each file, in input order
+    """
+    files = list(files)
+    cached = [index.lookup(file_path, structural, lint) for file_path in files]
+    pending = [file_path for file_path, result in zip(files, cached, strict=True) if result is None]
+
+    fresh = validate_files(pending, workers=workers, structural=structural, lint=lint)
+
+    for result in cached:
+        if result is None:
+            result = next(fresh)
+            index.record(result, structural, lint)
+        yield result
+
+    index.prune(files)
+    index.save()
@@ -0,0 +1,170 @@
+"""
+YAML backend selection module.
+
+All YAML parsing and dumping goes through this module, which uses the
+libyaml-based CSafeLoader/CSafeDumper when PyYAML was built with libyaml
+and falls back to the pure-Python SafeLoader/SafeDumper otherwise.
+
+Set ``GHA_GEN_YAML_BACKEND=python`` to force the pure-Python backend.
+"""
+
+import os
+import sys
+from functools import cache
+from importlib.machinery import EXTENSION_SUFFIXES
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+BACKEND_ENV = "GHA_GEN_YAML_BACKEND"
+
+LIBYAML = "libyaml"
+PURE_PYTHON = "pure-python"
+
+
+def _python_backend_forced() -> bool:
+    """Return True if the pure-Python backend is forced by the environment."""
+    return os.environ.get(BACKEND_ENV, "").lower() in ("python", PURE_PYTHON)
+
+
+@cache
+def get_yaml_classes() -> tuple[type, type]:
+    """
+    Select the YAML loader and dumper classes.
+
+    Returns:
+        Tuple of (SafeLoader class, SafeDumper class)
+    """
+    import yaml
+
+    if not _python_backend_forced() and getattr(yaml, "__with_libyaml__", False):
+        return yaml.CSafeLoader, yaml.CSafeDumper
+
+    return yaml.SafeLoader, yaml.SafeDumper
+
+
+def get_safe_loader() -> type:
+    """
+    Get the fastest available safe YAML loader class.
+
+    Returns:
+        CSafeLoader if libyaml is available, SafeLoader otherwise
+    """
+    return get_yaml_classes()[0]
+
+
+def get_safe_dumper() -> type:
+    """
+    Get the fastest available safe YAML dumper class.
+
+    Returns:
+        CSafeDumper if libyaml is available, SafeDumper otherwise
+    """
+    return get_yaml_classes()[1]
+
+
+def safe_load(stream) -> Any:
+    """
+    Parse a YAML document with the selected safe loader.
+
+    Args:
+        stream: YAML string or file object
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        yaml.YAMLError: If the document is not valid YAML
+    """
+    import yaml
+
+    return yaml.load(stream, Loader=get_safe_loader())
+
+
+def safe_dump(data: Any, stream=None, **kwargs: Any) -> str | None:
+    """
+    Serialize data to YAML with the selected safe dumper.
+
+    Args:
+        data: Python object to serialize
+        stream: Optional file object to write to
+        **kwargs: Extra options for yaml.dump
+
+    Returns:
+        YAML string if no stream is given, None otherwise
+    """
+    import yaml
+
+    return yaml.dump(data, stream, Dumper=get_safe_dumper(), **kwargs)
+
+
+def check_structure(stream) -> None:
+    """
+    Check that a YAML stream is well-formed without building Python objects.
+
+    Only the scanner and parser run: the event stream is consumed and
+    discarded, so neither a node graph nor Python objects are built and
+    memory stays flat. Parsing stops at the first error. Aliases are
+    checked against the anchors seen so far, which is the one syntax
+    error otherwise only found while composing nodes.
+
+    Args:
+        stream: YAML string or file object
+
+    Raises:
+        yaml.YAMLError: If the document is not well-formed YAML
+    """
+    import yaml
+    from yaml.composer import ComposerError
+
+    anchors: set[str] = set()
+
+    for event in yaml.parse(stream, Loader=get_safe_loader()):
+        if isinstance(event, yaml.AliasEvent):
+            if event.anchor not in anchors:
+                raise ComposerError(
+                    None, None, f"found undefined alias {event.anchor!r}", event.start_mark
+                )
+        elif isinstance(event, yaml.NodeEvent) and event.anchor is not None:
+            anchors.add(event.anchor)
+        elif isinstance(event, yaml.DocumentStartEvent):
+            anchors.clear()
+
+
+def _libyaml_installed() -> bool:
+    """
+    Check for PyYAML's libyaml extension without importing PyYAML.
+
+    Returns:
+        True if the ``yaml._yaml`` extension module is present
+    """
+    spec = find_spec("yaml")
+    if spec is None or not spec.submodule_search_locations:
+        return False
+
+    return any(
+        (Path(location) / f"_yaml{suffix}").exists()
+        for location in spec.submodule_search_locations
+        for suffix in EXTENSION_SUFFIXES
+    )
+
+
+def get_yaml_backend() -> str:
+    """
+    Get the name of the active YAML backend.
+
+    PyYAML is not imported just to answer this question, so the check
+    stays cheap for ``gha-gen --version``.
+
+    Returns:
+        "libyaml" or "pure-python"
+    """
+    if _python_backend_forced():
+        return PURE_PYTHON
+
+    if "yaml" in sys.modules:
+        with_libyaml = get_safe_loader() is not sys.modules["yaml"].SafeLoader
+    else:
+        with_libyaml = _libyaml_installed()
+
+    return LIBYAML if with_libyaml else PURE_PYTHON
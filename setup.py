@@ -35,6 +35,8 @@ setup(
     package_data={
         "gha_generator": [
             "templates/*.yml",
+            "templates/partials/*.yml",
+            "data/*.json",
         ],
     },
     install_requires=requirements,
@@ -0,0 +1,17 @@
+"""
+Shared test fixtures.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep bytecode, render caches and registry indexes out of the user cache dir."""
+    monkeypatch.setenv("GHA_GEN_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+
+
+@pytest.fixture(autouse=True)
+def no_daemon(monkeypatch):
+    """Keep CLI commands in-process instead of going through a developer's daemon."""
+    monkeypatch.setenv("GHA_GEN_NO_DAEMON", "1")
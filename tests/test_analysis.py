@@ -0,0 +1,209 @@
+"""
+Unit tests for the workflow job graph analyzer.
+"""
+
+import json
+
+import pytest
+
+from gha_generator.analysis import (
+    analyze_workflow,
+    build_graph,
+    estimate_step,
+    find_cycles,
+    format_duration,
+    load_durations,
+    load_workflow,
+    topological_order,
+)
+
+
+def job(*needs, steps=None, **extra):
+    """Build a job mapping."""
+    return {"runs-on": "ubuntu-latest", "needs": list(needs), "steps": steps or [], **extra}
+
+
+class TestGraph:
+    """Test suite for building and ordering the job graph."""
+
+    def test_needs_as_string_or_list(self):
+        """Test that both forms of needs are accepted."""
+        graph = build_graph({"jobs": {"a": job(), "b": {"needs": "a"}, "c": job("a", "b")}})
+
+        assert graph["b"].needs == ["a"]
+        assert graph["c"].needs == ["a", "b"]
+
+    @pytest.mark.parametrize("needs", [5, ["a", 5], {"a": 1}])
+    def test_invalid_needs(self, needs):
+        """Test that needs other than job names are rejected with the job name."""
+        with pytest.raises(ValueError, match="Job 'b': needs must be") as e:
+            build_graph({"jobs": {"a": job(), "b": {"needs": needs}}})
+
+        assert str(e.value).endswith(f"got {needs!r}")
+
+    def test_topological_order_skips_cycles(self):
+        """Test that jobs in or after a cycle are left out of the order."""
+        graph = build_graph(
+            {"jobs": {"a": job(), "b": job("c"), "c": job("b"), "d": job("b"), "e": job("a")}}
+        )
+
+        assert topological_order(graph) == ["a", "e"]
+        assert find_cycles(graph) == [["b", "c", "b"]]
+
+    def test_self_loop(self):
+        """Test that a job needing itself is a cycle."""
+        graph = build_graph({"jobs": {"a": job("a")}})
+
+        assert find_cycles(graph) == [["a", "a"]]
+
+    def test_matrix_instances(self):
+        """Test that matrix size and max-parallel scale the job span."""
+        graph = build_graph(
+            {
+                "jobs": {
+                    "test": job(
+                        strategy={
+                            "max-parallel": 2,
+                            "matrix": {
+                                "python": ["3.10", "3.11", "3.12"],
+                                "os": ["ubuntu", "windows"],
+                                "exclude": [{"os": "windows", "python": "3.10"}],
+                                "include": [{"python": "3.13", "os": "ubuntu"}],
+                            },
+                        }
+                    )
+                }
+            },
+            durations={"test": 60},
+        )
+
+        assert graph["test"].instances == 6
+        assert graph["test"].max_parallel == 2
+        assert graph["test"].span == 180
+
+    def test_no_jobs(self):
+        """Test that a workflow without jobs is rejected."""
+        with pytest.raises(ValueError, match="no jobs"):
+            build_graph({"on": "push"})
+
+
+class TestEstimates:
+    """Test suite for step duration estimates."""
+
+    @pytest.mark.parametrize(
+        "step, kind",
+        [
+            ({"uses": "actions/checkout@v4"}, "checkout"),
+            ({"uses": "shivammathur/setup-php@v2"}, "setup"),
+            ({"run": "pip install -r requirements.txt"}, "install"),
+            ({"run": "ruff check ."}, "lint"),
+            ({"run": "composer audit"}, "audit"),
+            ({"run": "coverage run manage.py test"}, "test"),
+            ({"run": "npm run build"}, "build"),
+            ({"run": "echo done"}, "run"),
+        ],
+    )
+    def test_step_kind(self, step, kind):
+        """Test that steps are classified from their action or command."""
+        assert estimate_step(step).kind == kind
+
+    def test_detachable_steps(self):
+        """Test that only failure-tolerant steps without an id may move."""
+        assert estimate_step({"run": "ruff check .", "continue-on-error": True}).detachable
+        assert not estimate_step({"run": "ruff check ."}).detachable
+        assert not estimate_step(
+            {"id": "lint", "run": "ruff check .", "continue-on-error": True}
+        ).detachable
+
+    def test_format_duration(self):
+        """Test duration formatting."""
+        assert format_duration(45) == "45s"
+        assert format_duration(245) == "4m 05s"
+
+
+class TestAnalyzeWorkflow:
+    """Test suite for analyze_workflow."""
+
+    WORKFLOW = {
+        "on": {"push": None},
+        "jobs": {
+            "lint": job(),
+            "test": job(),
+            "build": job("lint", "test"),
+            "deploy": job("build", "docs"),
+        },
+    }
+
+    DURATIONS = {"lint": 30, "test": 300, "build": 120, "deploy": 60}
+
+    def test_critical_path_and_width(self):
+        """Test the critical path, its duration and the parallel width."""
+        report = analyze_workflow(self.WORKFLOW, self.DURATIONS)
+
+        assert report.triggers == ["push"]
+        assert report.critical_path == ["test", "build", "deploy"]
+        assert report.critical_duration == 480
+        assert report.width == 2
+        assert report.schedule["build"] == (300, 420)
+
+    def test_dangling_needs(self):
+        """Test that needs naming missing jobs are reported."""
+        report = analyze_workflow(self.WORKFLOW, self.DURATIONS)
+
+        assert report.dangling == [("deploy", "docs")]
+        assert not report.is_valid
+
+    def test_sequential_jobs_width(self):
+        """Test that a job starting when another ends does not add to the width."""
+        report = analyze_workflow({"jobs": {"a": job(), "b": job("a")}}, {"a": 10, "b": 10})
+
+        assert report.width == 1
+
+    def test_split_suggestion(self):
+        """Test that lint steps of a critical job are suggested for a parallel job."""
+        steps = [
+            {"uses": "actions/checkout@v4"},
+            {"run": "pip install -r requirements.txt"},
+            {"name": "Lint", "run": "ruff check .", "continue-on-error": True},
+            {"name": "Audit", "run": "pip-audit --security", "continue-on-error": True},
+            {"run": "pytest"},
+        ]
+
+        report = analyze_workflow({"jobs": {"test": job(steps=steps)}}, suggest=True)
+
+        assert len(report.suggestions) == 1
+        assert "Lint, Audit" in report.suggestions[0]
+
+    def test_no_suggestion_when_nothing_gained(self):
+        """Test that a split longer than the remaining job is not suggested."""
+        steps = [
+            {"uses": "actions/checkout@v4"},
+            {"run": "pip install -r requirements.txt"},
+            {"name": "Lint", "run": "ruff check .", "continue-on-error": True},
+        ]
+
+        report = analyze_workflow({"jobs": {"test": job(steps=steps)}}, suggest=True)
+
+        assert report.suggestions == []
+
+
+class TestLoading:
+    """Test suite for loading workflows and durations."""
+
+    def test_on_key_restored(self, tmp_path):
+        """Test that the YAML 1.1 'on' boolean key is read back as 'on'."""
+        path = tmp_path / "ci.yml"
+        path.write_text("on: [push]\njobs:\n  a:\n    steps: []\n")
+
+        assert load_workflow(path)["on"] == ["push"]
+
+    def test_durations(self, tmp_path):
+        """Test loading measured durations."""
+        path = tmp_path / "durations.json"
+        path.write_text(json.dumps({"test": 90, "lint": 12.5}))
+
+        assert load_durations(path) == {"test": 90.0, "lint": 12.5}
+
+        path.write_text(json.dumps({"test": "slow"}))
+        with pytest.raises(ValueError, match="expected job names mapped to seconds"):
+            load_durations(path)
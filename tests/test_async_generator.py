@@ -0,0 +1,133 @@
+"""
+Unit tests for the AsyncWorkflowGenerator class.
+"""
+
+import asyncio
+
+import pytest
+
+from gha_generator.async_generator import AsyncWorkflowGenerator
+from gha_generator.batch import BatchJob
+
+
+@pytest.fixture
+def variables():
+    """Sample variables for template rendering."""
+    return {"project_name": "async-project", "python_version": "3.12", "node_version": "20"}
+
+
+def run(coroutine_factory, **options):
+    """Run a coroutine using a fresh generator and close it afterwards."""
+
+    async def main():
+        async with AsyncWorkflowGenerator(**options) as generator:
+            return await coroutine_factory(generator)
+
+    return asyncio.run(main())
+
+
+class TestAsyncWorkflowGenerator:
+    """Test suite for AsyncWorkflowGenerator."""
+
+    def test_environment_is_async(self, tmp_path):
+        """Test that templates are compiled for async rendering."""
+        generator = AsyncWorkflowGenerator(cache_dir=tmp_path)
+        assert generator.env.is_async is True
+        generator.close()
+
+    def test_streaming_is_rejected(self, tmp_path):
+        """Test that streaming, which the async path cannot honour, is refused."""
+        with pytest.raises(ValueError, match="does not support streaming"):
+            AsyncWorkflowGenerator(cache_dir=tmp_path, streaming=True)
+
+    def test_variables_checked_off_the_event_loop(self, variables, tmp_path, monkeypatch):
+        """Test that variable validation runs in the thread pool."""
+        import threading
+
+        from gha_generator.generator import WorkflowGenerator
+
+        threads = []
+        checked_variables = WorkflowGenerator._checked_variables
+
+        def record(self, template, variables):
+            threads.append(threading.current_thread().name)
+            return checked_variables(self, template, variables)
+
+        monkeypatch.setattr(WorkflowGenerator, "_checked_variables", record)
+
+        run(lambda g: g.generate_async("react-app", variables, tmp_path), cache_dir=tmp_path)
+
+        assert len(threads) == 1
+        assert threads[0].startswith("gha-gen")
+
+    def test_generate_async(self, variables, tmp_path):
+        """Test generating a workflow file asynchronously."""
+        path = run(
+            lambda g: g.generate_async("data-science", variables, tmp_path),
+            cache_dir=tmp_path,
+        )
+
+        assert path == tmp_path / "ci.yml"
+        assert "async-project" in path.read_text()
+
+    def test_async_output_matches_sync(self, variables, tmp_path):
+        """Test that async rendering produces the same output as sync rendering."""
+        from gha_generator.generator import WorkflowGenerator
+
+        sync = WorkflowGenerator(cache_dir=tmp_path)
+        expected = sync.render_template(sync.load_template("django-api"), variables)
+
+        async def render(generator):
+            template = await generator.load_template_async("django-api")
+            return await generator.render_validated_async(template, variables)
+
+        assert run(render, cache_dir=tmp_path) == expected
+
+    def test_generate_async_invalid_template(self, variables, tmp_path):
+        """Test that an unknown template raises ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            run(lambda g: g.generate_async("unknown", variables, tmp_path), cache_dir=tmp_path)
+
+    def test_concurrent_generate_calls(self, variables, tmp_path):
+        """Test running many generate calls concurrently."""
+
+        async def generate_all(generator):
+            return await asyncio.gather(
+                *(
+                    generator.generate_async("react-app", variables, tmp_path, f"w{i}.yml")
+                    for i in range(10)
+                )
+            )
+
+        paths = run(generate_all, cache_dir=tmp_path, max_workers=2)
+        assert sorted(p.name for p in paths) == sorted(f"w{i}.yml" for i in range(10))
+
+    def test_generate_many_async_keeps_order_and_bounds_concurrency(self, variables, tmp_path):
+        """Test that batch results are ordered and in-flight work is bounded."""
+        jobs = [BatchJob("react-app", variables, tmp_path / str(i)) for i in range(8)]
+        jobs[2].template = "unknown"
+
+        async def generate_all(generator):
+            in_flight = 0
+            peak = 0
+            original = generator.render_validated_async
+
+            async def tracking(template, variables):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                try:
+                    return await original(template, variables)
+                finally:
+                    in_flight -= 1
+
+            generator.render_validated_async = tracking
+            results = [result async for result in generator.generate_many_async(jobs)]
+            return results, peak
+
+        results, peak = run(generate_all, cache_dir=tmp_path, max_workers=2, max_concurrency=3)
+
+        assert [r.index for r in results] == list(range(8))
+        assert [r.success for r in results] == [i != 2 for i in range(8)]
+        assert 1 < peak <= 3
@@ -0,0 +1,161 @@
+"""
+Unit tests for batch manifests.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from gha_generator.batch import BatchJob, load_manifest
+
+
+class TestLoadManifest:
+    """Test suite for load_manifest."""
+
+    def test_load_manifest_list(self, tmp_path):
+        """Test loading a manifest that is a plain list of entries."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("""
+- template: django-api
+  name: api
+  output: api/.github/workflows
+- template: react-app
+  name: web
+  output: /abs/web
+  filename: web.yml
+""")
+
+        jobs = load_manifest(manifest)
+
+        assert len(jobs) == 2
+        assert jobs[0] == BatchJob(
+            template="django-api",
+            variables={"project_name": "api"},
+            output=tmp_path / "api/.github/workflows",
+            filename="ci.yml",
+        )
+        assert jobs[1].output == Path("/abs/web")
+        assert jobs[1].filename == "web.yml"
+
+    def test_load_manifest_with_defaults(self, tmp_path):
+        """Test that manifest defaults are merged into each entry."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("""
+defaults:
+  template: data-science
+  variables:
+    python_version: "3.12"
+workflows:
+  - name: ml
+    output: ml
+    variables:
+      node_version: "20"
+""")
+
+        jobs = load_manifest(manifest)
+
+        assert jobs[0].template == "data-science"
+        assert jobs[0].variables == {
+            "python_version": "3.12",
+            "node_version": "20",
+            "project_name": "ml",
+        }
+
+    def test_load_manifest_empty(self, tmp_path):
+        """Test loading an empty manifest."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("")
+        assert load_manifest(manifest) == []
+
+    def test_load_manifest_missing_template(self, tmp_path):
+        """Test that an entry without a template is rejected."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("- name: api\n  output: api\n")
+
+        with pytest.raises(ValueError, match="missing 'template'"):
+            load_manifest(manifest)
+
+    def test_load_manifest_not_a_list(self, tmp_path):
+        """Test that a manifest without a workflow list is rejected."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("workflows: nope\n")
+
+        with pytest.raises(ValueError, match="list of workflows"):
+            load_manifest(manifest)
+
+
+class TestRepoManifest:
+    """Test suite for manifests grouping workflows by repository."""
+
+    def test_load_repos(self, tmp_path):
+        """Test that each repository expands to one job per workflow."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("""
+defaults:
+  variables:
+    python_version: "3.12"
+repos:
+  - name: api
+    path: services/api
+    variables:
+      node_version: "20"
+    workflows:
+      - template: django-api
+      - template: react-app
+        filename: frontend.yml
+        variables:
+          node_version: "22"
+  - name: web
+    output: web/workflows
+    workflows:
+      - template: react-app
+""")
+
+        jobs = load_manifest(manifest)
+
+        api_output = tmp_path / "services/api/.github/workflows"
+        assert jobs == [
+            BatchJob(
+                "django-api",
+                {"python_version": "3.12", "node_version": "20", "project_name": "api"},
+                api_output,
+                "django-api-ci.yml",
+            ),
+            BatchJob(
+                "react-app",
+                {"python_version": "3.12", "node_version": "22", "project_name": "api"},
+                api_output,
+                "frontend.yml",
+            ),
+            BatchJob(
+                "react-app",
+                {"python_version": "3.12", "project_name": "web"},
+                tmp_path / "web/workflows",
+                "ci.yml",
+            ),
+        ]
+
+    def test_repo_without_output(self, tmp_path):
+        """Test that a repository needs an output or a path."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("repos:\n  - name: api\n    workflows:\n      - template: django-api\n")
+
+        with pytest.raises(ValueError, match="Repository api is missing 'output' or 'path'"):
+            load_manifest(manifest)
+
+    def test_duplicate_targets_rejected(self, tmp_path):
+        """Test that two workflows writing the same file are rejected."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("""
+repos:
+  - name: api
+    output: api
+    workflows:
+      - template: django-api
+        filename: ci.yml
+      - template: react-app
+        filename: ci.yml
+""")
+
+        with pytest.raises(ValueError, match="Several workflows would be written to"):
+            load_manifest(manifest)
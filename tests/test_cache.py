@@ -0,0 +1,138 @@
+"""
+Unit tests for the cache module.
+"""
+
+import os
+from pathlib import Path
+
+from gha_generator.cache import (
+    RenderCache,
+    TemplateBytecodeCache,
+    create_bytecode_cache,
+    create_render_cache,
+)
+from gha_generator.generator import WorkflowGenerator
+from gha_generator.utils import get_cache_dir
+
+
+class TestCacheDir:
+    """Test suite for cache directory resolution."""
+
+    def test_get_cache_dir_override(self, monkeypatch, tmp_path):
+        """Test that GHA_GEN_CACHE_DIR takes precedence."""
+        monkeypatch.setenv("GHA_GEN_CACHE_DIR", str(tmp_path))
+        assert get_cache_dir() == tmp_path
+
+    def test_get_cache_dir_xdg(self, monkeypatch, tmp_path):
+        """Test that XDG_CACHE_HOME is honoured."""
+        monkeypatch.delenv("GHA_GEN_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setattr("os.name", "posix")
+        assert get_cache_dir() == tmp_path / "gha-gen"
+
+    def test_create_bytecode_cache(self, tmp_path):
+        """Test creating the bytecode cache directory."""
+        bcc = create_bytecode_cache(tmp_path)
+        assert isinstance(bcc, TemplateBytecodeCache)
+        assert (tmp_path / "bytecode").is_dir()
+
+    def test_create_bytecode_cache_unwritable(self, tmp_path):
+        """Test that an unusable cache directory disables the cache."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        assert create_bytecode_cache(blocker) is None
+
+
+class TestBytecodeCache:
+    """Test suite for the persistent template bytecode cache."""
+
+    def test_precompile_populates_cache(self, tmp_path):
+        """Test that precompile writes one entry per template."""
+        generator = WorkflowGenerator(cache_dir=tmp_path)
+        compiled = generator.precompile()
+
+        assert "data-science.yml" in compiled
+        entries = list((tmp_path / "bytecode").glob("*.jinja"))
+        assert len(entries) == len(compiled)
+
+    def test_cached_bytecode_is_reused(self, tmp_path, monkeypatch):
+        """Test that a fresh generator loads templates without compiling."""
+        WorkflowGenerator(cache_dir=tmp_path).precompile()
+
+        generator = WorkflowGenerator(cache_dir=tmp_path)
+
+        def fail_compile(*args, **kwargs):
+            raise AssertionError("template was recompiled")
+
+        monkeypatch.setattr(generator.env, "compile", fail_compile)
+        rendered = generator.render_template(
+            generator.load_template("react-app"), {"project_name": "web", "node_version": "20"}
+        )
+        assert "web" in rendered
+
+    def test_cache_key_depends_on_source(self, tmp_path):
+        """Test that editing a template yields a different cache key."""
+        generator = WorkflowGenerator(cache_dir=tmp_path)
+        bcc = generator.env.bytecode_cache
+
+        first = bcc.get_bucket(generator.env, "a.yml", None, "name: one")
+        second = bcc.get_bucket(generator.env, "a.yml", None, "name: two")
+        assert first.key != second.key
+
+    def test_generator_without_bytecode_cache(self, tmp_path):
+        """Test disabling the bytecode cache."""
+        generator = WorkflowGenerator(cache_dir=tmp_path, bytecode_cache=False)
+        assert generator.env.bytecode_cache is None
+        assert not Path(tmp_path / "bytecode").exists()
+
+
+class TestRenderCache:
+    """Test suite for the content-addressed render cache."""
+
+    def test_make_key_normalizes_variables(self):
+        """Test that variable order does not change the key."""
+        first = RenderCache.make_key("abc", {"a": 1, "b": "2"})
+        second = RenderCache.make_key("abc", {"b": "2", "a": 1})
+        assert first == second
+
+    def test_make_key_depends_on_inputs(self):
+        """Test that template, variables and options change the key."""
+        key = RenderCache.make_key("abc", {"a": 1})
+        assert key != RenderCache.make_key("abd", {"a": 1})
+        assert key != RenderCache.make_key("abc", {"a": 2})
+        assert key != RenderCache.make_key("abc", {"a": 1}, "structural=True")
+
+    def test_get_put(self, tmp_path):
+        """Test storing and retrieving a rendered workflow."""
+        cache = create_render_cache(tmp_path)
+        key = RenderCache.make_key("abc", {"a": 1})
+
+        assert cache.get(key) is None
+        cache.put(key, "name: CI\n")
+        assert cache.get(key) == "name: CI\n"
+        assert (tmp_path / "renders" / key[:2] / f"{key}.yml").exists()
+
+    def test_put_ignores_unwritable_directory(self, tmp_path):
+        """Test that an unwritable cache does not raise."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = RenderCache(blocker)
+        cache.put("abcd", "name: CI\n")
+        assert cache.get("abcd") is None
+
+    def test_prune_removes_least_recently_used(self, tmp_path):
+        """Test that pruning keeps the most recently used entries within the size limit."""
+        cache = create_render_cache(tmp_path)
+        keys = [RenderCache.make_key("abc", {"a": i}) for i in range(4)]
+        for age, key in enumerate(keys):
+            cache.put(key, "x" * 100)
+            mtime = 10**18 - (10 - age) * 10**9
+            os.utime(cache._entry_path(key), ns=(mtime, mtime))
+        cache.get(keys[0])
+
+        assert cache.prune(max_bytes=250) == 2
+        assert [cache.get(key) is not None for key in keys] == [True, False, False, True]
+
+    def test_prune_missing_directory(self, tmp_path):
+        """Test that pruning a cache that was never written does nothing."""
+        assert create_render_cache(tmp_path).prune() == 0
@@ -6,7 +6,17 @@ Unit tests for the CLI interface.
 import pytest
 from click.testing import CliRunner
 
-from gha_generator.main import cli, create, list_templates, validate
+from gha_generator.main import (
+    analyze,
+    batch,
+    cli,
+    create,
+    extract,
+    list_templates,
+    precompile,
+    simulate,
+    validate,
+)
 
 
 class TestCLI:
@@ -29,6 +39,13 @@ class TestCLI:
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
+    def test_cli_version_reports_yaml_backend(self, runner):
+        """Test that the version output names the YAML backend."""
+        result = runner.invoke(cli, ["--version"])
+        assert result.exit_code == 0
+        assert "YAML backend:" in result.output
+        assert "libyaml" in result.output or "pure-python" in result.output
+
     def test_create_command_help(self, runner):
         """Test create command help."""
         result = runner.invoke(create, ["--help"])
@@ -116,6 +133,170 @@ class TestCLI:
 
         assert result.exit_code != 0
 
+    def test_create_command_invalid_version(self, runner, tmp_path):
+        """Test create command rejects a malformed version before rendering."""
+        result = runner.invoke(
+            create,
+            [
+                "--type",
+                "django-api",
+                "--name",
+                "api",
+                "--python-version",
+                "three",
+                "--output",
+                str(tmp_path),
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "'python_version' must be a Python 3 version" in result.output
+        assert not (tmp_path / "ci.yml").exists()
+
+    def test_create_command_filename_and_vars(self, runner, tmp_path):
+        """Test create command with a custom filename and extra variables."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "go-service.yml").write_text(
+            "name: {{ project_name }}\ngo: {{ go_version }}\n"
+        )
+
+        result = runner.invoke(
+            create,
+            [
+                "--template-dir",
+                str(template_dir),
+                "--type",
+                "go-service",
+                "--name",
+                "api",
+                "--filename",
+                "go.yml",
+                "--var",
+                "go_version=1.22",
+                "--output",
+                str(tmp_path / "out"),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "out" / "go.yml").read_text() == "name: api\ngo: 1.22"
+
+    def test_create_command_invalid_var(self, runner, tmp_path):
+        """Test that --var requires KEY=VALUE."""
+        result = runner.invoke(
+            create,
+            [
+                "--type",
+                "react-app",
+                "--name",
+                "web",
+                "--var",
+                "novalue",
+                "--output",
+                str(tmp_path),
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "expected KEY=VALUE" in result.output
+
+    def test_create_command_requires_type_or_manifest(self, runner):
+        """Test that create needs --type/--name or --manifest."""
+        result = runner.invoke(create, ["--name", "web"])
+
+        assert result.exit_code != 0
+        assert "Specify --type and --name, or --manifest" in result.output
+
+    def test_create_command_manifest(self, runner, tmp_path):
+        """Test generating several workflows per repository from a manifest."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("""
+repos:
+  - name: shop
+    path: shop
+    workflows:
+      - template: laravel-api
+      - template: react-app
+        variables:
+          node_version: "20"
+""")
+
+        result = runner.invoke(create, ["--manifest", str(manifest)])
+
+        assert result.exit_code == 0, result.output
+        assert "2 workflow(s) into 1 directory" in result.output
+        workflows = tmp_path / "shop" / ".github" / "workflows"
+        assert sorted(p.name for p in workflows.iterdir()) == [
+            "laravel-api-ci.yml",
+            "react-app-ci.yml",
+        ]
+        assert "2 succeeded, 0 failed" in result.output
+
+    def test_create_command_version_matrix(self, runner, tmp_path):
+        """Test that comma-separated versions produce a build matrix."""
+        result = runner.invoke(
+            create,
+            [
+                "--type",
+                "laravel-api",
+                "--name",
+                "shop",
+                "--php-version",
+                "8.2,8.3",
+                "--no-fail-fast",
+                "--output",
+                str(tmp_path),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        content = (tmp_path / "ci.yml").read_text()
+        assert "fail-fast: false" in content
+        assert "${{ matrix.php-version }}" in content
+
+    def test_create_command_version_list_spacing(self, runner, tmp_path):
+        """Test that spaces and empty items in version lists are ignored."""
+        import yaml
+
+        result = runner.invoke(
+            create,
+            [
+                "--type",
+                "django-api",
+                "--name",
+                "api",
+                "--python-version",
+                "3.11, 3.12,",
+                "--output",
+                str(tmp_path),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        job = yaml.safe_load((tmp_path / "ci.yml").read_text())["jobs"]["test"]
+        assert job["strategy"]["matrix"]["python-version"] == ["3.11", "3.12"]
+
+    def test_create_command_cache_deps(self, runner, tmp_path):
+        """Test that --cache-deps adds a dependency cache step."""
+        result = runner.invoke(
+            create,
+            [
+                "--type",
+                "data-science",
+                "--name",
+                "notebooks",
+                "--cache-deps",
+                "--output",
+                str(tmp_path),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        content = (tmp_path / "ci.yml").read_text()
+        assert "actions/cache@v4" in content
+        assert "cache: 'pip'" not in content
+
     def test_create_command_custom_python_version(self, runner, tmp_path):
         """Test create command with custom Python version."""
         result = runner.invoke(create, [
@@ -149,6 +330,59 @@ class TestCLI:
         templates_count = result.output.count("•")
         assert templates_count >= 4  # At least 4 templates
 
+    def test_list_templates_includes_user_templates(self, runner, tmp_path, monkeypatch):
+        """Test that templates from GHA_GEN_TEMPLATE_PATH are listed."""
+        user_dir = tmp_path / "templates"
+        user_dir.mkdir()
+        (user_dir / "go-service.yml").write_text("name: {{ project_name }}\n")
+        monkeypatch.setenv("GHA_GEN_TEMPLATE_PATH", str(user_dir))
+        monkeypatch.setenv("GHA_GEN_CACHE_DIR", str(tmp_path / "cache"))
+
+        result = runner.invoke(list_templates)
+
+        assert result.exit_code == 0
+        assert "go-service (user)" in result.output
+
+    def test_create_command_with_template_dir(self, runner, tmp_path):
+        """Test that --template-dir makes extra templates available."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "go-service.yml").write_text("name: {{ project_name }}\n")
+
+        result = runner.invoke(
+            create,
+            [
+                "--template-dir",
+                str(template_dir),
+                "--type",
+                "go-service",
+                "--name",
+                "api",
+                "--output",
+                str(tmp_path / "out"),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "out" / "ci.yml").read_text() == "name: api"
+
+    def test_create_command_type_is_case_insensitive(self, runner, tmp_path):
+        """Test that template names are matched regardless of case."""
+        result = runner.invoke(
+            create,
+            [
+                "--type",
+                "React-App",
+                "--name",
+                "web",
+                "--output",
+                str(tmp_path),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert (tmp_path / "ci.yml").exists()
+
     def test_validate_command_help(self, runner):
         """Test validate command help."""
         result = runner.invoke(validate, ["--help"])
@@ -194,6 +428,80 @@ jobs:
         result = runner.invoke(validate, ["--file", str(non_existent)])
         assert result.exit_code != 0
 
+    def test_validate_command_requires_file_or_path(self, runner):
+        """Test validate command without --file or --path."""
+        result = runner.invoke(validate, [])
+        assert result.exit_code != 0
+
+    def test_validate_command_tree(self, runner, tmp_path):
+        """Test validating a directory tree of workflow files."""
+        nested = tmp_path / "repo" / ".github" / "workflows"
+        nested.mkdir(parents=True)
+        (nested / "ci.yml").write_text("name: CI\non: push\n")
+        (tmp_path / "top.yml").write_text("name: Top\n")
+
+        index = tmp_path.parent / f"{tmp_path.name}-index.json"
+        args = ["--path", str(tmp_path), "--recursive", "--index", str(index)]
+
+        result = runner.invoke(validate, args)
+
+        assert result.exit_code == 0
+        assert "2 file(s): 2 valid, 0 invalid (0 unchanged)" in result.output
+        assert index.exists()
+
+    def test_validate_command_tree_with_invalid_file(self, runner, tmp_path):
+        """Test that an invalid file in a tree fails the command."""
+        (tmp_path / "good.yml").write_text("name: CI\n")
+        (tmp_path / "bad.yml").write_text("name: [CI\n")
+
+        result = runner.invoke(validate, ["--path", str(tmp_path), "--jobs", "2"])
+
+        assert result.exit_code != 0
+        assert "1 valid, 1 invalid" in result.output
+        assert "bad.yml" in result.output
+
+    def test_validate_command_lint(self, runner, tmp_path):
+        """Test that --lint reports schema errors in valid YAML."""
+        workflow = tmp_path / "ci.yml"
+        workflow.write_text(
+            "on:\n  push:\n    branch: [main]\n"
+            "jobs:\n  test:\n    runs-on: ubuntu-lates\n    steps:\n      - run: make\n"
+        )
+
+        plain = runner.invoke(validate, ["--file", str(workflow)])
+        result = runner.invoke(validate, ["--file", str(workflow), "--lint"])
+
+        assert plain.exit_code == 0
+        assert result.exit_code == 1
+        assert "[event-filter] Event 'push' does not support 'branch'" in result.output
+        assert "did you mean 'ubuntu-latest'?" in result.output
+        assert "2 lint error(s)" in result.output
+
+    def test_validate_command_lint_tree(self, runner, tmp_path):
+        """Test linting a tree of generated workflows."""
+        runner.invoke(create, ["--type", "react-app", "--name", "web", "--output", str(tmp_path)])
+
+        result = runner.invoke(
+            validate,
+            [
+                "--path",
+                str(tmp_path),
+                "--lint",
+                "--index",
+                str(tmp_path / "index.json"),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "1 valid, 0 invalid" in result.output
+
+    def test_validate_command_lint_structural(self, runner, tmp_path):
+        """Test that --lint and --structural are exclusive."""
+        result = runner.invoke(validate, ["--path", str(tmp_path), "--lint", "--structural"])
+
+        assert result.exit_code == 2
+        assert "--lint cannot be combined with --structural" in result.output
+
     def test_create_creates_directory_if_not_exists(self, runner, tmp_path):
         """Test that create command creates output directory."""
         nested_dir = tmp_path / "nested" / "workflows"
@@ -218,3 +526,209 @@ jobs:
 
         assert result.exit_code == 0
         assert str(tmp_path) in result.output or "ci.yml" in result.output
+
+    def test_batch_command(self, runner, tmp_path):
+        """Test batch command generates every manifest entry."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("""
+- template: data-science
+  name: ml
+  output: ml
+- template: react-app
+  name: web
+  output: web
+""")
+
+        result = runner.invoke(batch, ["--manifest", str(manifest)])
+
+        assert result.exit_code == 0
+        assert "2 succeeded, 0 failed" in result.output
+        assert (tmp_path / "ml" / "ci.yml").exists()
+        assert (tmp_path / "web" / "ci.yml").exists()
+
+        rerun = runner.invoke(batch, ["--manifest", str(manifest)])
+        assert rerun.exit_code == 0
+        assert "(2 unchanged)" in rerun.output
+
+    def test_batch_command_stream(self, runner, tmp_path):
+        """Test batch command in streaming mode."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("""
+- template: react-app
+  name: web
+  output: web
+""")
+
+        result = runner.invoke(batch, ["--manifest", str(manifest), "--stream"])
+
+        assert result.exit_code == 0
+        assert "1 succeeded, 0 failed" in result.output
+        assert "web" in (tmp_path / "web" / "ci.yml").read_text()
+
+    def test_batch_command_reports_failures(self, runner, tmp_path):
+        """Test batch command keeps going and exits non-zero on failures."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("""
+- template: unknown
+  name: broken
+  output: broken
+- template: react-app
+  name: web
+  output: web
+""")
+
+        result = runner.invoke(batch, ["--manifest", str(manifest)])
+
+        assert result.exit_code != 0
+        assert "1 succeeded, 1 failed" in result.output
+        assert (tmp_path / "web" / "ci.yml").exists()
+
+    def test_batch_command_plan(self, runner, tmp_path):
+        """Test that --plan reports changes without writing anything."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("""
+- template: data-science
+  name: ml
+  output: ml
+- template: react-app
+  name: web
+  output: web
+""")
+        runner.invoke(batch, ["--manifest", str(manifest)])
+        (tmp_path / "web" / "ci.yml").write_text("name: stale\n")
+        (tmp_path / "ml" / "ci.yml").unlink()
+
+        result = runner.invoke(batch, ["--manifest", str(manifest), "--plan", "--diff"])
+
+        assert result.exit_code == 0, result.output
+        assert "0 unchanged, 1 changed, 1 new, 0 failed (nothing written)" in result.output
+        assert "-name: stale" in result.output
+        assert (tmp_path / "web" / "ci.yml").read_text() == "name: stale\n"
+        assert not (tmp_path / "ml" / "ci.yml").exists()
+
+    def test_batch_command_diff_requires_plan(self, runner, tmp_path):
+        """Test that --diff is only accepted with --plan."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("[]\n")
+
+        result = runner.invoke(batch, ["--manifest", str(manifest), "--diff"])
+
+        assert result.exit_code == 2
+        assert "--diff requires --plan" in result.output
+
+    def test_batch_command_with_jobs(self, runner, tmp_path):
+        """Test batch command with a process pool."""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("""
+- template: data-science
+  name: ml
+  output: ml
+- template: react-app
+  name: web
+  output: web
+- template: django-api
+  name: api
+  output: api
+""")
+
+        result = runner.invoke(batch, ["--manifest", str(manifest), "--jobs", "2"])
+
+        assert result.exit_code == 0
+        assert "3 succeeded, 0 failed" in result.output
+        assert (tmp_path / "api" / "ci.yml").exists()
+
+    def test_precompile_command(self, runner, tmp_path):
+        """Test precompile command fills the bytecode cache."""
+        result = runner.invoke(precompile, ["--cache-dir", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "Precompiled" in result.output
+        assert any((tmp_path / "bytecode").iterdir())
+
+    def test_analyze_command(self, runner, tmp_path):
+        """Test analyzing a generated workflow."""
+        runner.invoke(create, ["--type", "django-api", "--name", "api", "--output", str(tmp_path)])
+
+        result = runner.invoke(analyze, ["--file", str(tmp_path / "ci.yml"), "--suggest"])
+
+        assert result.exit_code == 0, result.output
+        assert "Critical path" in result.output
+        assert "Job 'test': move" in result.output
+
+    def test_analyze_command_broken_graph(self, runner, tmp_path):
+        """Test that cycles and unknown needs fail the analysis."""
+        workflow = tmp_path / "ci.yml"
+        workflow.write_text(
+            "on: push\n"
+            "jobs:\n"
+            "  a:\n    needs: b\n    steps: []\n"
+            "  b:\n    needs: [a, missing]\n    steps: []\n"
+        )
+
+        result = runner.invoke(analyze, ["--file", str(workflow)])
+
+        assert result.exit_code == 1
+        assert "Cycle: a → b → a" in result.output
+        assert "needs unknown job 'missing'" in result.output
+
+    def test_simulate_command(self, runner, tmp_path):
+        """Test simulating staggered runs of a generated workflow."""
+        runner.invoke(create, ["--type", "react-app", "--name", "web", "--output", str(tmp_path)])
+
+        result = runner.invoke(
+            simulate,
+            [
+                "--file",
+                str(tmp_path / "ci.yml"),
+                "--runners",
+                "1",
+                "--runs",
+                "2",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Wall-clock" in result.output
+        assert "billable minute(s)" in result.output
+        assert "test: 2 instance(s)" in result.output
+
+    def test_extract_command(self, runner, tmp_path):
+        """Test recovering the variables of a hand-edited workflow."""
+        runner.invoke(
+            create,
+            [
+                "--type",
+                "django-api",
+                "--name",
+                "shop-api",
+                "-p",
+                "3.12",
+                "--output",
+                str(tmp_path),
+            ],
+        )
+        workflow = tmp_path / "ci.yml"
+        workflow.write_text(workflow.read_text().replace("postgres:15", "postgres:16"))
+
+        result = runner.invoke(extract, ["--type", "django-api", "--file", str(workflow)])
+
+        assert result.exit_code == 0, result.output
+        assert "project_name = shop-api" in result.output
+        assert "python_version = 3.12" in result.output
+        assert "1 drift hunk(s)" in result.output
+        assert "+        image: postgres:16" in result.output
+
+    def test_extract_command_json(self, runner, tmp_path):
+        """Test the JSON output of extract."""
+        import json
+
+        runner.invoke(create, ["--type", "react-app", "--name", "web", "--output", str(tmp_path)])
+        workflow = str(tmp_path / "ci.yml")
+
+        result = runner.invoke(extract, ["--type", "react-app", "--file", workflow, "--json"])
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)[workflow]
+        assert data["variables"] == {"node_version": "18", "project_name": "web"}
+        assert data["similarity"] == 1.0
+        assert data["drift"] == []
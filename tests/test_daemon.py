@@ -0,0 +1,148 @@
+"""
+Unit tests for the generator daemon and its client.
+"""
+
+import json
+import threading
+
+import pytest
+
+from gha_generator.client import DaemonClient, DaemonError
+from gha_generator.daemon import GeneratorServer, serve
+from gha_generator.registry import get_registry
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    """Run a daemon in a background thread and yield its state file."""
+    monkeypatch.delenv("GHA_GEN_NO_DAEMON", raising=False)
+    state_path = tmp_path / "daemon.json"
+    started = threading.Event()
+    servers = []
+
+    def ready(server):
+        servers.append(server)
+        started.set()
+
+    thread = threading.Thread(
+        target=serve,
+        kwargs={"port": 0, "state_path": state_path, "ready": ready, "cache_dir": tmp_path},
+        daemon=True,
+    )
+    thread.start()
+    assert started.wait(10)
+
+    yield state_path
+
+    servers[0].shutdown()
+    thread.join(10)
+
+
+class TestDaemon:
+    """Test suite for the generator daemon."""
+
+    def test_state_file_is_private(self, daemon):
+        """Test that the state file is only readable by its owner."""
+        assert daemon.stat().st_mode & 0o077 == 0
+        assert json.loads(daemon.read_text())["token"]
+
+    def test_discover(self, daemon):
+        """Test discovering a running daemon."""
+        assert DaemonClient.discover(daemon) is not None
+
+    def test_discover_checks_search_path(self, daemon, tmp_path):
+        """Test that a daemon searching other template directories is skipped."""
+        org_dir = tmp_path / "org-templates"
+        org_dir.mkdir()
+
+        default_path = get_registry(()).search_path
+        org_path = get_registry((org_dir,)).search_path
+
+        assert DaemonClient.discover(daemon, search_path=default_path) is not None
+        assert DaemonClient.discover(daemon, search_path=org_path) is None
+
+    def test_discover_checks_options(self, daemon):
+        """Test that a daemon with other output options is skipped."""
+        options = {"structural_validation": False, "cache_dependencies": False}
+        assert DaemonClient.discover(daemon, options=options) is not None
+
+        options["cache_dependencies"] = True
+        assert DaemonClient.discover(daemon, options=options) is None
+
+    def test_existing_state_file_made_private(self, tmp_path):
+        """Test that rewriting a world-readable state file makes it private."""
+        state_path = tmp_path / "daemon.json"
+        state_path.write_text("{}")
+        state_path.chmod(0o644)
+
+        server = GeneratorServer("127.0.0.1", 0, cache_dir=tmp_path)
+        try:
+            server.write_state(state_path)
+        finally:
+            server.server_close()
+
+        assert state_path.stat().st_mode & 0o077 == 0
+        assert json.loads(state_path.read_text())["token"] == server.token
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_discover_without_daemon(self, tmp_path):
+        """Test that discovery fails cleanly without a daemon."""
+        assert DaemonClient.discover(tmp_path / "missing.json") is None
+
+    def test_discover_disabled(self, daemon, monkeypatch):
+        """Test that GHA_GEN_NO_DAEMON disables discovery."""
+        monkeypatch.setenv("GHA_GEN_NO_DAEMON", "1")
+        assert DaemonClient.discover(daemon) is None
+
+    def test_render(self, daemon):
+        """Test rendering through the daemon."""
+        client = DaemonClient.discover(daemon)
+        content = client.render("react-app", {"project_name": "web", "node_version": "20"})
+        assert "web" in content
+
+    def test_generate(self, daemon, tmp_path):
+        """Test generating a file through the daemon."""
+        client = DaemonClient.discover(daemon)
+        path = client.generate("django-api", {"project_name": "api"}, tmp_path / "out")
+
+        assert path == tmp_path / "out" / "ci.yml"
+        assert "api" in path.read_text()
+
+    def test_validate(self, daemon, tmp_path):
+        """Test validating content and files through the daemon."""
+        client = DaemonClient.discover(daemon)
+        workflow = tmp_path / "ci.yml"
+        workflow.write_text("name: [CI\n")
+
+        assert client.validate(content="name: CI\n")[0] is True
+        assert client.validate(path=workflow)[0] is False
+
+    def test_errors_are_reported(self, daemon):
+        """Test that request failures raise DaemonError."""
+        client = DaemonClient.discover(daemon)
+        with pytest.raises(DaemonError, match="not found"):
+            client.render("unknown", {})
+
+    def test_invalid_token_is_rejected(self, daemon):
+        """Test that requests without the token are refused."""
+        client = DaemonClient.discover(daemon)
+        client.token = "wrong"
+        with pytest.raises(DaemonError, match="token"):
+            client.render("react-app", {})
+
+    def test_state_file_removed_on_shutdown(self, tmp_path):
+        """Test that the daemon removes its state file when it stops."""
+        state_path = tmp_path / "daemon.json"
+        servers = []
+        thread = threading.Thread(
+            target=serve,
+            kwargs={"state_path": state_path, "ready": servers.append, "cache_dir": tmp_path},
+            daemon=True,
+        )
+        thread.start()
+        while not servers:
+            thread.join(0.01)
+
+        servers[0].shutdown()
+        thread.join(10)
+        assert not state_path.exists()
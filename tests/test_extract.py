@@ -0,0 +1,135 @@
+"""
+Unit tests for the workflow variable extraction module.
+"""
+
+import pytest
+
+from gha_generator.extract import SENTINEL, TemplateSkeleton, build_skeleton
+from gha_generator.generator import WorkflowGenerator
+
+
+@pytest.fixture(scope="module")
+def generator():
+    """Create a generator over the bundled templates."""
+    return WorkflowGenerator(bytecode_cache=False)
+
+
+def render(generator, template, variables):
+    """Render a bundled template."""
+    return generator.render_validated(generator.load_template(template), variables)
+
+
+class TestTemplateSkeleton:
+    """Test suite for TemplateSkeleton."""
+
+    @pytest.mark.parametrize(
+        "template, variables",
+        [
+            ("data-science", {"project_name": "ml", "python_version": "3.10"}),
+            ("django-api", {"project_name": "shop-api", "python_version": "3.12"}),
+            ("laravel-api", {"project_name": "lara", "php_version": "8.3"}),
+            ("react-app", {"project_name": "web", "node_version": "20"}),
+        ],
+    )
+    def test_round_trip(self, generator, template, variables):
+        """Test that a generated workflow gives back its variables, without drift."""
+        result = build_skeleton(generator, template).match(render(generator, template, variables))
+
+        assert result.variables == variables
+        assert result.matched == result.total
+        assert result.similarity == 1.0
+        assert result.missing == []
+        assert result.conflicts == {}
+        assert result.hunks == []
+
+    def test_drift_hunks(self, generator):
+        """Test that hand edits are reported as hunks against the filled template."""
+        content = render(generator, "django-api", {"project_name": "api", "python_version": "3.12"})
+        content = content.replace("postgres:15", "postgres:16").replace(
+            "      - name: Run migrations\n",
+            "      - name: Seed\n        run: make seed\n\n      - name: Run migrations\n",
+        )
+
+        result = build_skeleton(generator, "django-api").match(content)
+
+        assert result.variables == {"project_name": "api", "python_version": "3.12"}
+        assert len(result.hunks) == 2
+        changed, inserted = result.hunks
+        assert changed.expected == ["        image: postgres:15"]
+        assert changed.actual == ["        image: postgres:16"]
+        assert inserted.expected == []
+        assert inserted.actual == ["      - name: Seed", "        run: make seed", ""]
+        assert inserted.format().startswith(f"@@ -{inserted.template_start + 1},0 ")
+
+    def test_conflicting_values(self, generator):
+        """Test that the most frequent value wins and the others are reported."""
+        content = render(generator, "django-api", {"project_name": "api", "python_version": "3.12"})
+        content = content.replace('python-version: "3.12"', 'python-version: "3.13"', 1)
+
+        result = build_skeleton(generator, "django-api").match(content)
+
+        assert result.variables["python_version"] == "3.12"
+        assert result.conflicts == {"python_version": ["3.12", "3.13"]}
+
+    def test_matrix_versions(self, generator):
+        """Test that version lists are read back from the build matrix."""
+        content = render(
+            generator, "django-api", {"project_name": "api", "python_version": ["3.11", "3.12"]}
+        )
+
+        result = build_skeleton(generator, "django-api").match(content)
+
+        assert result.variables == {"project_name": "api", "python_version": ["3.11", "3.12"]}
+        assert result.hunks == []
+        assert result.similarity == 1.0
+
+    def test_matrix_drift(self, generator):
+        """Test that edits to a matrix workflow are reported against matrix mode."""
+        content = render(
+            generator,
+            "django-api",
+            {"project_name": "api", "python_version": ["3.11", "3.12"], "max_parallel": 1},
+        )
+        content = content.replace("timeout-minutes: 30", "timeout-minutes: 45")
+
+        result = build_skeleton(generator, "django-api").match(content)
+
+        assert result.variables["python_version"] == ["3.11", "3.12"]
+        assert [(hunk.expected, hunk.actual) for hunk in result.hunks] == [
+            (["    timeout-minutes: 30"], ["    timeout-minutes: 45"])
+        ]
+
+    def test_missing_variable(self):
+        """Test that a variable whose lines are all gone is reported missing."""
+        skeleton = TemplateSkeleton(
+            "demo",
+            [
+                f"name: {SENTINEL}project_name{SENTINEL} CI",
+                "jobs:",
+                f"  version: {SENTINEL}python_version{SENTINEL}",
+            ],
+        )
+
+        result = skeleton.match("name: demo CI\njobs:\n  other: 1\n")
+
+        assert result.variables == {"project_name": "demo"}
+        assert result.missing == ["python_version"]
+        assert result.hunks[0].expected == ["  version: {{ python_version }}"]
+
+    def test_hole_in_first_word(self):
+        """Test lines whose leading word is itself a variable."""
+        skeleton = TemplateSkeleton("demo", [f"  {SENTINEL}job{SENTINEL}-test:", "    steps: []"])
+
+        result = skeleton.match("  unit-test:\n    steps: []\n")
+
+        assert result.variables == {"job": "unit"}
+        assert result.hunks == []
+
+    def test_other_template(self, generator):
+        """Test that a workflow from another template matches poorly."""
+        content = render(generator, "django-api", {"project_name": "api", "python_version": "3.12"})
+
+        result = build_skeleton(generator, "react-app").match(content)
+
+        assert result.similarity < 0.8
+        assert "node_version" in result.missing
@@ -2,11 +2,26 @@
 Unit tests for the WorkflowGenerator class.
 """
 
+import os
+import tracemalloc
 
 import pytest
 import yaml
 
+from gha_generator.batch import BatchJob
 from gha_generator.generator import WorkflowGenerator
+from gha_generator.registry import TemplateRegistry
+
+
+def make_generator(tmp_path, templates, **options):
+    """Create a generator with extra templates in a user template directory."""
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    for name, source in templates.items():
+        (template_dir / name).write_text(source)
+
+    registry = TemplateRegistry([template_dir], index_path=tmp_path / "index.json")
+    return WorkflowGenerator(registry=registry, **options)
 
 
 class TestWorkflowGenerator:
@@ -103,6 +118,20 @@ class TestWorkflowGenerator:
         assert is_valid is False
         assert "invalid" in message.lower()
 
+    def test_validate_output_structural(self, generator):
+        """Test structural validation of valid and invalid YAML."""
+        assert generator.validate_output("a: [1, 2]\n", structural=True)[0] is True
+
+        is_valid, message = generator.validate_output("a: [1, 2\n", structural=True)
+        assert is_valid is False
+        assert "invalid" in message.lower()
+
+    def test_generate_with_structural_validation(self, sample_variables, tmp_path):
+        """Test generating with structural validation enabled."""
+        generator = WorkflowGenerator(structural_validation=True)
+        workflow_file = generator.generate("django-api", sample_variables, tmp_path)
+        assert yaml.safe_load(workflow_file.read_text())["jobs"]
+
     def test_write_workflow(self, generator, tmp_path):
         """Test writing workflow content to file."""
         content = "name: Test\non: push\njobs:\n  test:\n    runs-on: ubuntu-latest"
@@ -235,3 +264,387 @@ class TestWorkflowGenerator:
         content = workflow_file.read_text()
         assert "React" in content or "react" in content
         assert "npm" in content.lower()
+
+    def test_generate_many(self, generator, sample_variables, tmp_path):
+        """Test generating several workflows in one call."""
+        jobs = [
+            BatchJob("data-science", sample_variables, tmp_path / "a"),
+            BatchJob("react-app", sample_variables, tmp_path / "b", "web.yml"),
+            BatchJob("data-science", sample_variables, tmp_path / "c"),
+        ]
+
+        results = list(generator.generate_many(jobs))
+
+        assert [r.index for r in results] == [0, 1, 2]
+        assert all(r.success for r in results)
+        assert results[1].path == tmp_path / "b" / "web.yml"
+        assert (tmp_path / "c" / "ci.yml").exists()
+
+    def test_generate_many_reports_failures(self, generator, sample_variables, tmp_path):
+        """Test that a failing job does not abort the batch."""
+        jobs = [
+            BatchJob("non-existent-template", sample_variables, tmp_path / "a"),
+            BatchJob("django-api", sample_variables, tmp_path / "b"),
+        ]
+
+        results = list(generator.generate_many(jobs))
+
+        assert results[0].success is False
+        assert "not found" in results[0].error
+        assert results[1].success is True
+        assert (tmp_path / "b" / "ci.yml").exists()
+
+    def test_generate_many_loads_each_template_once(self, generator, sample_variables, tmp_path):
+        """Test that templates are loaded once per type."""
+        calls = []
+        original = generator.load_template
+
+        def counting_load(template_type):
+            calls.append(template_type)
+            return original(template_type)
+
+        generator.load_template = counting_load
+        jobs = [BatchJob("data-science", sample_variables, tmp_path / str(i)) for i in range(5)]
+
+        list(generator.generate_many(jobs))
+
+        assert calls == ["data-science"]
+
+    def test_plan_many(self, generator, sample_variables, tmp_path):
+        """Test that planning reports new, changed and unchanged files without writing."""
+        jobs = [
+            BatchJob("react-app", sample_variables, tmp_path / "same"),
+            BatchJob("react-app", sample_variables, tmp_path / "edited"),
+            BatchJob("react-app", sample_variables, tmp_path / "missing"),
+            BatchJob("unknown", sample_variables, tmp_path / "broken"),
+        ]
+        list(generator.generate_many(jobs[:2]))
+        edited = tmp_path / "edited" / "ci.yml"
+        edited.write_text(edited.read_text().replace("npm ci", "npm install"))
+        before = edited.read_text()
+
+        results = list(generator.plan_many(jobs, diff=True))
+
+        assert [r.status for r in results] == ["unchanged", "changed", "new", "failed"]
+        assert results[0].diff is None
+        assert "-          npm install\n+          npm ci\n" in results[1].diff
+        assert results[2].diff.startswith("--- /dev/null\n")
+        assert "not found" in results[3].error
+        assert edited.read_text() == before
+        assert not (tmp_path / "missing").exists()
+
+    def test_plan_many_hashes_before_diffing(self, generator, sample_variables, tmp_path):
+        """Test that files of the same size are compared by hash and not diffed by default."""
+        job = BatchJob("react-app", sample_variables, tmp_path)
+        workflow_file = generator.generate(job.template, job.variables, tmp_path)
+        content = workflow_file.read_text()
+        workflow_file.write_text(content.replace("npm ci", "npm CI"))
+
+        (result,) = generator.plan_many([job])
+
+        assert result.status == "changed"
+        assert result.diff is None
+
+    def test_render_cache_skips_render_and_validation(self, sample_variables, tmp_path):
+        """Test that an unchanged input is served from the render cache."""
+        first = WorkflowGenerator(cache_dir=tmp_path, render_cache=True)
+        expected = first.generate("django-api", sample_variables, tmp_path / "a").read_text()
+
+        second = WorkflowGenerator(cache_dir=tmp_path, render_cache=True)
+        second.render_template = None
+        second.validate_output = None
+
+        workflow_file = second.generate("django-api", sample_variables, tmp_path / "b")
+        assert workflow_file.read_text() == expected
+
+    def test_render_cache_miss_on_new_variables(self, sample_variables, tmp_path):
+        """Test that changed variables are rendered again."""
+        generator = WorkflowGenerator(cache_dir=tmp_path, render_cache=True)
+        generator.generate("data-science", sample_variables, tmp_path / "a")
+
+        changed = dict(sample_variables, project_name="other-project")
+        workflow_file = generator.generate("data-science", changed, tmp_path / "b")
+        assert "other-project" in workflow_file.read_text()
+
+    def test_template_digest(self, generator):
+        """Test that template digests are stable and distinct."""
+        digest = generator.template_digest("django-api.yml")
+        assert digest == generator.template_digest("django-api.yml")
+        assert digest != generator.template_digest("react-app.yml")
+
+    def test_write_workflow_skips_identical_content(self, generator, tmp_path):
+        """Test that identical content does not rewrite the file."""
+        workflow_file = generator.write_workflow(tmp_path, "name: Test\n", "ci.yml")
+        os.utime(workflow_file, ns=(0, 0))
+
+        generator.write_workflow(tmp_path, "name: Test\n", "ci.yml")
+        assert workflow_file.stat().st_mtime_ns == 0
+
+        generator.write_workflow(tmp_path, "name: Other\n", "ci.yml")
+        assert workflow_file.stat().st_mtime_ns != 0
+        assert workflow_file.read_text() == "name: Other\n"
+
+    def test_generate_many_reports_changed(self, generator, sample_variables, tmp_path):
+        """Test that regenerating identical output reports it as unchanged."""
+        jobs = [BatchJob("react-app", sample_variables, tmp_path)]
+
+        first = list(generator.generate_many(jobs))
+        second = list(generator.generate_many(jobs))
+
+        assert first[0].changed is True
+        assert second[0].changed is False
+
+    def test_generate_many_batches_directory_fsync(self, sample_variables, tmp_path, monkeypatch):
+        """Test that each directory is flushed once per batch."""
+        flushed = []
+        monkeypatch.setattr(
+            "gha_generator.generator.fsync_directory", lambda path: flushed.append(path)
+        )
+        generator = WorkflowGenerator(fsync=True)
+        jobs = [BatchJob("react-app", sample_variables, tmp_path, f"w{i}.yml") for i in range(3)]
+
+        results = list(generator.generate_many(jobs))
+
+        assert all(r.success for r in results)
+        assert flushed == [tmp_path]
+
+    def test_streaming_matches_buffered_output(self, sample_variables, tmp_path):
+        """Test that streaming writes the same bytes as a buffered render."""
+        buffered = WorkflowGenerator().generate("django-api", sample_variables, tmp_path / "a")
+        streamed = WorkflowGenerator(streaming=True).generate(
+            "django-api", sample_variables, tmp_path / "b"
+        )
+
+        assert streamed.read_bytes() == buffered.read_bytes()
+
+    def test_streaming_skips_identical_content(self, sample_variables, tmp_path):
+        """Test that streaming leaves an identical file untouched."""
+        generator = WorkflowGenerator(streaming=True)
+        jobs = [BatchJob("react-app", sample_variables, tmp_path)]
+
+        first = list(generator.generate_many(jobs))
+        second = list(generator.generate_many(jobs))
+
+        assert first[0].changed is True
+        assert second[0].changed is False
+        assert [p.name for p in tmp_path.iterdir()] == ["ci.yml"]
+
+    def test_streaming_rejects_invalid_yaml(self, tmp_path):
+        """Test that invalid streamed output never replaces the target."""
+        generator = make_generator(
+            tmp_path, {"broken.yml": "name: CI\nsteps: [unclosed\n"}, streaming=True
+        )
+        output = tmp_path / "out"
+        output.mkdir()
+        target = output / "ci.yml"
+        target.write_text("name: Old\n")
+
+        with pytest.raises(ValueError, match="invalid"):
+            generator.generate("broken", {}, output)
+
+        assert target.read_text() == "name: Old\n"
+        assert [p.name for p in output.iterdir()] == ["ci.yml"]
+
+    def test_streaming_memory_stays_flat(self, tmp_path):
+        """Test that streaming does not hold the whole workflow in memory."""
+        generator = make_generator(
+            tmp_path,
+            {
+                "large.yml": (
+                    "jobs:\n"
+                    "{% for i in range(count) %}"
+                    "  job-{{ i }}:\n    runs-on: ubuntu-latest\n"
+                    "{% endfor %}"
+                ),
+            },
+            streaming=True,
+        )
+
+        tracemalloc.start()
+        try:
+            workflow_file = generator.generate("large", {"count": 40_000}, tmp_path / "out")
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert workflow_file.stat().st_size > 1_500_000
+        assert peak < 500_000
+
+    def test_user_templates_override_bundled(self, sample_variables, tmp_path):
+        """Test that a user template directory overrides bundled templates."""
+        generator = make_generator(tmp_path, {"react-app.yml": "name: {{ project_name }} custom\n"})
+
+        workflow_file = generator.generate("react-app", sample_variables, tmp_path / "out")
+
+        assert workflow_file.read_text() == "name: test-project custom"
+        assert "django-api" in generator.list_templates()
+
+    def test_template_dirs_are_layered(self, sample_variables, tmp_path):
+        """Test that template_dirs layer org over team over bundled templates."""
+        org, team = tmp_path / "org", tmp_path / "team"
+        org.mkdir()
+        team.mkdir()
+        (org / "react-app.yml").write_text("name: org {{ project_name }}\n")
+        (team / "react-app.yml").write_text("name: team\n")
+        (team / "go-service.yml").write_text("name: team {{ project_name }}\n")
+
+        generator = WorkflowGenerator(template_dirs=[org, team], cache_size=2)
+
+        assert generator.env.cache.capacity == 2
+        react = generator.generate("react-app", sample_variables, tmp_path / "react")
+        go = generator.generate("go-service", sample_variables, tmp_path / "go")
+        assert react.read_text() == "name: org test-project"
+        assert go.read_text() == "name: team test-project"
+
+    def test_templates_extend_base(self, generator):
+        """Test that every template extends base.yml and shares its partials."""
+        from jinja2 import meta
+
+        for template_type in generator.list_templates():
+            source, _, _ = generator.env.loader.get_source(generator.env, f"{template_type}.yml")
+            referenced = set(meta.find_referenced_templates(generator.env.parse(source)))
+            assert "base.yml" in referenced
+
+        base_source, _, _ = generator.env.loader.get_source(generator.env, "base.yml")
+        assert "partials/checkout.yml" in set(
+            meta.find_referenced_templates(generator.env.parse(base_source))
+        )
+
+    @pytest.mark.parametrize(
+        "template_type", ["data-science", "django-api", "laravel-api", "react-app"]
+    )
+    def test_inherited_workflow_structure(self, generator, sample_variables, template_type):
+        """Test that the shared base blocks render into every workflow."""
+        content = generator.render_template(
+            generator.load_template(template_type), sample_variables
+        )
+        workflow = yaml.safe_load(content)
+
+        assert workflow["name"].startswith("test-project - ")
+        assert workflow["env"]["PROJECT_NAME"] == "test-project"
+        job = workflow["jobs"]["test"]
+        assert job["permissions"] == {"contents": "read", "pull-requests": "write"}
+        assert job["steps"][0]["uses"] == "actions/checkout@v4"
+        uploads = [step for step in job["steps"] if step["name"] == "Upload coverage reports"]
+        assert len(uploads) == 1
+
+    def test_template_digest_covers_partials(self, tmp_path):
+        """Test that editing a partial changes the digest of templates using it."""
+        generator = make_generator(
+            tmp_path,
+            {"web.yml": '{% include "partials/step.yml" %}'},
+            reload_ttl=0,
+        )
+        partials = tmp_path / "templates" / "partials"
+        partials.mkdir()
+        (partials / "step.yml").write_text("name: v1")
+        before = generator.template_digest("web.yml")
+
+        (partials / "step.yml").write_text("name: v2")
+        os.utime(partials / "step.yml", ns=(10**18, 10**18))
+
+        assert generator.template_digest("web.yml") != before
+
+    def test_render_cache_follows_edited_template(self, tmp_path):
+        """Test that a long-lived generator does not serve output of an edited template."""
+        generator = make_generator(
+            tmp_path,
+            {"svc.yml": "name: {{ project_name }} v1\non: push\njobs: {}\n"},
+            render_cache=True,
+            cache_dir=tmp_path / "cache",
+            reload_ttl=0,
+        )
+        variables = {"project_name": "svc"}
+        assert "v1" in generator.render_validated(generator.load_template("svc"), variables)
+
+        source = tmp_path / "templates" / "svc.yml"
+        source.write_text("name: {{ project_name }} v2 changed\non: push\njobs: {}\n")
+        os.utime(source, ns=(10**18, 10**18))
+
+        content = generator.render_validated(generator.load_template("svc"), variables)
+        assert "v2 changed" in content
+
+    def test_invalid_variables_rejected_before_render(self, generator, tmp_path, monkeypatch):
+        """Test that bad variables fail without rendering the template."""
+
+        def fail(*args):
+            raise AssertionError("template should not be rendered")
+
+        monkeypatch.setattr(generator, "render_template", fail)
+        jobs = [BatchJob("react-app", {"project_name": "web", "node_version": "v20"}, tmp_path)]
+
+        results = list(generator.generate_many(jobs))
+
+        assert results[0].success is False
+        assert "'node_version' must be a Node.js version" in results[0].error
+        assert not (tmp_path / "ci.yml").exists()
+
+    def test_generate_applies_schema_defaults(self, generator, tmp_path):
+        """Test that missing optional variables get their schema default."""
+        workflow_file = generator.generate("laravel-api", {"project_name": "shop"}, tmp_path)
+
+        assert 'PHP_VERSION: "8.2"' in workflow_file.read_text()
+
+    def test_generate_many_creates_each_directory_once(
+        self, generator, sample_variables, tmp_path, monkeypatch
+    ):
+        """Test that a directory shared by several jobs is created once."""
+        created = []
+        original_mkdir = type(tmp_path).mkdir
+
+        def counting_mkdir(path, *args, **kwargs):
+            created.append(path)
+            return original_mkdir(path, *args, **kwargs)
+
+        monkeypatch.setattr(type(tmp_path), "mkdir", counting_mkdir)
+        jobs = [
+            BatchJob(template, sample_variables, tmp_path / "repo", f"{template}.yml")
+            for template in ("django-api", "react-app", "data-science")
+        ]
+
+        results = list(generator.generate_many(jobs))
+
+        assert all(r.success for r in results)
+        assert created == [tmp_path / "repo"]
+
+    def test_generate_version_matrix(self, generator, tmp_path):
+        """Test that a version list renders a strategy matrix with a job-level env."""
+        workflow_file = generator.generate(
+            "django-api",
+            {"project_name": "api", "python_version": ["3.11", "3.12", "3.12"], "max_parallel": 1},
+            tmp_path,
+        )
+
+        workflow = yaml.safe_load(workflow_file.read_text())
+        job = workflow["jobs"]["test"]
+        assert "PYTHON_VERSION" not in workflow["env"]
+        assert job["env"] == {"PYTHON_VERSION": "${{ matrix.python-version }}"}
+        assert job["strategy"] == {
+            "max-parallel": 1,
+            "matrix": {"python-version": ["3.11", "3.12"]},
+        }
+        assert job["steps"][1]["with"]["python-version"] == "${{ matrix.python-version }}"
+
+    def test_single_version_list_is_scalar(self, generator, sample_variables, tmp_path):
+        """Test that a one-item version list renders like a plain version."""
+        scalar = generator.generate("react-app", sample_variables, tmp_path / "a")
+        listed = generator.generate(
+            "react-app", {**sample_variables, "node_version": ["18", "18"]}, tmp_path / "b"
+        )
+
+        assert listed.read_text() == scalar.read_text()
+
+    def test_generate_with_dependency_cache(self, sample_variables, tmp_path):
+        """Test that cache_dependencies adds cache steps and bypasses streaming."""
+        generator = WorkflowGenerator(
+            cache_dir=tmp_path / "cache", render_cache=True, streaming=True, cache_dependencies=True
+        )
+        plain = WorkflowGenerator(cache_dir=tmp_path / "cache", render_cache=True)
+
+        assert generator.streaming is False
+
+        optimized = generator.generate("react-app", sample_variables, tmp_path / "a")
+        rendered = plain.generate("react-app", sample_variables, tmp_path / "b")
+
+        assert "actions/cache@v4" in optimized.read_text()
+        assert "actions/cache@v4" not in rendered.read_text()
@@ -0,0 +1,228 @@
+"""
+Unit tests for the workflow linting module.
+"""
+
+import pytest
+
+from gha_generator.generator import WorkflowGenerator
+from gha_generator.lint import ERROR, WARNING, Linter, lint_file, lint_workflow, load_schema
+
+HEADER = "on: push\njobs:\n"
+
+
+def rules(content):
+    """Lint a workflow and return the (line, rule) of each issue."""
+    return [(issue.line, issue.rule) for issue in lint_workflow(content)]
+
+
+class TestLintWorkflow:
+    """Test suite for lint_workflow."""
+
+    @pytest.mark.parametrize("cache_dependencies", [False, True])
+    def test_bundled_templates_are_clean(self, cache_dependencies):
+        """Test that every bundled template renders a workflow without issues."""
+        generator = WorkflowGenerator(bytecode_cache=False, cache_dependencies=cache_dependencies)
+
+        for name in generator.list_templates():
+            content = generator.render_validated(
+                generator.load_template(name), {"project_name": "demo"}
+            )
+            assert lint_workflow(content) == [], name
+
+    def test_workflow_keys(self):
+        """Test top-level keys."""
+        assert rules("name: CI\njob: {}\n") == [
+            (1, "missing-key"),
+            (1, "missing-key"),
+            (2, "unknown-key"),
+        ]
+
+    def test_events(self):
+        """Test event names, filters and activity types."""
+        content = (
+            "on:\n"
+            "  push:\n"
+            "    branch: [main]\n"
+            "    paths: [src]\n"
+            "    paths-ignore: [docs]\n"
+            "  pull_request:\n"
+            "    types: [opened, synchronise]\n"
+            "  pushh:\n"
+            "  workflow_dispatch:\n"
+            "  schedule:\n"
+            "    - cron: '0 3 * * 1'\n"
+            "    - cron: '0 3 * *'\n"
+            "jobs:\n"
+            "  a:\n    runs-on: ubuntu-latest\n    steps:\n      - run: make\n"
+        )
+
+        issues = lint_workflow(content)
+
+        assert [(issue.line, issue.rule) for issue in issues] == [
+            (3, "event-filter"),
+            (3, "event-filter"),
+            (7, "activity-type"),
+            (8, "unknown-event"),
+            (12, "cron"),
+        ]
+        assert "did you mean 'branches'?" in issues[0].message
+        assert "'paths' and 'paths-ignore'" in issues[1].message
+        assert "did you mean 'synchronize'?" in issues[2].message
+
+    def test_event_list(self):
+        """Test events given as a list."""
+        content = "on: [push, pull-request]\njobs:\n  a:\n    uses: o/r/.github/workflows/w.yml@v1"
+
+        assert rules(content) == [(1, "unknown-event")]
+
+    def test_runs_on(self):
+        """Test runner labels: typos are errors, unknown labels warnings."""
+        content = HEADER + (
+            "  a:\n    runs-on: ubuntu-lates\n    steps: [{run: make}]\n"
+            "  b:\n    runs-on: gpu-8core\n    steps: [{run: make}]\n"
+            "  c:\n    runs-on: [self-hosted, linux, gpu]\n    steps: [{run: make}]\n"
+            "  d:\n    runs-on: ${{ matrix.os }}\n    steps: [{run: make}]\n"
+            "  e:\n    runs-on: {group: large, labels: [x64]}\n    steps: [{run: make}]\n"
+        )
+
+        issues = lint_workflow(content)
+
+        assert [(issue.line, issue.severity) for issue in issues] == [(4, ERROR), (7, WARNING)]
+        assert "did you mean 'ubuntu-latest'?" in issues[0].message
+
+    def test_jobs(self):
+        """Test job ids, job keys, needs and reusable workflow calls."""
+        content = HEADER + (
+            "  1st:\n    runs-on: ubuntu-latest\n    step: []\n"
+            "  build:\n    needs: [tests, build]\n    runs-on: ubuntu-latest\n"
+            "    timeout-minutes: soon\n    steps: [{run: make}]\n"
+            "  call:\n    needs: build\n    uses: org/repo/.github/workflows/ci.yml@main\n"
+            "    runs-on: ubuntu-latest\n"
+        )
+
+        assert rules(content) == [
+            (3, "job-id"),
+            (4, "missing-key"),
+            (5, "unknown-key"),
+            (7, "needs"),
+            (7, "needs"),
+            (9, "type"),
+            (14, "unknown-key"),
+        ]
+
+    def test_steps(self):
+        """Test step kinds and action references."""
+        content = HEADER + (
+            "  a:\n    runs-on: ubuntu-latest\n    steps:\n"
+            "      - uses: actions/checkout\n"
+            "      - run: make\n        uses: org/action@v1\n"
+            "      - run: make\n        with: {a: 1}\n"
+            "      - uses: ./local-action\n        shell: bash\n"
+            "      - uses: docker://alpine:3\n"
+        )
+
+        assert rules(content) == [
+            (6, "uses"),
+            (7, "step-kind"),
+            (9, "step-kind"),
+            (11, "step-kind"),
+        ]
+
+    def test_action_inputs(self):
+        """Test inputs of actions known to the bundled schema."""
+        content = HEADER + (
+            "  a:\n    runs-on: ubuntu-latest\n    steps:\n"
+            "      - uses: actions/setup-python@v5\n"
+            "        with:\n          python_version: '3.12'\n"
+            "      - uses: actions/cache@v4\n        with:\n          path: ~/.npm\n"
+            "      - uses: someone/unknown-action@v1\n        with:\n          anything: 1\n"
+        )
+
+        issues = lint_workflow(content)
+
+        assert [(issue.line, issue.rule) for issue in issues] == [
+            (8, "unknown-input"),
+            (9, "missing-input"),
+        ]
+        assert "did you mean 'python-version'?" in issues[0].message
+        assert "'key'" in issues[1].message
+
+    def test_permissions(self):
+        """Test workflow and job permissions."""
+        content = (
+            "on: push\npermissions:\n  contents: raed\n  idtoken: write\n  id-token: read\n"
+            "jobs:\n  a:\n    permissions: read-all\n    runs-on: ubuntu-latest\n"
+            "    steps: [{run: make}]\n"
+            "  b:\n    permissions: everything\n    runs-on: ubuntu-latest\n"
+            "    steps: [{run: make}]\n"
+        )
+
+        assert rules(content) == [
+            (3, "permissions"),
+            (4, "permissions"),
+            (5, "permissions"),
+            (12, "permissions"),
+        ]
+
+    def test_invalid_yaml(self):
+        """Test that invalid YAML is reported as a ValueError."""
+        with pytest.raises(ValueError, match="Invalid YAML syntax"):
+            lint_workflow("on: [push\n")
+
+    def test_empty_document(self):
+        """Test that an empty file is an issue, not a crash."""
+        assert rules("") == [(1, "type")]
+
+    def test_lint_file(self, tmp_path):
+        """Test linting a file."""
+        path = tmp_path / "ci.yml"
+        path.write_text(HEADER + "  a:\n    runs-on: ubuntu-latest\n")
+
+        issues = lint_file(path)
+
+        assert issues[0].format(path) == (
+            f"{path}:4:5: error [missing-key] Job 'a' has no 'steps' key"
+        )
+
+
+class TestLinter:
+    """Test suite for the rule dispatch tree."""
+
+    def test_custom_rules_single_walk(self):
+        """Test that wildcard and named rules both apply, each node visited once."""
+        visits = []
+
+        def record(node, context):
+            visits.append(context.path)
+            return iter(())
+
+        linter = Linter([("jobs.*", record), ("jobs.build", record), ("jobs.*.steps.[]", record)])
+        linter.lint(HEADER + "  build:\n    steps: [{run: a}, {run: b}]\n  test: {}\n")
+
+        assert sorted(visits) == [
+            ("jobs", "build"),
+            ("jobs", "build"),
+            ("jobs", "build", "steps", "[]"),
+            ("jobs", "build", "steps", "[]"),
+            ("jobs", "test"),
+        ]
+
+    def test_unmatched_subtrees_are_skipped(self):
+        """Test that nodes below paths without rules are not visited."""
+        visits = []
+
+        def record(node, context):
+            visits.append(context.path)
+            return iter(())
+
+        Linter([("on", record)]).lint(HEADER + "  a:\n    steps: [{run: a}]\n")
+
+        assert visits == [("on",)]
+
+    def test_bundled_schema(self):
+        """Test that the bundled schema is packaged and loadable offline."""
+        schema = load_schema()
+
+        assert "push" in schema["events"]
+        assert "ubuntu-latest" in schema["runners"]["hosted"]
+        assert "fetch-depth" in schema["actions"]["actions/checkout"]["inputs"]
@@ -0,0 +1,77 @@
+"""
+Unit tests for the layered template loader.
+"""
+
+import os
+
+import pytest
+from jinja2 import Environment
+
+from gha_generator import loaders
+from gha_generator.loaders import TTLFileSystemLoader, create_layered_loader
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLoaders:
+    """Test suite for template loaders."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the loader clock."""
+        clock = FakeClock()
+        monkeypatch.setattr(loaders.time, "monotonic", clock)
+        return clock
+
+    def edit(self, path, content):
+        """Rewrite a template and move its mtime forward."""
+        stat = path.stat()
+        path.write_text(content)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_layers_override_in_order(self, tmp_path):
+        """Test that earlier layers win and later layers fill the gaps."""
+        org, team = tmp_path / "org", tmp_path / "team"
+        org.mkdir()
+        team.mkdir()
+        (org / "ci.yml").write_text("{% extends 'base.yml' %}{% block name %}org{% endblock %}")
+        (team / "ci.yml").write_text("team")
+        (team / "base.yml").write_text("name: {% block name %}{% endblock %}")
+
+        env = Environment(loader=create_layered_loader([org, team]))
+
+        assert env.get_template("ci.yml").render() == "name: org"
+
+    def test_freshness_checked_once_per_ttl(self, tmp_path, clock):
+        """Test that edits are only picked up after the reload interval."""
+        template = tmp_path / "ci.yml"
+        template.write_text("v1")
+        env = Environment(loader=TTLFileSystemLoader(str(tmp_path), reload_ttl=5))
+
+        assert env.get_template("ci.yml").render() == "v1"
+        self.edit(template, "v2")
+
+        clock.now += 1
+        assert env.get_template("ci.yml").render() == "v1"
+
+        clock.now += 5
+        assert env.get_template("ci.yml").render() == "v2"
+
+    def test_zero_ttl_checks_every_time(self, tmp_path, clock):
+        """Test that a zero interval keeps Jinja2's per-load check."""
+        template = tmp_path / "ci.yml"
+        template.write_text("v1")
+        env = Environment(loader=TTLFileSystemLoader(str(tmp_path), reload_ttl=0))
+
+        assert env.get_template("ci.yml").render() == "v1"
+        self.edit(template, "v2")
+
+        assert env.get_template("ci.yml").render() == "v2"
@@ -0,0 +1,133 @@
+"""
+Unit tests for the matrix planner.
+"""
+
+import pytest
+import yaml
+
+from gha_generator.matrix import MAX_MATRIX_JOBS, apply_matrix, plan_matrix
+
+
+class TestPlanMatrix:
+    """Test suite for plan_matrix."""
+
+    def test_duplicate_values_removed(self):
+        """Test that repeated axis values are planned once."""
+        plan = plan_matrix({"python-version": ["3.11", "3.12", "3.11"]})
+
+        assert plan.axes == {"python-version": ["3.11", "3.12"]}
+        assert len(plan.combinations()) == 2
+
+    def test_redundant_include_and_exclude_dropped(self):
+        """Test that entries with no effect are left out of the plan."""
+        plan = plan_matrix(
+            {"python-version": ["3.11", "3.12"], "os": ["ubuntu-latest", "windows-latest"]},
+            include=[
+                {"python-version": "3.11", "os": "ubuntu-latest"},
+                {"python-version": "3.13", "os": "ubuntu-latest"},
+                {"python-version": "3.13", "os": "ubuntu-latest"},
+            ],
+            exclude=[
+                {"os": "macos-latest"},
+                {"python-version": "3.11", "os": "windows-latest"},
+            ],
+        )
+
+        assert plan.include == [{"python-version": "3.13", "os": "ubuntu-latest"}]
+        assert plan.exclude == [{"python-version": "3.11", "os": "windows-latest"}]
+        assert len(plan.combinations()) == 4
+
+    def test_include_adds_keys_to_matching_jobs(self):
+        """Test that an include entry matching jobs extends them."""
+        plan = plan_matrix(
+            {"node-version": ["18", "20"]},
+            include=[{"node-version": "20", "experimental": True}],
+        )
+
+        assert plan.combinations() == [
+            {"node-version": "18"},
+            {"node-version": "20", "experimental": True},
+        ]
+
+    def test_strategy_options(self):
+        """Test that fail-fast and max-parallel are only emitted when they matter."""
+        plan = plan_matrix({"php-version": ["8.2", "8.3"]}, fail_fast=False, max_parallel=1)
+        assert plan.to_strategy() == {
+            "fail-fast": False,
+            "max-parallel": 1,
+            "matrix": {"php-version": ["8.2", "8.3"]},
+        }
+
+        unlimited = plan_matrix({"php-version": ["8.2", "8.3"]}, max_parallel=5)
+        assert unlimited.to_strategy() == {"matrix": {"php-version": ["8.2", "8.3"]}}
+
+    def test_to_yaml(self):
+        """Test rendering the strategy block at a given indentation."""
+        plan = plan_matrix({"python-version": ["3.10", "3.11"]})
+
+        text = plan.to_yaml(indent=4)
+
+        assert text.startswith("    strategy:\n")
+        assert yaml.safe_load(text) == {
+            "strategy": {"matrix": {"python-version": ["3.10", "3.11"]}}
+        }
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"axes": {"os": []}}, "has no values"),
+            ({"axes": {"os": ["a"]}, "exclude": [{"arch": "x64"}]}, "unknown axis: arch"),
+            ({"axes": {"os": ["a"]}, "exclude": [{"os": "a"}]}, "excludes every combination"),
+            ({"axes": {"a": range(20), "b": range(20)}}, f"limit of {MAX_MATRIX_JOBS}"),
+            ({"axes": {"os": ["a", "b"]}, "max_parallel": 0}, "at least 1"),
+        ],
+    )
+    def test_invalid_plans(self, kwargs, message):
+        """Test that impossible matrices are rejected."""
+        with pytest.raises(ValueError, match=message):
+            plan_matrix(**kwargs)
+
+
+class TestApplyMatrix:
+    """Test suite for apply_matrix."""
+
+    AXES = {"python_version": "python-version", "node_version": "node-version"}
+
+    def test_scalars_unchanged(self):
+        """Test that variables without version lists are returned as is."""
+        variables = {"project_name": "api", "python_version": "3.11"}
+
+        assert apply_matrix(variables, self.AXES) is variables
+
+    def test_lists_become_matrix_expressions(self):
+        """Test that version lists are replaced by matrix expressions."""
+        variables = apply_matrix(
+            {
+                "project_name": "api",
+                "python_version": ["3.11", "3.12"],
+                "matrix_exclude": [{"python_version": 3.11}],
+                "matrix_include": [{"python_version": "3.13"}],
+                "max_parallel": "1",
+                "fail_fast": "false",
+            },
+            self.AXES,
+        )
+
+        assert variables["python_version"] == "${{ matrix.python-version }}"
+        assert variables["matrix"].to_strategy() == {
+            "fail-fast": False,
+            "max-parallel": 1,
+            "matrix": {
+                "python-version": ["3.11", "3.12"],
+                "include": [{"python-version": "3.13"}],
+                "exclude": [{"python-version": "3.11"}],
+            },
+        }
+
+    def test_invalid_options(self):
+        """Test that malformed matrix options are rejected."""
+        with pytest.raises(ValueError, match="'matrix_include' must be a list of mappings"):
+            apply_matrix({"node_version": ["18", "20"], "matrix_include": "20"}, self.AXES)
+
+        with pytest.raises(ValueError, match="'max_parallel' must be an integer"):
+            apply_matrix({"node_version": ["18", "20"], "max_parallel": "many"}, self.AXES)
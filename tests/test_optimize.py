@@ -0,0 +1,143 @@
+"""
+Unit tests for the dependency cache optimization pass.
+"""
+
+import pytest
+import yaml
+
+from gha_generator.generator import WorkflowGenerator
+from gha_generator.optimize import CACHE_ACTION, optimize_caching
+
+
+def steps_of(content, job="test"):
+    """Parse a workflow and return the steps of one job."""
+    return yaml.safe_load(content)["jobs"][job]["steps"]
+
+
+def cache_steps(steps):
+    """Return the actions/cache steps of a job."""
+    return [step for step in steps if step.get("uses", "").startswith("actions/cache@")]
+
+
+@pytest.fixture(scope="module")
+def rendered():
+    """Render every bundled template once."""
+    generator = WorkflowGenerator(bytecode_cache=False)
+    variables = {"project_name": "demo"}
+    return {
+        name: generator.render_validated(generator.load_template(name), variables)
+        for name in generator.list_templates()
+    }
+
+
+class TestOptimizeCaching:
+    """Test suite for optimize_caching."""
+
+    @pytest.mark.parametrize(
+        "template, ecosystem, path, lockfile, install",
+        [
+            ("data-science", "pip", "~/.cache/pip", "requirements*.txt", "pip install"),
+            ("django-api", "pip", "~/.cache/pip", "requirements*.txt", "pip install"),
+            ("react-app", "npm", "~/.npm", "package-lock.json", "npm ci"),
+            (
+                "laravel-api",
+                "composer",
+                "${{ steps.composer-cache.outputs.dir }}",
+                "composer.lock",
+                "composer install",
+            ),
+        ],
+    )
+    def test_cache_step_inserted_before_install(
+        self, rendered, template, ecosystem, path, lockfile, install
+    ):
+        """Test that each template gets a lockfile-keyed cache before installing."""
+        steps = steps_of(optimize_caching(rendered[template]))
+
+        (cache,) = cache_steps(steps)
+        assert cache["uses"] == CACHE_ACTION
+        assert cache["with"]["path"] == path
+        assert lockfile in cache["with"]["key"]
+        restore_keys = cache["with"]["restore-keys"].splitlines()
+        assert restore_keys[-1] == f"${{{{ runner.os }}}}-{ecosystem}-"
+
+        first_install = next(i for i, step in enumerate(steps) if install in step.get("run", ""))
+        assert steps.index(cache) < first_install
+
+    def test_setup_cache_option_dropped(self, rendered):
+        """Test that setup-python no longer caches the same directory."""
+        steps = steps_of(optimize_caching(rendered["django-api"]))
+
+        setup = next(
+            step for step in steps if step.get("uses", "").startswith("actions/setup-python")
+        )
+        assert "cache" not in setup["with"]
+
+    def test_key_follows_language_version(self):
+        """Test that the key includes the language version, matrix expressions included."""
+        generator = WorkflowGenerator(bytecode_cache=False)
+        content = generator.render_validated(
+            generator.load_template("django-api"),
+            {"project_name": "demo", "python_version": ["3.11", "3.12"]},
+        )
+
+        (cache,) = cache_steps(steps_of(optimize_caching(content)))
+        assert cache["with"]["key"].startswith("${{ runner.os }}-pip-${{ matrix.python-version }}-")
+
+    def test_idempotent(self, rendered):
+        """Test that optimizing an optimized workflow changes nothing."""
+        for content in rendered.values():
+            optimized = optimize_caching(content)
+            assert optimize_caching(optimized) == optimized
+
+    def test_comments_kept(self, rendered):
+        """Test that the text outside the edited steps is kept as is."""
+        optimized = optimize_caching(rendered["react-app"])
+
+        assert "# Optional: Deploy job" in optimized
+        assert optimized.endswith("\n")
+
+    def test_existing_cache_step_normalized(self):
+        """Test that a hand-written cache step gets the normalized key."""
+        content = (
+            "jobs:\n"
+            "  build:\n"
+            "    runs-on: ubuntu-latest\n"
+            "    steps:\n"
+            "      - name: Restore npm cache\n"
+            "        uses: actions/cache@v3\n"
+            "        with:\n"
+            "          path: ~/.npm\n"
+            "          key: npm\n"
+            "\n"
+            "      - run: npm ci\n"
+        )
+
+        steps = steps_of(optimize_caching(content), job="build")
+
+        assert len(steps) == 2
+        assert steps[0]["name"] == "Restore npm cache"
+        assert steps[0]["uses"] == CACHE_ACTION
+        assert "package-lock.json" in steps[0]["with"]["key"]
+
+    def test_composer_cache_directory_step_added(self):
+        """Test that the Composer cache directory is exposed when missing."""
+        content = "jobs:\n" "  test:\n" "    steps:\n" "      - run: composer install\n"
+
+        steps = steps_of(optimize_caching(content))
+
+        assert steps[0]["id"] == "composer-cache"
+        assert "$GITHUB_OUTPUT" in steps[0]["run"]
+        assert steps[1]["with"]["path"] == "${{ steps.composer-cache.outputs.dir }}"
+        assert steps[2]["run"] == "composer install"
+
+    def test_no_install_unchanged(self):
+        """Test that jobs without package installs are left alone."""
+        content = "jobs:\n  test:\n    steps:\n      - run: make test\n"
+
+        assert optimize_caching(content) == content
+
+    def test_invalid_yaml(self):
+        """Test that malformed input is reported as an invalid workflow."""
+        with pytest.raises(ValueError, match="Generated workflow is invalid"):
+            optimize_caching("jobs: [unclosed\n")
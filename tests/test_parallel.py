@@ -0,0 +1,56 @@
+"""
+Unit tests for parallel batch generation.
+"""
+
+from gha_generator.batch import BatchJob
+from gha_generator.parallel import generate_parallel, resolve_workers
+
+
+class TestParallel:
+    """Test suite for process-pool batch generation."""
+
+    def _jobs(self, tmp_path, count):
+        return [
+            BatchJob(
+                template="data-science" if i % 2 else "react-app",
+                variables={"project_name": f"p{i}", "python_version": "3.11", "node_version": "18"},
+                output=tmp_path / f"repo-{i}",
+            )
+            for i in range(count)
+        ]
+
+    def test_resolve_workers(self):
+        """Test resolving the worker count."""
+        assert resolve_workers(3) == 3
+        assert resolve_workers(0) >= 1
+
+    def test_generate_parallel_single_worker(self, tmp_path):
+        """Test that one worker generates in-process."""
+        results = list(generate_parallel(self._jobs(tmp_path, 3), workers=1))
+
+        assert [r.index for r in results] == [0, 1, 2]
+        assert all(r.success for r in results)
+
+    def test_generate_parallel_preserves_order(self, tmp_path):
+        """Test that pooled results come back in input order."""
+        jobs = self._jobs(tmp_path, 9)
+        jobs[4].template = "unknown"
+
+        results = list(generate_parallel(jobs, workers=2, chunk_size=2))
+
+        assert [r.index for r in results] == list(range(9))
+        assert [r.job.variables["project_name"] for r in results] == [f"p{i}" for i in range(9)]
+        assert results[4].success is False
+        assert sum(r.success for r in results) == 8
+        assert (tmp_path / "repo-8" / "ci.yml").exists()
+
+    def test_generate_parallel_plan(self, tmp_path):
+        """Test that planning across a pool reports without writing."""
+        jobs = self._jobs(tmp_path, 4)
+        list(generate_parallel(jobs[:2], workers=1))
+
+        results = list(generate_parallel(jobs, workers=2, chunk_size=1, plan=True, diff=True))
+
+        assert [r.status for r in results] == ["unchanged", "unchanged", "new", "new"]
+        assert results[3].diff
+        assert not (tmp_path / "repo-3").exists()
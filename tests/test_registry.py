@@ -0,0 +1,174 @@
+"""
+Unit tests for the template registry.
+"""
+
+import os
+import types
+
+import pytest
+
+from gha_generator import registry as registry_module
+from gha_generator.registry import TemplateRegistry, user_template_dirs
+
+
+class FakeEntryPoint:
+    """Minimal stand-in for importlib.metadata.EntryPoint."""
+
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+    def load(self):
+        if isinstance(self.value, Exception):
+            raise self.value
+        return self.value
+
+
+class TestTemplateRegistry:
+    """Test suite for TemplateRegistry."""
+
+    @pytest.fixture
+    def user_dir(self, tmp_path):
+        """Create a user template directory."""
+        directory = tmp_path / "user"
+        directory.mkdir()
+        (directory / "go-service.yml").write_text("name: {{ project_name }}\n")
+        return directory
+
+    @pytest.fixture
+    def index_path(self, tmp_path):
+        """Registry index location."""
+        return tmp_path / "index.json"
+
+    def test_bundled_templates(self, index_path):
+        """Test that bundled templates are listed without the base template."""
+        registry = TemplateRegistry([], index_path=index_path)
+
+        assert registry.names() == ["data-science", "django-api", "laravel-api", "react-app"]
+        assert "base" not in registry
+        assert registry.origin("react-app") == "bundled"
+
+    def test_user_templates(self, user_dir, index_path):
+        """Test that user directories are searched before bundled templates."""
+        (user_dir / "react-app.yml").write_text("name: custom\n")
+
+        registry = TemplateRegistry([user_dir], index_path=index_path)
+
+        assert "go-service" in registry
+        assert registry.origin("go-service") == "user"
+        assert registry.path("react-app") == user_dir / "react-app.yml"
+
+    def test_user_template_dirs_from_environment(self, tmp_path, monkeypatch):
+        """Test reading user template directories from the environment."""
+        monkeypatch.setenv(
+            registry_module.TEMPLATE_PATH_ENV, os.pathsep.join([str(tmp_path / "a"), "", "b"])
+        )
+
+        assert user_template_dirs() == [tmp_path / "a", registry_module.Path("b")]
+
+    def test_index_reused_without_rescanning(self, user_dir, index_path, monkeypatch):
+        """Test that a current index is loaded without discovering packs."""
+        TemplateRegistry([user_dir], index_path=index_path)
+
+        def fail():
+            raise AssertionError("index should have been reused")
+
+        monkeypatch.setattr(registry_module, "discover_template_packs", fail)
+        registry = TemplateRegistry([user_dir], index_path=index_path)
+
+        assert "go-service" in registry
+
+    def test_index_rebuilt_when_directory_changes(self, user_dir, index_path):
+        """Test that adding a template invalidates the index."""
+        TemplateRegistry([user_dir], index_path=index_path)
+
+        new_template = user_dir / "rust-crate.yml"
+        new_template.write_text("name: crate\n")
+        stat = user_dir.stat()
+        os.utime(user_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        registry = TemplateRegistry([user_dir], index_path=index_path)
+
+        assert "rust-crate" in registry
+
+    def test_reload_if_stale(self, user_dir, index_path):
+        """Test that a registry in memory picks up new templates after the TTL."""
+        registry = TemplateRegistry([user_dir], index_path=index_path)
+
+        (user_dir / "rust-crate.yml").write_text("name: crate\n")
+        stat = user_dir.stat()
+        os.utime(user_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        registry.reload_if_stale()
+        assert "rust-crate" not in registry
+
+        registry.reload_if_stale(reload_ttl=0)
+        assert "rust-crate" in registry
+
+    def test_shared_registry_rescanned(self, user_dir, monkeypatch):
+        """Test that get_registry() does not keep a stale registry forever."""
+        clock = [1000.0]
+        monkeypatch.setattr(registry_module.time, "monotonic", lambda: clock[0])
+        assert "rust-crate" not in registry_module.get_registry([user_dir])
+
+        (user_dir / "rust-crate.yml").write_text("name: crate\n")
+        stat = user_dir.stat()
+        os.utime(user_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        clock[0] += registry_module.DEFAULT_RELOAD_TTL
+
+        assert "rust-crate" in registry_module.get_registry([user_dir])
+
+    def test_entry_point_packs(self, tmp_path, index_path, monkeypatch):
+        """Test that packs from entry points are searched after user directories."""
+        pack_dir = tmp_path / "pack"
+        pack_dir.mkdir()
+        (pack_dir / "terraform.yml").write_text("name: tf\n")
+        package = types.SimpleNamespace(__path__=[str(pack_dir)])
+
+        monkeypatch.setattr(
+            "importlib.metadata.entry_points",
+            lambda group: [
+                FakeEntryPoint("broken", ImportError("missing")),
+                FakeEntryPoint("infra", package),
+            ],
+        )
+
+        registry = TemplateRegistry([], index_path=index_path)
+
+        assert registry.search_path == [pack_dir, registry.bundled_dir]
+        assert registry.origin("terraform") == "pack"
+
+    def test_content_hash_follows_edits(self, user_dir, index_path):
+        """Test that content hashes are refreshed when a template changes."""
+        registry = TemplateRegistry([user_dir], index_path=index_path)
+        before = registry.content_hash("go-service")
+
+        (user_dir / "go-service.yml").write_text("name: {{ project_name }} v2\n")
+
+        assert registry.content_hash("go-service") != before
+
+    def test_required_variables(self, user_dir, index_path):
+        """Test extracting and persisting required variables."""
+        (user_dir / "node.yml").write_text(
+            "{% set os = 'ubuntu' %}name: {{ project_name }}\nnode: {{ node_version }} {{ os }}\n"
+        )
+        registry = TemplateRegistry([user_dir], index_path=index_path)
+
+        assert registry.required_variables("node") == ["node_version", "project_name"]
+
+        reloaded = TemplateRegistry([user_dir], index_path=index_path)
+        assert reloaded.templates["node"]["variables"] == ["node_version", "project_name"]
+
+    def test_required_variables_follow_inheritance(self, index_path):
+        """Test that variables from base.yml and partials are reported."""
+        registry = TemplateRegistry([], index_path=index_path)
+
+        assert registry.required_variables("react-app") == ["node_version", "project_name"]
+        assert "partials/checkout" not in registry
+
+    def test_unknown_template(self, index_path):
+        """Test that unknown templates raise ValueError listing alternatives."""
+        registry = TemplateRegistry([], index_path=index_path)
+
+        with pytest.raises(ValueError, match="Available templates: data-science"):
+            registry.path("unknown")
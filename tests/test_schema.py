@@ -0,0 +1,92 @@
+"""
+Unit tests for template variable schemas.
+"""
+
+import pytest
+
+from gha_generator.registry import TemplateRegistry
+from gha_generator.schema import FIELDS, Field, VariableValidator, compile_validator
+
+
+class TestSchema:
+    """Test suite for variable schemas and validators."""
+
+    @pytest.fixture
+    def registry(self, tmp_path):
+        """Registry with a user template directory."""
+        user_dir = tmp_path / "templates"
+        user_dir.mkdir()
+        (user_dir / "go-service.yml").write_text("name: {{ project_name }}\ngo: {{ go_version }}\n")
+        return TemplateRegistry([user_dir], index_path=tmp_path / "index.json")
+
+    def test_bundled_schema(self, registry):
+        """Test that bundled templates only declare the variables they use."""
+        validator = compile_validator("react-app", registry)
+
+        assert validator.names == ["project_name", "node_version"]
+
+    def test_defaults_and_coercion(self, registry):
+        """Test that defaults are applied and integers become strings."""
+        validator = compile_validator("react-app", registry)
+
+        assert validator({"project_name": "web"})["node_version"] == "18"
+        assert validator({"project_name": "web", "node_version": 20})["node_version"] == "20"
+
+    def test_extra_variables_pass_through(self, registry):
+        """Test that variables outside the schema are kept."""
+        validator = compile_validator("data-science", registry)
+
+        variables = validator({"project_name": "ml", "team": "data"})
+
+        assert variables == {"project_name": "ml", "team": "data", "python_version": "3.11"}
+
+    @pytest.mark.parametrize(
+        "variables, message",
+        [
+            ({}, "'project_name' is required"),
+            ({"project_name": "a/b"}, "invalid character: /"),
+            ({"project_name": "ml", "python_version": "2.7"}, "Python 3 version"),
+            ({"project_name": "ml", "python_version": 3.1}, "quote versions in YAML"),
+            ({"project_name": "ml", "python_version": {"v": "3.11"}}, "must be a string"),
+            ({"project_name": "ml", "python_version": ["3.11", "2.7"]}, "got '2.7'"),
+        ],
+    )
+    def test_invalid_variables(self, registry, variables, message):
+        """Test that invalid variables are rejected with a clear message."""
+        validator = compile_validator("data-science", registry)
+
+        with pytest.raises(ValueError, match="Invalid variables for template 'data-science'") as e:
+            validator(variables)
+
+        assert message in str(e.value)
+
+    def test_float_hint_does_not_quote_the_parsed_value(self, registry):
+        """Test that the hint for 3.10 read as a float does not suggest "3.1"."""
+        validator = compile_validator("data-science", registry)
+
+        with pytest.raises(ValueError) as e:
+            validator({"project_name": "ml", "python_version": 3.10})
+
+        assert '"3.1"' not in str(e.value)
+        assert 'e.g. "3.10"' in str(e.value)
+
+    def test_all_errors_reported(self):
+        """Test that every invalid variable is listed."""
+        validator = VariableValidator(
+            "laravel-api", [FIELDS["project_name"], FIELDS["php_version"]]
+        )
+
+        with pytest.raises(ValueError) as e:
+            validator({"php_version": "9"})
+
+        assert "'project_name' is required" in str(e.value)
+        assert "'php_version' must be a PHP version" in str(e.value)
+
+    def test_derived_schema(self, registry):
+        """Test that templates without a schema use the variables they reference."""
+        validator = compile_validator("go-service", registry)
+
+        assert validator.fields == [Field("go_version"), FIELDS["project_name"]]
+        assert validator({"project_name": "api", "go_version": ["1.22"]})
+        with pytest.raises(ValueError, match="'go_version' is required"):
+            validator({"project_name": "api"})
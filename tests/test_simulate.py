@@ -0,0 +1,160 @@
+"""
+Unit tests for the workflow run simulator.
+"""
+
+import json
+
+import pytest
+
+from gha_generator.simulate import JobProfile, load_profile, simulate
+
+
+def job(*needs, **extra):
+    """Build a job with a single step named 'work'."""
+    return {"needs": list(needs), "steps": [{"name": "work", "run": "make"}], **extra}
+
+
+def profile(**seconds):
+    """Profile the 'work' step of each job."""
+    return {name: JobProfile(steps={"work": value}) for name, value in seconds.items()}
+
+
+class TestSimulate:
+    """Test suite for simulate."""
+
+    WORKFLOW = {"jobs": {"lint": job(), "test": job(), "deploy": job("lint", "test")}}
+
+    def test_unlimited_pool_follows_critical_path(self):
+        """Test that with enough runners the run lasts as long as its critical path."""
+        result = simulate(self.WORKFLOW, profile(lint=30, test=300, deploy=60), runners=10)
+
+        assert result.wall_clock == 360
+        assert result.run_durations == [360]
+        assert result.runner_seconds == 390
+        assert result.billable_minutes == 1 + 5 + 1
+        assert result.queue_total == 0
+        assert result.peak_runners == 2
+
+    def test_single_runner_serializes_jobs(self):
+        """Test that jobs wait for the only runner, first come first served."""
+        result = simulate(self.WORKFLOW, profile(lint=30, test=300, deploy=60), runners=1)
+
+        assert result.wall_clock == 390
+        assert result.jobs["test"].wait_max == 30
+        assert result.queue_max == 30
+        assert result.utilization == 1
+
+    def test_matrix_and_max_parallel(self):
+        """Test that matrix instances respect max-parallel."""
+        workflow = {
+            "jobs": {
+                "test": job(strategy={"max-parallel": 2, "matrix": {"python": ["a", "b", "c"]}})
+            }
+        }
+
+        result = simulate(workflow, profile(test=100), runners=10)
+
+        assert result.jobs["test"].instances == 3
+        assert result.wall_clock == 200
+        assert result.peak_runners == 2
+        # Waiting for max-parallel is not queueing for a runner
+        assert result.queue_total == 0
+
+    def test_several_runs_share_the_pool(self):
+        """Test that staggered runs queue behind each other on a small pool."""
+        workflow = {"jobs": {"test": job()}}
+
+        result = simulate(workflow, profile(test=120), runners=1, runs=3, interval=60)
+
+        assert result.wall_clock == 360
+        assert result.run_durations == [120, 180, 240]
+        assert result.queue_total == 60 + 120
+
+    def test_estimates_without_profile(self):
+        """Test that unprofiled jobs use the analyzer's estimates."""
+        result = simulate({"jobs": {"test": {"steps": [{"run": "pytest"}]}}})
+
+        assert result.wall_clock == 120
+
+    @pytest.mark.parametrize(
+        "workflow, message",
+        [
+            ({"jobs": {"a": job("b"), "b": job("a")}}, "cycle"),
+            ({"jobs": {"a": job("missing")}}, "needs unknown job 'missing'"),
+        ],
+    )
+    def test_invalid_graph(self, workflow, message):
+        """Test that graphs GitHub would reject cannot be simulated."""
+        with pytest.raises(ValueError, match=message):
+            simulate(workflow)
+
+    def test_invalid_options(self):
+        """Test that the pool must have a runner."""
+        with pytest.raises(ValueError, match="runners must be at least 1"):
+            simulate(self.WORKFLOW, runners=0)
+
+
+class TestLoadProfile:
+    """Test suite for load_profile."""
+
+    def test_mapping_profile(self, tmp_path):
+        """Test seconds per job and step, with overhead and whole-job durations."""
+        path = tmp_path / "profile.json"
+        path.write_text(json.dumps({"test": {"work": 90, "overhead": 10}, "deploy": 45}))
+
+        profiles = load_profile(path)
+
+        assert profiles["test"] == JobProfile(steps={"work": 90.0}, overhead=10.0)
+        assert profiles["deploy"].duration == 45.0
+
+        result = simulate({"jobs": {"test": job(), "deploy": job("test")}}, profiles, runners=5)
+        assert result.wall_clock == 145
+
+    def test_github_api_profile(self, tmp_path):
+        """Test median step times from several runs of the jobs API."""
+        runs = [
+            {
+                "jobs": [
+                    {
+                        "name": "test (3.11)",
+                        "steps": [
+                            {
+                                "name": "Set up job",
+                                "started_at": "2024-05-01T10:00:00Z",
+                                "completed_at": "2024-05-01T10:00:05Z",
+                            },
+                            {
+                                "name": "Run make",
+                                "started_at": "2024-05-01T10:00:05Z",
+                                "completed_at": f"2024-05-01T10:0{minutes}:05Z",
+                            },
+                            {
+                                "name": "Post Run actions/checkout@v4",
+                                "started_at": "2024-05-01T10:09:00Z",
+                                "completed_at": "2024-05-01T10:09:01Z",
+                            },
+                        ],
+                    }
+                ]
+            }
+            for minutes in (1, 2, 6)
+        ]
+        path = tmp_path / "runs.json"
+        path.write_text(json.dumps(runs))
+
+        profiles = load_profile(path)
+
+        assert profiles["test"].steps == {"Run make": 120.0}
+        assert profiles["test"].overhead == 6.0
+
+        # Unnamed steps are matched by the name GitHub gives them
+        result = simulate({"jobs": {"test": {"steps": [{"run": "make"}]}}}, profiles)
+        assert result.wall_clock == 126
+
+    def test_invalid_profile(self, tmp_path):
+        """Test that malformed profiles are rejected."""
+        path = tmp_path / "profile.json"
+        path.write_text(json.dumps({"test": {"work": "slow"}}))
+
+        with pytest.raises(ValueError, match="must map to seconds"):
+            load_profile(path)
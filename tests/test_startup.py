@@ -0,0 +1,90 @@
+"""
+Startup regression tests for the CLI.
+
+Light commands must not import Jinja2 or PyYAML and must stay within a
+fixed import-time budget, measured with ``python -X importtime``.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Cumulative import time allowed for the CLI, in microseconds
+IMPORT_TIME_BUDGET_US = 150_000
+
+HEAVY_MODULES = ("jinja2", "yaml")
+
+
+def run_with_importtime(
+    *args: str, env: dict[str, str] = None
+) -> tuple[subprocess.CompletedProcess, dict[str, int]]:
+    """
+    Run the CLI under ``-X importtime``.
+
+    Args:
+        *args: CLI arguments
+        env: Extra environment variables
+
+    Returns:
+        Tuple of (completed process, mapping of module name to cumulative
+        import time in microseconds)
+    """
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys; from gha_generator.main import main; sys.argv[0] = 'gha-gen'; main()",
+            *args,
+        ],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        env={**os.environ, **(env or {})},
+    )
+
+    timings = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        timings[name.strip()] = int(cumulative)
+
+    return process, timings
+
+
+@pytest.mark.parametrize("args", [("--version",), ("list-templates",)])
+class TestStartup:
+    """Test suite for CLI startup cost."""
+
+    def test_does_not_import_heavy_modules(self, args):
+        """Test that light commands do not import Jinja2 or PyYAML."""
+        process, timings = run_with_importtime(*args)
+
+        assert process.returncode == 0, process.stderr
+        imported = [name for name in timings if name.split(".")[0] in HEAVY_MODULES]
+        assert imported == []
+
+    def test_import_time_budget(self, args):
+        """Test that importing the CLI stays within the budget."""
+        process, timings = run_with_importtime(*args)
+
+        assert process.returncode == 0, process.stderr
+        assert timings["gha_generator.main"] < IMPORT_TIME_BUDGET_US
+
+
+def test_warm_template_index_skips_pack_discovery(tmp_path):
+    """Test that list-templates does not scan installed packages once indexed."""
+    env = {"GHA_GEN_CACHE_DIR": str(tmp_path)}
+    run_with_importtime("list-templates", env=env)
+
+    process, timings = run_with_importtime("list-templates", env=env)
+
+    assert process.returncode == 0, process.stderr
+    assert "importlib.metadata" not in timings
@@ -4,16 +4,23 @@ Unit tests for utility functions.
 
 from pathlib import Path
 
+import pytest
 import yaml
 
 from gha_generator.utils import (
+    AtomicWriter,
     check_github_folder,
     create_directory_safe,
+    file_has_content,
+    fsync_directory,
     get_template_path,
     get_workflow_filename,
+    hash_file,
     read_yaml_file,
+    unified_diff,
     validate_project_name,
     validate_yaml,
+    write_file_atomic,
     write_yaml_file,
 )
 
@@ -88,6 +95,18 @@ jobs: invalid syntax
         assert is_valid is False
         assert "invalid" in message.lower()
 
+    def test_validate_yaml_structural(self, tmp_path):
+        """Test structural validation of YAML files."""
+        valid_file = tmp_path / "valid.yml"
+        valid_file.write_text("name: Test\non: push\n")
+        invalid_file = tmp_path / "invalid.yml"
+        invalid_file.write_text("name: Test\non: [push\n")
+
+        assert validate_yaml(valid_file, structural=True)[0] is True
+        is_valid, message = validate_yaml(invalid_file, structural=True)
+        assert is_valid is False
+        assert "invalid" in message.lower()
+
     def test_validate_yaml_non_existent_file(self, tmp_path):
         """Test validating non-existent file."""
         yaml_file = tmp_path / "does-not-exist.yml"
@@ -188,3 +207,89 @@ jobs: invalid syntax
         # Note: This will fail if the directory doesn't exist
         # The function doesn't create parent directories
         assert success is False or yaml_file.exists()
+
+    def test_file_has_content(self, tmp_path):
+        """Test comparing a file against expected bytes."""
+        target = tmp_path / "ci.yml"
+        assert file_has_content(target, b"a") is False
+
+        target.write_bytes(b"name: CI\n")
+        assert file_has_content(target, b"name: CI\n") is True
+        assert file_has_content(target, b"name: CD\n") is False
+        assert file_has_content(target, b"name: CI") is False
+
+    def test_write_file_atomic_creates_and_skips(self, tmp_path):
+        """Test that unchanged content is not rewritten."""
+        target = tmp_path / "ci.yml"
+
+        assert write_file_atomic(target, b"name: CI\n") is True
+        assert write_file_atomic(target, b"name: CI\n", fsync=True) is False
+        assert write_file_atomic(target, b"name: CD\n", fsync=True) is True
+        assert target.read_bytes() == b"name: CD\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["ci.yml"]
+
+    def test_write_file_atomic_keeps_permissions(self, tmp_path):
+        """Test that replacing a file keeps its permissions."""
+        target = tmp_path / "ci.yml"
+        target.write_bytes(b"old")
+        target.chmod(0o640)
+
+        write_file_atomic(target, b"new")
+        assert target.stat().st_mode & 0o777 == 0o640
+
+    def test_write_file_atomic_leaves_target_on_failure(self, tmp_path, monkeypatch):
+        """Test that a failed write keeps the previous file intact."""
+        target = tmp_path / "ci.yml"
+        target.write_bytes(b"old")
+
+        def broken_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("os.replace", broken_replace)
+        with pytest.raises(OSError):
+            write_file_atomic(target, b"new content")
+
+        assert target.read_bytes() == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["ci.yml"]
+
+    def test_atomic_writer_commit_and_discard(self, tmp_path):
+        """Test that AtomicWriter only replaces the target on commit."""
+        target = tmp_path / "ci.yml"
+        target.write_bytes(b"old")
+
+        with AtomicWriter(target) as writer:
+            writer.write(b"discarded")
+        assert target.read_bytes() == b"old"
+
+        with AtomicWriter(target) as writer:
+            writer.write(b"name: ")
+            writer.write(b"CI\n")
+            writer.commit()
+
+        assert writer.size == 9
+        assert target.read_bytes() == b"name: CI\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["ci.yml"]
+
+    def test_hash_file(self, tmp_path):
+        """Test hashing a file matches hashing its content."""
+        import hashlib
+
+        target = tmp_path / "ci.yml"
+        target.write_bytes(b"x" * 200_000)
+
+        assert hash_file(target) == hashlib.sha256(b"x" * 200_000).hexdigest()
+
+    def test_unified_diff(self):
+        """Test git-style diff headers for changed and new files."""
+        changed = unified_diff(Path("repo/ci.yml"), b"a\nb\n", b"a\nc")
+
+        assert changed.startswith("--- a/repo/ci.yml\n+++ b/repo/ci.yml\n")
+        assert "-b\n+c\n" in changed
+        assert unified_diff(Path("/abs/ci.yml"), b"", b"x\n").startswith(
+            "--- /dev/null\n+++ b/abs/ci.yml\n"
+        )
+        assert unified_diff(Path("ci.yml"), b"same\n", b"same\n") == ""
+
+    def test_fsync_directory(self, tmp_path):
+        """Test flushing a directory does not raise."""
+        fsync_directory(tmp_path)
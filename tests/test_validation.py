@@ -0,0 +1,194 @@
+"""
+Unit tests for bulk validation.
+"""
+
+import os
+
+from gha_generator import validation
+from gha_generator.validation import (
+    ValidationIndex,
+    find_workflow_files,
+    validate_files,
+    validate_files_incremental,
+)
+
+VALID = "name: CI\non: push\njobs:\n  test:\n    runs-on: ubuntu-latest\n"
+INVALID = "name: CI\non: [push\n"
+
+
+def make_tree(root):
+    """Create a small tree of workflow files."""
+    (root / "a" / ".github" / "workflows").mkdir(parents=True)
+    (root / "b" / ".github" / "workflows").mkdir(parents=True)
+    (root / "top.yml").write_text(VALID)
+    (root / "notes.txt").write_text("not a workflow")
+    (root / "a" / ".github" / "workflows" / "ci.yml").write_text(VALID)
+    (root / "b" / ".github" / "workflows" / "ci.yaml").write_text(INVALID)
+
+
+class TestFindWorkflowFiles:
+    """Test suite for find_workflow_files."""
+
+    def test_directory(self, tmp_path):
+        """Test finding files directly inside a directory."""
+        make_tree(tmp_path)
+        assert find_workflow_files(tmp_path) == [tmp_path / "top.yml"]
+
+    def test_directory_recursive(self, tmp_path):
+        """Test finding files in subdirectories."""
+        make_tree(tmp_path)
+        files = find_workflow_files(tmp_path, recursive=True)
+
+        assert files == sorted(
+            [
+                tmp_path / "top.yml",
+                tmp_path / "a" / ".github" / "workflows" / "ci.yml",
+                tmp_path / "b" / ".github" / "workflows" / "ci.yaml",
+            ]
+        )
+
+    def test_glob(self, tmp_path):
+        """Test finding files from a glob pattern."""
+        make_tree(tmp_path)
+        files = find_workflow_files(str(tmp_path / "*" / ".github" / "workflows" / "*.y*ml"))
+        assert len(files) == 2
+
+    def test_single_file_and_missing_path(self, tmp_path):
+        """Test a single file and a missing path."""
+        make_tree(tmp_path)
+        assert find_workflow_files(tmp_path / "top.yml") == [tmp_path / "top.yml"]
+        assert find_workflow_files(tmp_path / "missing") == []
+
+
+class TestValidateFiles:
+    """Test suite for validate_files."""
+
+    def test_validate_files_serial(self, tmp_path):
+        """Test validating files in-process."""
+        make_tree(tmp_path)
+        files = find_workflow_files(tmp_path, recursive=True)
+
+        results = list(validate_files(files))
+
+        assert [r.path for r in results] == files
+        assert [r.valid for r in results] == [True, False, True]
+
+    def test_validate_files_parallel(self, tmp_path):
+        """Test validating files across a process pool keeps order."""
+        files = []
+        for i in range(7):
+            path = tmp_path / f"w{i}.yml"
+            path.write_text(INVALID if i == 3 else VALID)
+            files.append(path)
+
+        results = list(validate_files(files, workers=2, chunk_size=2, structural=True))
+
+        assert [r.path for r in results] == files
+        assert [r.valid for r in results] == [i != 3 for i in range(7)]
+
+    def test_validate_files_lint(self, tmp_path):
+        """Test that linting fails YAML that is valid but not a valid workflow."""
+        files = [tmp_path / "a.yml", tmp_path / "b.yml"]
+        files[0].write_text(VALID)
+        files[1].write_text(VALID + "    steps:\n      - run: make\n")
+
+        results = list(validate_files(files, workers=2, chunk_size=1, lint=True))
+
+        assert [r.valid for r in results] == [False, True]
+        assert results[0].message == "1 lint error(s)"
+        assert [issue.rule for issue in results[0].issues] == ["missing-key"]
+
+
+class TestIncrementalValidation:
+    """Test suite for the persistent validation index."""
+
+    def _files(self, tmp_path):
+        files = []
+        for i in range(3):
+            path = tmp_path / f"w{i}.yml"
+            path.write_text(INVALID if i == 2 else VALID)
+            os.utime(path, ns=(10**18, 10**18 + i))
+            files.append(path)
+        return files
+
+    def test_unchanged_files_are_not_parsed(self, tmp_path, monkeypatch):
+        """Test that a repeat run reuses every stored result."""
+        files = self._files(tmp_path)
+        index_path = tmp_path / "index.json"
+
+        first = list(validate_files_incremental(files, ValidationIndex(index_path)))
+        assert [r.cached for r in first] == [False, False, False]
+        assert index_path.exists()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file was parsed again")
+
+        monkeypatch.setattr(validation, "validate_yaml", fail)
+        second = list(validate_files_incremental(files, ValidationIndex(index_path)))
+
+        assert [r.cached for r in second] == [True, True, True]
+        assert [r.valid for r in second] == [r.valid for r in first]
+
+    def test_changed_file_is_revalidated(self, tmp_path):
+        """Test that only a modified file is parsed again."""
+        files = self._files(tmp_path)
+        index_path = tmp_path / "index.json"
+        list(validate_files_incremental(files, ValidationIndex(index_path)))
+
+        files[0].write_text(INVALID)
+        results = list(validate_files_incremental(files, ValidationIndex(index_path)))
+
+        assert [r.cached for r in results] == [False, True, True]
+        assert results[0].valid is False
+
+    def test_touched_file_with_same_content_is_cached(self, tmp_path):
+        """Test that a new mtime with identical content reuses the result."""
+        files = self._files(tmp_path)
+        index_path = tmp_path / "index.json"
+        list(validate_files_incremental(files, ValidationIndex(index_path)))
+
+        os.utime(files[1], ns=(10**18, 10**18 + 99))
+        results = list(validate_files_incremental(files, ValidationIndex(index_path)))
+
+        assert results[1].cached is True
+
+    def test_mode_change_revalidates(self, tmp_path):
+        """Test that results from another validation mode are not reused."""
+        files = self._files(tmp_path)
+        index_path = tmp_path / "index.json"
+        list(validate_files_incremental(files, ValidationIndex(index_path)))
+
+        results = list(
+            validate_files_incremental(files, ValidationIndex(index_path), structural=True)
+        )
+        assert not any(r.cached for r in results)
+
+    def test_lint_results_are_cached(self, tmp_path):
+        """Test that lint issues are stored in the index and not mixed with plain results."""
+        files = self._files(tmp_path)
+        index_path = tmp_path / "index.json"
+        list(validate_files_incremental(files, ValidationIndex(index_path)))
+
+        first = list(validate_files_incremental(files, ValidationIndex(index_path), lint=True))
+        second = list(validate_files_incremental(files, ValidationIndex(index_path), lint=True))
+
+        assert not any(r.cached for r in first)
+        assert all(r.cached for r in second)
+        assert [r.valid for r in second] == [False, False, False]
+        assert second[0].issues == first[0].issues
+        assert second[0].issues[0].rule == "missing-key"
+
+    def test_index_ignores_corrupt_file(self, tmp_path):
+        """Test that a corrupt index starts empty."""
+        index_path = tmp_path / "index.json"
+        index_path.write_text("{not json")
+        assert ValidationIndex(index_path).entries == {}
+
+    def test_prune_removed_files(self, tmp_path):
+        """Test that deleted files are dropped from the index."""
+        files = self._files(tmp_path)
+        index_path = tmp_path / "index.json"
+        list(validate_files_incremental(files, ValidationIndex(index_path)))
+
+        list(validate_files_incremental(files[:1], ValidationIndex(index_path)))
+        assert list(ValidationIndex(index_path).entries) == [str(files[0])]
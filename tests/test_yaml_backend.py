@@ -0,0 +1,96 @@
+"""
+Unit tests for YAML backend selection.
+"""
+
+import pytest
+import yaml
+
+from gha_generator import yaml_backend
+from gha_generator.yaml_backend import (
+    check_structure,
+    get_safe_dumper,
+    get_safe_loader,
+    get_yaml_backend,
+    safe_dump,
+    safe_load,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_backend():
+    """Clear the cached backend selection around each test."""
+    yaml_backend.get_yaml_classes.cache_clear()
+    yield
+    yaml_backend.get_yaml_classes.cache_clear()
+
+
+class TestYamlBackend:
+    """Test suite for the YAML loader selector."""
+
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+    def test_uses_libyaml_when_available(self, monkeypatch):
+        """Test that the C loader and dumper are selected."""
+        monkeypatch.delenv("GHA_GEN_YAML_BACKEND", raising=False)
+
+        assert get_safe_loader() is yaml.CSafeLoader
+        assert get_safe_dumper() is yaml.CSafeDumper
+        assert get_yaml_backend() == "libyaml"
+
+    def test_forced_pure_python(self, monkeypatch):
+        """Test forcing the pure-Python backend."""
+        monkeypatch.setenv("GHA_GEN_YAML_BACKEND", "python")
+
+        assert get_safe_loader() is yaml.SafeLoader
+        assert get_safe_dumper() is yaml.SafeDumper
+        assert get_yaml_backend() == "pure-python"
+
+    def test_fallback_without_libyaml(self, monkeypatch):
+        """Test falling back when PyYAML lacks libyaml."""
+        monkeypatch.delenv("GHA_GEN_YAML_BACKEND", raising=False)
+        monkeypatch.setattr(yaml, "__with_libyaml__", False)
+
+        assert get_safe_loader() is yaml.SafeLoader
+        assert get_yaml_backend() == "pure-python"
+
+    def test_safe_load_and_dump_round_trip(self):
+        """Test loading and dumping through the selected backend."""
+        data = {"name": "CI", "jobs": {"test": {"runs-on": "ubuntu-latest"}}}
+        assert safe_load(safe_dump(data)) == data
+
+    def test_safe_load_rejects_python_tags(self):
+        """Test that the selected loader is a safe loader."""
+        with pytest.raises(yaml.YAMLError):
+            safe_load("!!python/object/apply:os.system ['true']")
+
+
+class TestCheckStructure:
+    """Test suite for parse-free structural validation."""
+
+    def test_valid_document(self):
+        """Test that a well-formed document passes."""
+        check_structure("a: &x 1\nb: *x\nc: [1, 2]\n")
+
+    def test_syntax_error(self):
+        """Test that a syntax error is reported."""
+        with pytest.raises(yaml.YAMLError):
+            check_structure("on: [push, pull_request\njobs:\n  test: x\n")
+
+    def test_undefined_alias(self):
+        """Test that an alias without an anchor is reported."""
+        with pytest.raises(yaml.YAMLError, match="undefined alias"):
+            check_structure("a: *missing\n")
+
+    def test_anchors_are_per_document(self):
+        """Test that anchors do not leak across documents."""
+        with pytest.raises(yaml.YAMLError, match="undefined alias"):
+            check_structure("a: &x 1\n---\nb: *x\n")
+
+    def test_does_not_construct_objects(self, monkeypatch):
+        """Test that no Python objects are constructed."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("constructor was used")
+
+        monkeypatch.setattr(yaml, "load", fail)
+        monkeypatch.setattr(yaml, "compose", fail)
+        check_structure("name: CI\njobs: {}\n")